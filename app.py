@@ -25,8 +25,8 @@ trend_service = TrendService(data_dir=DATA_DIR)
 # 루트 경로 - 대시보드
 @app.route('/')
 def index():
-    # 최신 트렌드 데이터 가져오기
-    trends = trend_service.get_trends()
+    # 최신 트렌드 데이터 가져오기 (대시보드에는 기사 6개만 표시)
+    trends = trend_service.get_trends(item_limit=6)
     
     # 데이터가 없는 경우 빈 데이터 사용
     if 'error' in trends:
@@ -68,7 +68,7 @@ def economy_report():
 def weekly_report():
     end_date = request.args.get('end_date', datetime.now().strftime('%Y-%m-%d'))
     
-    # 주간 리포트 데이터 가져오기
+    # 주간 리포트 데이터 가져오기 (날짜별 요약만 사용)
     report = trend_service.get_weekly_report(end_date)
     
     return render_template('weekly.html', report=report)
@@ -140,12 +140,76 @@ def get_economy_report_api():
 @app.route('/api/weekly', methods=['GET'])
 def get_weekly_report_api():
     end_date = request.args.get('end_date', datetime.now().strftime('%Y-%m-%d'))
+    include_raw = request.args.get('include_raw', 'false').lower() == 'true'
     
-    # 주간 리포트 데이터 가져오기
-    report = trend_service.get_weekly_report(end_date)
+    # 주간 리포트 데이터 가져오기 (날짜별 요약, 기사 목록은 include_raw일 때만)
+    report = trend_service.get_weekly_report(end_date, include_raw=include_raw)
     
     return jsonify(report)
 
+# API 라우트 - 기간별 상위 키워드
+@app.route('/api/keywords', methods=['GET'])
+def get_keyword_range_api():
+    end_date = request.args.get('end_date', datetime.now().strftime('%Y-%m-%d'))
+    start_date = request.args.get('start_date', end_date)
+    top_n = request.args.get('top_n', 20, type=int)
+    
+    try:
+        result = trend_service.get_keyword_range(start_date, end_date, top_n=top_n,
+                                                 source=request.args.get('source'),
+                                                 category=request.args.get('category'))
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': "날짜는 YYYY-MM-DD 형식이어야 합니다."
+        }), 400
+    
+    return jsonify(result)
+
+# API 라우트 - 키워드 드릴다운 (키워드를 언급한 기사/블로그)
+@app.route('/api/keyword/<keyword>', methods=['GET'])
+def get_keyword_articles_api(keyword):
+    date_str = request.args.get('date', datetime.now().strftime('%Y-%m-%d'))
+    prefix = request.args.get('prefix', 'false').lower() == 'true'
+    limit = request.args.get('limit', 50, type=int)
+    
+    result = trend_service.get_keyword_articles(keyword, date_str, prefix=prefix, limit=limit)
+    
+    # 데이터가 없거나 검색할 수 없는 키워드인 경우 오류 반환
+    if 'error' in result:
+        return jsonify({
+            'success': False,
+            'message': result['error']
+        }), 404
+    
+    return jsonify(result)
+
+# API 라우트 - 기사/블로그 전문 검색
+@app.route('/api/search', methods=['GET'])
+def search_api():
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({
+            'success': False,
+            'message': "검색어(q)를 입력해주세요."
+        }), 400
+    
+    result = trend_service.search(query,
+                                  date_from=request.args.get('from'),
+                                  date_to=request.args.get('to'),
+                                  source=request.args.get('source'),
+                                  category=request.args.get('category'),
+                                  page=request.args.get('page', 1, type=int),
+                                  per_page=request.args.get('per_page', 20, type=int))
+    
+    if 'error' in result:
+        return jsonify({
+            'success': False,
+            'message': result['error']
+        }), 404
+    
+    return jsonify(result)
+
 # API 라우트 - 데이터 수집
 @app.route('/api/collect', methods=['POST'])
 def collect_data_api():
@@ -0,0 +1,130 @@
+"""
+키워드 집계 백엔드 벤치마크
+
+같은 합성 기사(기본 10만 건)에 대해 리포트가 필요로 하는 집계
+(전체, 카테고리 x 키워드, 소스 x 키워드, 날짜 x 키워드, 경제 기사 부분 집합)를
+사전 누적(KeywordCounter로 집계마다 기사 전체를 다시 훑음)과
+희소 행렬(TermMatrix를 한 번 만든 뒤 행렬 연산으로 집계) 방식으로 비교하고 결과가 동일한지 확인합니다.
+두 방식 모두 수집 직후처럼 토큰 캐시가 채워진 상태에서 측정합니다.
+
+사용법:
+    python -m benchmarks.bench_analytics
+    python -m benchmarks.bench_analytics --articles 100000 --days 7 --repeat 3
+"""
+import argparse
+import json
+import sys
+import time
+
+from src.utils import KeywordEngine, TokenCache, TermMatrix
+from src.utils.term_matrix import HAS_SCIPY
+from benchmarks.synthetic import SyntheticCorpus
+
+CATEGORIES = ['정치', '경제', '사회', '생활/문화', 'IT/과학', '세계', '국제', '스포츠']
+SOURCES = ['naver', 'daum']
+
+
+def make_articles(count, days, seed):
+    corpus = SyntheticCorpus(seed)
+    return [
+        {
+            'title': corpus.sentence(5, 10),
+            'summary': corpus.sentence(12, 24),
+            'category': CATEGORIES[index % len(CATEGORIES)],
+            'source': SOURCES[index % len(SOURCES)],
+            'day': f'2024-01-{index * days // count + 1:02d}'
+        }
+        for index in range(count)
+    ]
+
+
+def dict_analytics(engine, texts, articles, economy_rows, top_n):
+    by_category = engine.count_by_group(zip((news['category'] for news in articles), texts))
+    by_source = engine.count_by_group(zip((news['source'] for news in articles), texts))
+    by_day = engine.count_by_group(zip((news['day'] for news in articles), texts))
+    
+    economy = engine.counter()
+    for row in economy_rows:
+        economy.add(texts[row])
+    
+    return {
+        'overall': by_category.top(top_n),
+        'category': by_category.top_by_group(10),
+        'source': by_source.top_by_group(10),
+        'day': by_day.top_by_group(10),
+        'economy': economy.top(top_n)
+    }
+
+
+def matrix_reductions(matrix, economy_rows, top_n):
+    return {
+        'overall': matrix.top(top_n),
+        'category': matrix.top_by('category', 10),
+        'source': matrix.top_by('source', 10),
+        'day': matrix.top_by('day', 10),
+        'economy': matrix.top(top_n, economy_rows)
+    }
+
+
+def build_matrix(engine, texts, articles):
+    labels = {label: [news[label] for news in articles] for label in ('category', 'source', 'day')}
+    return TermMatrix.build(engine, texts, labels)
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='키워드 집계 백엔드 벤치마크')
+    parser.add_argument('--articles', type=int, default=100000, help='합성 기사 수')
+    parser.add_argument('--days', type=int, default=7, help='기사를 나눌 날짜 수')
+    parser.add_argument('--top-n', type=int, default=20, help='전체 상위 키워드 수')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 난수 시드')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+    args = parser.parse_args(argv)
+    
+    if not HAS_SCIPY:
+        print("numpy와 scipy가 필요합니다.", file=sys.stderr)
+        return 1
+    
+    articles = make_articles(args.articles, args.days, args.seed)
+    texts = [news['title'] + " " + news['summary'] for news in articles]
+    economy_rows = [row for row, news in enumerate(articles) if news['category'] == '경제' or '경제' in news['title']]
+    
+    # 수집 직후처럼 모든 기사의 단어 빈도를 캐시에 채워 둠
+    engine = KeywordEngine(token_cache=TokenCache(max_entries=args.articles))
+    start = time.perf_counter()
+    engine.document_tokens_many(texts)
+    tokenize_seconds = time.perf_counter() - start
+    
+    dict_seconds, dict_result = best_of(args.repeat, dict_analytics, engine, texts, articles, economy_rows, args.top_n)
+    build_seconds, matrix = best_of(args.repeat, build_matrix, engine, texts, articles)
+    reduce_seconds, matrix_result = best_of(args.repeat, matrix_reductions, matrix, economy_rows, args.top_n)
+    
+    result = {
+        'config': vars(args),
+        'matrix_shape': list(matrix.matrix.shape),
+        'matrix_nnz': int(matrix.matrix.nnz),
+        'tokenize_seconds': round(tokenize_seconds, 4),
+        'dict_seconds': round(dict_seconds, 4),
+        'matrix_build_seconds': round(build_seconds, 4),
+        'matrix_reduce_seconds': round(reduce_seconds, 4),
+        'speedup_including_build': round(dict_seconds / (build_seconds + reduce_seconds), 2),
+        'speedup_reductions_only': round(dict_seconds / reduce_seconds, 2),
+        'identical': dict_result == matrix_result
+    }
+    
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    
+    return 0 if result['identical'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
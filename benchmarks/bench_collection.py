@@ -0,0 +1,279 @@
+"""
+수집 파이프라인 종단 간 벤치마크
+
+녹화된(또는 합성한) 픽스처를 재생 모드로 사용해 네트워크 없이 collect_trends 전체를 실행하고,
+크롤러별 페이지 처리량과 파싱/키워드 추출 시간, 저장 단계별(저장소, 키워드 통계, 색인, 아카이브, 요약) 소요 시간을 JSON으로 출력합니다.
+
+사용법:
+    python -m benchmarks.bench_collection
+    python -m benchmarks.bench_collection --fixtures data/fixtures.jsonl.gz --repeat 3
+    python -m benchmarks.bench_collection --extra-categories 10 --pages 3 --keywords 20 --output before.json
+    python -m benchmarks.bench_collection --storage-backend json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from functools import wraps
+
+from src.services.storage import STORAGE_BACKENDS
+from src.services.trend_service import TrendService
+from src.utils import KeywordEngine
+from benchmarks.synthetic import VOCABULARY, add_synthetic_categories, build_archive
+
+CRAWLERS = {
+    'naver_news': ('naver', 'naver_news_crawler'),
+    'daum_news': ('daum', 'daum_news_crawler'),
+    'naver_blog': ('naver', 'naver_blog_crawler'),
+    'daum_blog': ('daum', 'daum_blog_crawler'),
+}
+
+# collect_trends(save=True)의 저장 단계: {단계 이름: [(객체 속성 경로, 메서드 이름), ...]}
+# (객체 속성 경로가 None이면 서비스 자신의 메서드)
+SAVE_STAGES = {
+    'storage': [(None, '_save_trends'), ('storage', 'update_summary')],
+    'keyword_stats': [(None, '_update_keyword_stats'), ('keyword_stats', 'save')],
+    'seen_index': [('seen_index', 'add_all'), ('seen_index', 'save')],
+    'duplicate_index': [('duplicate_index', 'save')],
+    'page_planner': [('page_planner', 'record'), ('page_planner', 'save')],
+    'keyword_index': [(None, '_save_keyword_index')],
+    'search_index': [('search_index', 'ingest_day')],
+    'archive': [('archive', 'write_day')],
+    'rollup': [(None, '_save_rollup')],
+    'token_cache': [('token_cache', 'save')],
+}
+
+
+class PhaseTimer:
+    """여러 스레드에서 호출되는 단계의 호출 횟수와 누적 시간, 활성 구간을 기록하는 클래스"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.seconds = 0.0
+        self.first_start = None
+        self.last_end = None
+    
+    def wrap(self, func):
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                with self.lock:
+                    self.calls += 1
+                    self.seconds += end - start
+                    if self.first_start is None or start < self.first_start:
+                        self.first_start = start
+                    if self.last_end is None or end > self.last_end:
+                        self.last_end = end
+        return timed
+    
+    @property
+    def active_seconds(self):
+        if self.first_start is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+
+def _instrument_save_stages(service):
+    """
+    저장 단계의 메서드를 계측합니다. (꺼져 있는 단계는 건너뜀)
+    
+    Returns:
+        dict: {단계 이름: PhaseTimer}
+    """
+    timers = {}
+    for stage, methods in SAVE_STAGES.items():
+        for attribute, name in methods:
+            target = service if attribute is None else getattr(service, attribute)
+            if target is None:
+                continue
+            timer = timers.setdefault(stage, PhaseTimer())
+            setattr(target, name, timer.wrap(getattr(target, name)))
+    return timers
+
+
+class TimedHttpClient:
+    """크롤러의 HTTP 클라이언트를 감싸 페이지 수집과 파싱 시간을 따로 측정하는 프록시"""
+    
+    def __init__(self, client):
+        self.client = client
+        self.fetch = PhaseTimer()
+        self.parse = PhaseTimer()
+        self.get_page = self.fetch.wrap(client.get_page)
+        self.parse_page = self.parse.wrap(client.parse_page)
+    
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+def _git_revision():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _prepare_fixtures(args, work_dir):
+    """픽스처 경로를 결정하고, 지정되지 않았다면 합성 아카이브를 생성합니다."""
+    if args.fixtures:
+        return args.fixtures, None
+    
+    # 합성 카테고리를 포함한 카테고리 목록을 얻기 위해 임시 서비스를 만듦
+    probe = TrendService(data_dir=os.path.join(work_dir, 'probe'), use_http_cache=False)
+    add_synthetic_categories(probe, args.extra_categories)
+    # 키워드가 0개면 수집된 상위 키워드로 블로그를 검색 (합성 아카이브에는 해당 페이지가 없음)
+    keywords = VOCABULARY[:args.keywords] or None
+    
+    path = os.path.join(work_dir, 'synthetic_fixtures.jsonl.gz')
+    build_archive(
+        path,
+        probe.naver_news_crawler.categories,
+        probe.daum_news_crawler.categories,
+        pages=args.pages,
+        keywords=keywords,
+        news_items=args.items,
+        seed=args.seed
+    )
+    return path, keywords
+
+
+def run_once(args, fixture_path, keywords, run_dir):
+    """collect_trends를 한 번 실행하고 측정 결과를 반환합니다."""
+    service = TrendService(
+        data_dir=run_dir,
+        use_http_cache=False,
+        pages_per_category=args.pages,
+        max_workers=args.max_workers,
+        max_concurrency=args.max_concurrency,
+        parser_backend=args.parser,
+        fixture_path=fixture_path,
+        fixture_mode='replay',
+        storage_backend=args.storage_backend
+    )
+    add_synthetic_categories(service, args.extra_categories)
+    
+    # 단계별 계측 설치
+    clients = {}
+    for name, (_, attribute) in CRAWLERS.items():
+        crawler = getattr(service, attribute)
+        clients[name] = crawler.http = TimedHttpClient(crawler.http)
+    
+    # 공유 기본 엔진 대신 실행마다 새 엔진을 계측 (토큰화와 상위 키워드 선택)
+    keyword_timer = PhaseTimer()
+    engine = KeywordEngine()
+    engine.tokenize = keyword_timer.wrap(engine.tokenize)
+    engine.tokenize_many = keyword_timer.wrap(engine.tokenize_many)
+    engine.top = keyword_timer.wrap(engine.top)
+    service.keyword_engine = engine
+    for attribute in ('naver_news_crawler', 'daum_news_crawler'):
+        getattr(service, attribute).keyword_engine = engine
+    
+    save_timers = _instrument_save_stages(service)
+    
+    # 수집 과정의 진행 메시지가 JSON 출력에 섞이지 않도록 표준 오류로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        start = time.perf_counter()
+        trend_data = service.collect_trends(keywords=keywords)
+        total = time.perf_counter() - start
+    
+    crawlers = {}
+    sources = {}
+    for name, client in clients.items():
+        pages = client.fetch.calls
+        active = client.fetch.active_seconds
+        crawlers[name] = {
+            'pages': pages,
+            'fetch_seconds': round(client.fetch.seconds, 4),
+            'parse_seconds': round(client.parse.seconds, 4),
+            'active_seconds': round(active, 4),
+            'pages_per_second': round(pages / active, 2) if active else None,
+            'parse_ms_per_page': round(client.parse.seconds * 1000 / pages, 3) if pages else None
+        }
+        
+        source = sources.setdefault(CRAWLERS[name][0], {'pages': 0, 'fetch_seconds': 0.0, 'parse_seconds': 0.0})
+        source['pages'] += pages
+        source['fetch_seconds'] = round(source['fetch_seconds'] + client.fetch.seconds, 4)
+        source['parse_seconds'] = round(source['parse_seconds'] + client.parse.seconds, 4)
+    
+    replay = service.replay_adapter
+    return {
+        'collect_trends_seconds': round(total, 4),
+        'keyword_extraction': {
+            'calls': keyword_timer.calls,
+            'seconds': round(keyword_timer.seconds, 4)
+        },
+        'save': {
+            'storage_backend': args.storage_backend,
+            'storage_save_seconds': round(save_timers['storage'].seconds, 4),
+            'save_seconds': round(sum(timer.seconds for timer in save_timers.values()), 4),
+            'stages': {stage: round(timer.seconds, 4) for stage, timer in save_timers.items()}
+        },
+        'crawlers': crawlers,
+        'sources': sources,
+        'fixtures': {'hits': replay.hits, 'misses': replay.misses},
+        'items': {
+            'news': len(trend_data['news_trends']['news_data']),
+            'blogs': len(trend_data['blog_trends']['all_blogs'])
+        }
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='오프라인 수집 파이프라인 벤치마크')
+    parser.add_argument('--fixtures', help='재생할 픽스처 아카이브 경로 (기본값: 합성 아카이브 생성)')
+    parser.add_argument('--extra-categories', type=int, default=0, help='뉴스 크롤러에 추가할 합성 카테고리 수')
+    parser.add_argument('--pages', type=int, default=2, help='카테고리별 뉴스 페이지 수')
+    parser.add_argument('--keywords', type=int, default=5,
+                        help='블로그 검색 키워드 수 (0이면 수집된 상위 키워드 사용)')
+    parser.add_argument('--items', type=int, default=20, help='합성 네이버 뉴스 페이지당 기사 수')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 난수 시드')
+    parser.add_argument('--max-workers', type=int, default=4, help='크롤러별 최대 작업자 수')
+    parser.add_argument('--max-concurrency', type=int, default=8, help='전역 동시 요청 수')
+    parser.add_argument('--parser', choices=['bs4', 'lxml'], help='HTML 파서 백엔드')
+    parser.add_argument('--storage-backend', choices=STORAGE_BACKENDS, default='sqlite', help='트렌드 데이터 저장소')
+    parser.add_argument('--repeat', type=int, default=1, help='반복 실행 횟수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로 (기본값: 표준 출력)')
+    args = parser.parse_args(argv)
+    
+    with tempfile.TemporaryDirectory(prefix='bench_collection_') as work_dir:
+        fixture_path, keywords = _prepare_fixtures(args, work_dir)
+        
+        runs = [
+            run_once(args, fixture_path, keywords, os.path.join(work_dir, f'run{index}'))
+            for index in range(args.repeat)
+        ]
+    
+    totals = [run['collect_trends_seconds'] for run in runs]
+    result = {
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'config': {key: value for key, value in vars(args).items() if key != 'output'},
+        'summary': {
+            'collect_trends_seconds_min': min(totals),
+            'collect_trends_seconds_median': round(statistics.median(totals), 4)
+        },
+        'runs': runs
+    }
+    
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+키워드 추출 마이크로 벤치마크
+
+기존 방식(매번 re.sub 두 번, 리스트 불용어, 수동 사전 집계, 전체 정렬, 카테고리마다 전체 기사 재탐색)과
+KeywordEngine(컴파일된 패턴, 집합 불용어, Counter, 부분 상위 k 선택, 한 번의 그룹별 집계)을
+같은 합성 기사로 비교하고 결과가 동일한지 확인합니다.
+
+사용법:
+    python -m benchmarks.bench_keywords
+    python -m benchmarks.bench_keywords --articles 20000 --categories 12 --repeat 5
+"""
+import argparse
+import json
+import re
+import sys
+import time
+
+from src.utils import KeywordEngine
+from benchmarks.synthetic import SyntheticCorpus
+
+
+def legacy_extract_keywords(text, top_n=10):
+    """기존 크롤러/서비스에 복사되어 있던 키워드 추출 구현"""
+    stopwords = ['있다', '하다', '이다', '되다', '않다', '그', '및', '등', '를', '을', '이', '가', '의', '에', '로', '으로']
+    
+    clean_text = re.sub(r'[^\w\s]', '', text)
+    clean_text = re.sub(r'\d+', '', clean_text)
+    
+    words = clean_text.split()
+    filtered_words = [word for word in words if word not in stopwords and len(word) > 1]
+    
+    word_freq = {}
+    for word in filtered_words:
+        if word in word_freq:
+            word_freq[word] += 1
+        else:
+            word_freq[word] = 1
+    
+    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+    
+    return [word for word, freq in sorted_words[:top_n]]
+
+
+def legacy_trends(articles, categories, top_n):
+    all_text = ""
+    for news in articles:
+        all_text += news['title'] + " " + news['summary'] + " "
+    
+    overall = legacy_extract_keywords(all_text, top_n)
+    
+    by_category = {}
+    for category in categories:
+        category_news = [news for news in articles if news['category'] == category]
+        category_text = " ".join([news['title'] + " " + news['summary'] for news in category_news])
+        by_category[category] = legacy_extract_keywords(category_text, top_n=10)
+    
+    return overall, by_category
+
+
+def engine_trends(engine, articles, categories, top_n):
+    word_freq = engine.count_by_group(
+        ((news['category'], news['title'] + " " + news['summary']) for news in articles),
+        categories
+    )
+    return word_freq.top(top_n), word_freq.top_by_group(10)
+
+
+def make_articles(count, categories, seed):
+    corpus = SyntheticCorpus(seed)
+    return [
+        {
+            'title': corpus.sentence(5, 10) + f" ({corpus.random.randint(1, 99)}일)",
+            'summary': corpus.sentence(12, 24) + "...",
+            'category': categories[index % len(categories)]
+        }
+        for index in range(count)
+    ]
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='키워드 추출 마이크로 벤치마크')
+    parser.add_argument('--articles', type=int, default=5000, help='합성 기사 수')
+    parser.add_argument('--categories', type=int, default=6, help='카테고리 수')
+    parser.add_argument('--top-n', type=int, default=20, help='전체 상위 키워드 수')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 난수 시드')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+    args = parser.parse_args(argv)
+    
+    categories = [f'카테고리{index + 1}' for index in range(args.categories)]
+    articles = make_articles(args.articles, categories, args.seed)
+    text = " ".join(news['title'] + " " + news['summary'] for news in articles)
+    engine = KeywordEngine()
+    
+    legacy_single, legacy_result = best_of(args.repeat, legacy_extract_keywords, text, args.top_n)
+    engine_single, engine_result = best_of(args.repeat, engine.extract, text, args.top_n)
+    
+    legacy_grouped, legacy_groups = best_of(args.repeat, legacy_trends, articles, categories, args.top_n)
+    engine_grouped, engine_groups = best_of(args.repeat, engine_trends, engine, articles, categories, args.top_n)
+    
+    result = {
+        'config': vars(args),
+        'extract': {
+            'legacy_seconds': round(legacy_single, 4),
+            'engine_seconds': round(engine_single, 4),
+            'speedup': round(legacy_single / engine_single, 2),
+            'identical': legacy_result == engine_result
+        },
+        'overall_and_by_category': {
+            'legacy_seconds': round(legacy_grouped, 4),
+            'engine_seconds': round(engine_grouped, 4),
+            'speedup': round(legacy_grouped / engine_grouped, 2),
+            'identical': legacy_groups == engine_groups
+        }
+    }
+    
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    
+    if not (result['extract']['identical'] and result['overall_and_by_category']['identical']):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+경제 분류 다중 패턴 탐색 마이크로 벤치마크
+
+기존 방식(어휘마다 부분 문자열 탐색)과 Aho-Corasick 자동자로 제목에서 일치하는 어휘를 모두 찾는 시간을
+어휘 사전 크기별로 비교합니다. 자동자는 어휘 수와 관계없이 제목 길이에 비례하는 시간이 걸립니다.
+
+사용법:
+    python -m benchmarks.bench_matcher
+    python -m benchmarks.bench_matcher --titles 20000 --lexicon-sizes 45 200 1000
+"""
+import argparse
+import itertools
+import json
+import sys
+import time
+
+from src.services.trend_service import TrendService
+from src.utils import AhoCorasick
+from benchmarks.synthetic import VOCABULARY, SyntheticCorpus
+
+
+def make_lexicon(size):
+    """기본 경제 어휘에 합성 복합어를 더해 원하는 크기의 어휘 사전을 만듭니다."""
+    lexicon = list(dict.fromkeys(TrendService.ECONOMY_KEYWORDS))
+    for first, second in itertools.product(VOCABULARY, repeat=2):
+        if len(lexicon) >= size:
+            break
+        if first != second:
+            lexicon.append(first + second)
+    return lexicon[:size]
+
+
+def time_per_title(func, titles, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [func(title) for title in titles]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6 / len(titles), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='다중 패턴 탐색 마이크로 벤치마크')
+    parser.add_argument('--titles', type=int, default=5000, help='합성 제목 수')
+    parser.add_argument('--lexicon-sizes', type=int, nargs='+', default=[45, 200, 1000], help='비교할 어휘 사전 크기')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 난수 시드')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+    args = parser.parse_args(argv)
+    
+    corpus = SyntheticCorpus(args.seed)
+    titles = [corpus.sentence(5, 10) for _ in range(args.titles)]
+    
+    results = []
+    for size in args.lexicon_sizes:
+        lexicon = make_lexicon(size)
+        automaton = AhoCorasick(lexicon)
+        
+        scan_us, scan_result = time_per_title(lambda title: [term for term in lexicon if term in title], titles, args.repeat)
+        automaton_us, automaton_result = time_per_title(automaton.find, titles, args.repeat)
+        
+        results.append({
+            'lexicon_size': len(lexicon),
+            'substring_scan_us_per_title': round(scan_us, 2),
+            'aho_corasick_us_per_title': round(automaton_us, 2),
+            'speedup': round(scan_us / automaton_us, 2),
+            'identical': [set(terms) for terms in scan_result] == [set(terms) for terms in automaton_result]
+        })
+    
+    print(json.dumps({'config': vars(args), 'results': results}, ensure_ascii=False, indent=2))
+    
+    return 0 if all(result['identical'] for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
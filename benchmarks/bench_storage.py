@@ -0,0 +1,134 @@
+"""
+날짜 파일 압축 방식 벤치마크
+
+같은 합성 하루치 트렌드 데이터(기본 기사 5,000건, 블로그 1,000건)를
+압축하지 않은 JSON 파일, gzip/zstd로 압축한 JSON Lines 파일로 저장하고
+파일 크기, 저장 시간, 전체 읽기 시간, 앞부분만 읽기(item_limit) 시간,
+기사를 하나씩 읽을 때의 시간과 최대 메모리 사용량을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_storage
+    python -m benchmarks.bench_storage --articles 20000 --blogs 2000 --repeat 5
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.services.storage import HAS_ZSTD, JsonStorage
+from benchmarks.synthetic import SyntheticCorpus
+
+CATEGORIES = ['정치', '경제', '사회', '생활/문화', 'IT/과학', '세계']
+SOURCES = ['naver', 'daum']
+DATE = '2024-01-01'
+
+
+def make_trend_data(articles, blogs, seed):
+    corpus = SyntheticCorpus(seed)
+    news_data = [
+        {
+            'title': corpus.sentence(5, 10),
+            'url': f'https://news.example.com/article/{corpus.next_id()}',
+            'press': corpus.press(),
+            'summary': corpus.sentence(12, 24),
+            'category': CATEGORIES[index % len(CATEGORIES)],
+            'source': SOURCES[index % len(SOURCES)],
+            'date': '2024-01-01 09:00'
+        }
+        for index in range(articles)
+    ]
+    all_blogs = [
+        {
+            'title': corpus.sentence(4, 8),
+            'url': f'https://blog.example.com/post/{corpus.next_id()}',
+            'author': f'blogger{index % 100}',
+            'summary': corpus.sentence(12, 24),
+            'keyword': '경제',
+            'source': SOURCES[index % len(SOURCES)],
+            'date': '2024-01-01'
+        }
+        for index in range(blogs)
+    ]
+    return {
+        'collection_time': '2024-01-01 10:00:00',
+        'news_trends': {'news_data': news_data, 'by_category': {}, 'overall': []},
+        'blog_trends': {'all_blogs': all_blogs},
+        'top_keywords': []
+    }
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def count_streamed(storage):
+    return sum(1 for _ in storage.iter_items(DATE))
+
+
+def peak_memory(func, *args):
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='날짜 파일 압축 방식 벤치마크')
+    parser.add_argument('--articles', type=int, default=5000, help='합성 기사 수')
+    parser.add_argument('--blogs', type=int, default=1000, help='합성 블로그 수')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 난수 시드')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+    args = parser.parse_args(argv)
+    
+    trend_data = make_trend_data(args.articles, args.blogs, args.seed)
+    compressions = [None, 'gzip'] + (['zstd'] if HAS_ZSTD else [])
+    
+    formats = {}
+    with tempfile.TemporaryDirectory() as data_dir:
+        for compression in compressions:
+            storage = JsonStorage(f"{data_dir}/{compression or 'json'}", compression)
+            storage.data_dir.mkdir()
+            
+            save_seconds, _ = best_of(args.repeat, storage.save, DATE, trend_data)
+            load_seconds, loaded = best_of(args.repeat, storage.load, DATE)
+            head_seconds, _ = best_of(args.repeat, storage.load, DATE, 6)
+            stream_seconds, streamed = best_of(args.repeat, count_streamed, storage)
+            
+            formats[compression or 'json'] = {
+                'bytes': storage.path(DATE).stat().st_size,
+                'save_seconds': round(save_seconds, 4),
+                'load_seconds': round(load_seconds, 4),
+                'load_first_6_seconds': round(head_seconds, 4),
+                'stream_news_seconds': round(stream_seconds, 4),
+                'load_peak_bytes': peak_memory(storage.load, DATE),
+                'stream_peak_bytes': peak_memory(count_streamed, storage),
+                'identical': loaded == trend_data and streamed == args.articles
+            }
+    
+    json_bytes = formats['json']['bytes']
+    for stats in formats.values():
+        stats['compression_ratio'] = round(json_bytes / stats['bytes'], 2)
+    
+    result = {
+        'config': vars(args),
+        'formats': formats,
+        'zstd_available': HAS_ZSTD
+    }
+    
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    
+    return 0 if all(stats['identical'] for stats in formats.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+벤치마크용 합성 픽스처 생성기
+
+네이버/다음 뉴스 목록 및 블로그 검색 페이지와 같은 구조의 HTML을 생성하여
+FixtureArchive로 저장합니다. 실제 녹화본이 없어도 오프라인으로 수집 과정을 재현할 수 있습니다.
+"""
+import random
+from datetime import datetime
+
+import requests
+
+from src.utils import FixtureArchive
+
+# 합성 기사 제목/요약에 사용할 어휘 (앞쪽 단어일수록 자주 등장)
+VOCABULARY = [
+    '정부', '대통령', '경제', '금리', '환율', '물가', '주식', '시장', '기업', '투자',
+    '삼성전자', '반도체', '수출', '무역', '부동산', '아파트', '서울', '국회', '여당', '야당',
+    '선거', '정책', '예산', '세금', '고용', '일자리', '청년', '교육', '학교', '의료',
+    '병원', '코로나', '백신', '기후', '환경', '에너지', '전기차', '배터리', '인공지능', '데이터',
+    '플랫폼', '스타트업', '게임', '영화', '음악', '드라마', '축구', '야구', '올림픽', '대표팀',
+    '미국', '중국', '일본', '유럽', '러시아', '우크라이나', '북한', '외교', '안보', '국방',
+    '법원', '검찰', '경찰', '사건', '사고', '재판', '수사', '판결', '조사', '발표',
+    '상승', '하락', '급등', '급락', '회복', '위기', '전망', '분석', '계획', '협상',
+    '중앙은행', '기준금리', '인플레이션', '성장률', '국내총생산', '소비', '생산', '산업', '제조업', '서비스'
+]
+PARTICLES = ['', '', '', '가', '이', '는', '은', '를', '을', '의', '에', '도']
+PRESS = ['연합뉴스', '뉴시스', '뉴스1', 'KBS', 'MBC', 'SBS', '조선일보', '중앙일보', '동아일보', '한겨레', '경향신문', '매일경제']
+
+
+class SyntheticCorpus:
+    """Zipf 분포에 가까운 빈도로 어휘를 뽑아 합성 문장을 만드는 클래스"""
+    
+    def __init__(self, seed=42):
+        self.random = random.Random(seed)
+        self.weights = [1.0 / (rank + 1) for rank in range(len(VOCABULARY))]
+        self.counter = 0
+    
+    def sentence(self, min_words, max_words):
+        count = self.random.randint(min_words, max_words)
+        words = self.random.choices(VOCABULARY, weights=self.weights, k=count)
+        return ' '.join(word + self.random.choice(PARTICLES) for word in words)
+    
+    def next_id(self):
+        self.counter += 1
+        return self.counter
+    
+    def press(self):
+        return self.random.choice(PRESS)
+
+
+def _prepared_url(url):
+    # requests가 실제로 보내는 형태(퍼센트 인코딩)로 URL을 맞춤
+    return requests.Request('GET', url).prepare().url
+
+
+def naver_news_page(corpus, items):
+    rows = []
+    for index in range(items):
+        article_id = corpus.next_id()
+        list_class = 'type06_headline' if index < items // 2 else 'type06'
+        rows.append((list_class, f'''<li><dl>
+<dt><a href="https://n.news.naver.com/article/{article_id}">{corpus.sentence(5, 10)}</a></dt>
+<dd><span class="lede">{corpus.sentence(12, 24)}</span><span class="writing">{corpus.press()}</span><span class="date">{corpus.random.randint(1, 59)}분전</span></dd>
+</dl></li>'''))
+    headline = ''.join(row for list_class, row in rows if list_class == 'type06_headline')
+    rest = ''.join(row for list_class, row in rows if list_class == 'type06')
+    return f'''<html><head><meta charset="utf-8"><title>네이버 뉴스</title></head><body>
+<div id="main_content"><div class="list_body newsflash_body">
+<ul class="type06_headline">{headline}</ul>
+<ul class="type06">{rest}</ul>
+</div></div></body></html>'''
+
+
+def daum_news_page(corpus, items):
+    rows = []
+    for _ in range(items):
+        article_id = corpus.next_id()
+        rows.append(f'''<li><div class="cont_thumb">
+<strong class="tit_thumb"><a href="https://v.daum.net/v/{article_id}" class="link_txt">{corpus.sentence(5, 10)}</a></strong>
+<span class="info_news"><span class="txt_info">{corpus.press()}</span><span class="txt_info">{corpus.random.randint(0, 23):02d}:{corpus.random.randint(0, 59):02d}</span></span>
+<div class="desc_thumb"><span class="link_txt">{corpus.sentence(12, 24)}</span></div>
+</div></li>''')
+    return f'''<html><head><meta charset="utf-8"><title>다음 뉴스</title></head><body>
+<div class="box_etc"><ul class="list_news2 list_allnews">{''.join(rows)}</ul></div></body></html>'''
+
+
+def naver_blog_page(corpus, items):
+    rows = []
+    for _ in range(items):
+        post_id = corpus.next_id()
+        rows.append(f'''<li class="sh_blog_top">
+<a class="sh_blog_title" href="https://blog.naver.com/user{post_id}/{post_id}">{corpus.sentence(4, 8)}</a>
+<a class="sh_blog_name">블로거{post_id}</a>
+<div class="sh_blog_passage">{corpus.sentence(15, 30)}</div>
+<span class="txt_inline">{corpus.random.randint(1, 23)}시간 전</span>
+</li>''')
+    return f'<html><head><meta charset="utf-8"></head><body><ul class="lst_total">{"".join(rows)}</ul></body></html>'
+
+
+def daum_blog_page(corpus, items):
+    rows = []
+    for _ in range(items):
+        post_id = corpus.next_id()
+        rows.append(f'''<div class="c-item">
+<div class="tit-g"><a href="https://blog.daum.net/{post_id}">{corpus.sentence(4, 8)}</a></div>
+<span class="f_url">blog.daum.net/{post_id}</span>
+<p class="desc">{corpus.sentence(15, 30)}</p>
+<span class="date">{corpus.random.randint(1, 23)}시간 전</span>
+</div>''')
+    return f'<html><head><meta charset="utf-8"></head><body><c-container>{"".join(rows)}</c-container></body></html>'
+
+
+def add_synthetic_categories(service, count):
+    """
+    뉴스 크롤러에 합성 카테고리를 추가합니다.
+    
+    Args:
+        service (TrendService): 카테고리를 추가할 서비스
+        count (int): 추가할 카테고리 수
+    """
+    for index in range(count):
+        service.naver_news_crawler.categories[f'합성{index + 1}'] = 900 + index
+        service.daum_news_crawler.categories[f'합성{index + 1}'] = f'synthetic{index + 1}'
+
+
+def build_archive(path, naver_categories, daum_categories, pages, keywords, blog_pages=1,
+                  news_items=20, daum_items=15, blog_items=10, seed=42, date=None):
+    """
+    합성 페이지로 채운 픽스처 아카이브를 생성합니다.
+    
+    Args:
+        path (str): 저장할 아카이브 경로
+        naver_categories (dict): 네이버 뉴스 카테고리 {이름: ID}
+        daum_categories (dict): 다음 뉴스 카테고리 {이름: ID}
+        pages (int): 카테고리별 뉴스 페이지 수
+        keywords (list): 블로그 검색 키워드 목록
+        blog_pages (int): 키워드별 블로그 검색 페이지 수
+        news_items (int): 네이버 뉴스 페이지당 기사 수
+        daum_items (int): 다음 뉴스 페이지당 기사 수
+        blog_items (int): 블로그 검색 페이지당 포스트 수
+        seed (int): 난수 시드
+        date (str): 뉴스 목록 날짜 (YYYYMMDD, 기본값: 오늘)
+        
+    Returns:
+        FixtureArchive: 저장된 아카이브
+    """
+    corpus = SyntheticCorpus(seed)
+    archive = FixtureArchive(path)
+    headers = {'Content-Type': 'text/html; charset=UTF-8'}
+    
+    if date is None:
+        date = datetime.now().strftime('%Y%m%d')
+    
+    for category_id in naver_categories.values():
+        for page in range(1, pages + 1):
+            url = f"https://news.naver.com/main/list.naver?mode=LSD&mid=sec&sid1={category_id}&date={date}&page={page}"
+            archive.add(_prepared_url(url), 200, headers, naver_news_page(corpus, news_items))
+    
+    for category_id in daum_categories.values():
+        for page in range(1, pages + 1):
+            url = f"https://news.daum.net/breakingnews/{category_id}?page={page}&regDate={date}"
+            archive.add(_prepared_url(url), 200, headers, daum_news_page(corpus, daum_items))
+    
+    for keyword in keywords:
+        for page in range(1, blog_pages + 1):
+            start = (page - 1) * 10 + 1
+            url = f"https://search.naver.com/search.naver?where=blog&sm=tab_pge&query={keyword}&start={start}"
+            archive.add(_prepared_url(url), 200, headers, naver_blog_page(corpus, blog_items))
+            
+            url = f"https://search.daum.net/search?w=blog&q={keyword}&p={page}"
+            archive.add(_prepared_url(url), 200, headers, daum_blog_page(corpus, blog_items))
+    
+    archive.save()
+    return archive
@@ -1,6 +1,7 @@
+from .base import NewsCrawler, BlogCrawler
 from .naver_news import NaverNewsCrawler
 from .naver_blog import NaverBlogCrawler
 from .daum_news import DaumNewsCrawler
 from .daum_blog import DaumBlogCrawler
 
-__all__ = ['NaverNewsCrawler', 'NaverBlogCrawler', 'DaumNewsCrawler', 'DaumBlogCrawler']
+__all__ = ['NewsCrawler', 'BlogCrawler', 'NaverNewsCrawler', 'NaverBlogCrawler', 'DaumNewsCrawler', 'DaumBlogCrawler']
@@ -0,0 +1,562 @@
+from datetime import datetime
+import asyncio
+from src.utils import HostRateLimiter, imap_ordered, run_blocking, get_default_client, get_parser, get_keyword_engine
+
+# 모든 크롤러가 요청에 사용하는 헤더
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+class NewsCrawler:
+    """
+    뉴스 목록 크롤러의 공통 기반 클래스
+    
+    페이지 수집(순차/병렬/비동기), 증분 수집 시 조기 중단, 키워드 집계는 이 클래스가 담당하고
+    소스별 하위 클래스는 SOURCE, PARSE_KEY, SELECTORS, CATEGORIES와 _list_url, _parse_news_list만 정의합니다.
+    """
+    
+    # 기사의 'source' 필드 값
+    SOURCE = None
+    
+    # 파싱 결과 캐시 키 접두어 (파싱 결과 형식이 바뀌면 버전을 올림)
+    PARSE_KEY = None
+    
+    # 페이지 파싱에 사용하는 CSS 선택자 (파서 백엔드별로 한 번만 컴파일됨)
+    SELECTORS = {}
+    
+    # {카테고리 이름: 목록 URL에 넣을 카테고리 ID}
+    CATEGORIES = {}
+    
+    def __init__(self, max_workers=4, rate_limiter=None, http_client=None, parser=None, keyword_engine=None):
+        """
+        크롤러 초기화
+        
+        Args:
+            max_workers (int): 페이지를 동시에 가져올 최대 작업자 수 (1이면 순차 수집)
+            rate_limiter (HostRateLimiter): 호스트별 요청 속도 제한기 (기본값: 기본 제한을 사용하는 새 인스턴스)
+            http_client (HttpClient): 요청에 사용할 HTTP 클라이언트 (기본값: 모든 크롤러가 공유하는 기본 클라이언트)
+            parser (HtmlParser): HTML 파서 백엔드 (기본값: lxml을 사용할 수 있으면 lxml, 아니면 BeautifulSoup)
+            keyword_engine (KeywordEngine): 키워드 추출 엔진 (기본값: 모든 크롤러가 공유하는 기본 엔진)
+        """
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter if rate_limiter is not None else HostRateLimiter()
+        self.http = http_client if http_client is not None else get_default_client()
+        self.parser = parser if parser is not None else get_parser()
+        self.selectors = self.parser.compile_all(self.SELECTORS)
+        self.keyword_engine = keyword_engine if keyword_engine is not None else get_keyword_engine()
+        self.headers = dict(DEFAULT_HEADERS)
+        self.categories = dict(self.CATEGORIES)
+    
+    def _list_url(self, category_id, page, date):
+        """
+        카테고리 뉴스 목록 페이지의 URL을 만듭니다.
+        
+        Args:
+            category_id: 카테고리 ID (CATEGORIES의 값)
+            page (int): 페이지 번호
+            date (str): 날짜 (YYYYMMDD 형식)
+            
+        Returns:
+            str: 목록 페이지 URL
+        """
+        raise NotImplementedError
+    
+    def _parse_news_list(self, html, category_name):
+        """
+        뉴스 목록 페이지 HTML에서 기사 목록을 추출합니다.
+        
+        Args:
+            html (str): 뉴스 목록 페이지 HTML
+            category_name (str): 카테고리 이름
+            
+        Returns:
+            list: 뉴스 기사 목록 (제목, URL, 언론사, 요약, 날짜, 카테고리, 소스)
+        """
+        raise NotImplementedError
+    
+    def get_news_list(self, category_name, page=1, date=None):
+        """
+        특정 카테고리의 뉴스 목록을 가져옵니다.
+        
+        Args:
+            category_name (str): 카테고리 이름 (categories의 키)
+            page (int): 페이지 번호
+            date (str): 날짜 (YYYYMMDD 형식, 기본값은 오늘)
+            
+        Returns:
+            list: 뉴스 기사 목록 (제목, URL, 언론사, 요약, 날짜)
+        """
+        if category_name not in self.categories:
+            raise ValueError(f"유효한 카테고리가 아닙니다. 가능한 카테고리: {list(self.categories.keys())}")
+        
+        if date is None:
+            date = datetime.now().strftime('%Y%m%d')
+        
+        url = self._list_url(self.categories[category_name], page, date)
+        
+        # 호스트별 요청 속도 제한
+        self.rate_limiter.acquire(url)
+        
+        page_data = self.http.get_page(url, headers=self.headers)
+        
+        # 본문이 이전과 같으면 저장된 파싱 결과를 재사용
+        return self.http.parse_page(page_data, f"{self.PARSE_KEY}:{category_name}", lambda html: self._parse_news_list(html, category_name))
+    
+    async def get_news_list_async(self, category_name, page=1, date=None, semaphore=None):
+        """
+        get_news_list의 비동기 버전입니다. 요청은 실행기 스레드에서 처리됩니다.
+        
+        Args:
+            category_name (str): 카테고리 이름
+            page (int): 페이지 번호
+            date (str): 날짜 (YYYYMMDD 형식, 기본값은 오늘)
+            semaphore (asyncio.Semaphore): 전역 동시 요청 수 제한 세마포어
+            
+        Returns:
+            list: 뉴스 기사 목록
+        """
+        return await run_blocking(self.get_news_list, category_name, page, date, semaphore=semaphore)
+    
+    def extract_keywords(self, text, top_n=10):
+        """
+        텍스트에서 키워드를 추출합니다.
+        
+        Args:
+            text (str): 키워드를 추출할 텍스트
+            top_n (int): 추출할 키워드 수
+            
+        Returns:
+            list: 키워드 목록
+        """
+        return self.keyword_engine.extract(text, top_n)
+    
+    def _fetch_page(self, category, page):
+        """
+        한 페이지를 가져옵니다. 오류가 발생하면 빈 목록을 반환합니다.
+        
+        Args:
+            category (str): 카테고리 이름
+            page (int): 페이지 번호
+            
+        Returns:
+            list: 뉴스 기사 목록
+        """
+        try:
+            return self.get_news_list(category, page)
+        except Exception as e:
+            print(f"{category} 카테고리 {page} 페이지 크롤링 중 오류: {e}")
+            return []
+    
+    def _iter_category(self, category, pages_per_category, seen_index=None):
+        """
+        한 카테고리의 페이지를 순서대로 가져오면서 하나씩 반환합니다.
+        
+        seen_index가 주어지면 모든 기사가 이미 수집된 페이지를 만난 시점에서 이후 페이지 요청을 중단합니다.
+        
+        Args:
+            category (str): 카테고리 이름
+            pages_per_category (int): 최대 페이지 수
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스
+            
+        Yields:
+            list: 한 페이지의 뉴스 기사 목록
+        """
+        for page in range(1, pages_per_category + 1):
+            news_list = self._fetch_page(category, page)
+            yield news_list
+            
+            # 새 기사가 없는 페이지 이후는 이전 수집에서 이미 확인한 기사
+            if seen_index is not None and news_list and all(seen_index.contains(news['url']) for news in news_list):
+                break
+    
+    def _fetch_category(self, category, pages_per_category, seen_index=None):
+        """
+        한 카테고리의 페이지를 모두 가져옵니다. (작업자 스레드에서 실행)
+        
+        Args:
+            category (str): 카테고리 이름
+            pages_per_category (int): 최대 페이지 수
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스
+            
+        Returns:
+            list: 페이지별 뉴스 기사 목록
+        """
+        return list(self._iter_category(category, pages_per_category, seen_index))
+    
+    def iter_pages(self, categories=None, pages_per_category=2, max_workers=None, seen_index=None):
+        """
+        카테고리 순서대로 페이지를 가져오면서 (카테고리, 뉴스 기사 목록)을 하나씩 반환합니다.
+        
+        순차 모드(max_workers가 1 이하)에서는 한 번에 한 페이지만 메모리에 유지하고,
+        병렬 모드에서는 카테고리 단위로 가져온 결과를 순서대로 넘겨줍니다.
+        
+        Args:
+            categories (list): 크롤링할 카테고리 목록 (기본값: 모든 카테고리)
+            pages_per_category (int | dict): 각 카테고리별로 크롤링할 페이지 수 (사전이면 {카테고리: 페이지 수})
+            max_workers (int): 카테고리를 동시에 가져올 최대 작업자 수 (기본값: self.max_workers)
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 조기 중단)
+            
+        Yields:
+            tuple: (카테고리 이름, 한 페이지의 뉴스 기사 목록)
+        """
+        if categories is None:
+            categories = list(self.categories.keys())
+        
+        if max_workers is None:
+            max_workers = self.max_workers
+        
+        if max_workers <= 1:
+            for category in categories:
+                for news_list in self._iter_category(category, self._page_depth(pages_per_category, category), seen_index):
+                    yield category, news_list
+            return
+        
+        # 카테고리 순서대로 작업 구성 (결과도 같은 순서로 반환됨)
+        # 과도한 요청 방지는 호스트별 속도 제한기가 담당
+        jobs = [(category, self._page_depth(pages_per_category, category), seen_index) for category in categories]
+        for category, pages in zip(categories, imap_ordered(self._fetch_category, jobs, max_workers=max_workers)):
+            for news_list in pages:
+                yield category, news_list
+    
+    def iter_news(self, categories=None, pages_per_category=2, max_workers=None, seen_index=None):
+        """
+        파싱된 뉴스 기사를 하나씩 반환합니다.
+        
+        Args:
+            categories (list): 크롤링할 카테고리 목록 (기본값: 모든 카테고리)
+            pages_per_category (int | dict): 각 카테고리별로 크롤링할 페이지 수 (사전이면 {카테고리: 페이지 수})
+            max_workers (int): 카테고리를 동시에 가져올 최대 작업자 수 (기본값: self.max_workers)
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 조기 중단)
+            
+        Yields:
+            dict: 뉴스 기사
+        """
+        for _, news_list in self.iter_pages(categories, pages_per_category, max_workers, seen_index):
+            yield from news_list
+    
+    def get_trending_keywords(self, categories=None, pages_per_category=2, top_n=20, max_workers=None, seen_index=None, duplicates=None):
+        """
+        여러 카테고리에서 트렌드 키워드를 추출합니다.
+        
+        Args:
+            categories (list): 크롤링할 카테고리 목록 (기본값: 모든 카테고리)
+            pages_per_category (int | dict): 각 카테고리별로 크롤링할 페이지 수 (사전이면 {카테고리: 페이지 수})
+            top_n (int): 반환할 상위 키워드 수
+            max_workers (int): 카테고리를 동시에 가져올 최대 작업자 수 (기본값: self.max_workers)
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 증분 수집: 조기 중단 및 새 기사만 반환)
+            duplicates (DuplicateFilter): 유사 중복 기사 필터 (지정 시 중복 기사는 집계와 저장에서 제외)
+            
+        Returns:
+            dict: 카테고리별 트렌드 키워드 및 전체 트렌드 키워드
+        """
+        if categories is None:
+            categories = list(self.categories.keys())
+        
+        pages = self.iter_pages(categories, pages_per_category, max_workers, seen_index)
+        
+        return self.build_trends(categories, pages, top_n, seen_index, duplicates)
+    
+    async def fetch_pages_async(self, categories=None, pages_per_category=2, semaphore=None, seen_index=None):
+        """
+        모든 카테고리의 페이지를 동시에 가져옵니다.
+        
+        Args:
+            categories (list): 크롤링할 카테고리 목록 (기본값: 모든 카테고리)
+            pages_per_category (int | dict): 각 카테고리별로 크롤링할 페이지 수 (사전이면 {카테고리: 페이지 수})
+            semaphore (asyncio.Semaphore): 전역 동시 요청 수 제한 세마포어
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 조기 중단)
+            
+        Returns:
+            list: 카테고리 순서의 (카테고리, 한 페이지의 뉴스 기사 목록)
+        """
+        if categories is None:
+            categories = list(self.categories.keys())
+        
+        # gather는 작업 순서대로 결과를 반환하므로 카테고리별 순서가 유지됨
+        category_results = await asyncio.gather(*[
+            run_blocking(self._fetch_category, category, self._page_depth(pages_per_category, category), seen_index, semaphore=semaphore)
+            for category in categories
+        ])
+        
+        return [
+            (category, news_list)
+            for category, category_pages in zip(categories, category_results)
+            for news_list in category_pages
+        ]
+    
+    async def get_trending_keywords_async(self, categories=None, pages_per_category=2, top_n=20, semaphore=None, seen_index=None, duplicates=None):
+        """
+        get_trending_keywords의 비동기 버전입니다. 모든 카테고리를 동시에 요청합니다.
+        
+        Args:
+            categories (list): 크롤링할 카테고리 목록 (기본값: 모든 카테고리)
+            pages_per_category (int | dict): 각 카테고리별로 크롤링할 페이지 수 (사전이면 {카테고리: 페이지 수})
+            top_n (int): 반환할 상위 키워드 수
+            semaphore (asyncio.Semaphore): 전역 동시 요청 수 제한 세마포어
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 증분 수집)
+            duplicates (DuplicateFilter): 유사 중복 기사 필터
+            
+        Returns:
+            dict: 카테고리별 트렌드 키워드 및 전체 트렌드 키워드
+        """
+        if categories is None:
+            categories = list(self.categories.keys())
+        
+        pages = await self.fetch_pages_async(categories, pages_per_category, semaphore, seen_index)
+        
+        return self.build_trends(categories, pages, top_n, seen_index, duplicates)
+    
+    def _page_depth(self, pages_per_category, category):
+        """
+        카테고리의 크롤링 페이지 수를 반환합니다.
+        
+        Args:
+            pages_per_category (int | dict): 공통 페이지 수 또는 {카테고리: 페이지 수}
+            category (str): 카테고리 이름
+            
+        Returns:
+            int: 페이지 수
+        """
+        if isinstance(pages_per_category, dict):
+            return pages_per_category.get(category, 1)
+        return pages_per_category
+    
+    def build_trends(self, categories, pages, top_n, seen_index=None, duplicates=None, yield_index=None):
+        """
+        페이지 스트림을 한 번 훑으면서 전체 및 카테고리별 트렌드 키워드를 추출합니다.
+        
+        단어 빈도는 기사 단위로 누적하므로 전체 텍스트를 이어 붙이지 않습니다.
+        키워드는 가져온 모든 기사에서 추출하고, seen_index가 주어지면 news_data에는 새 기사만 담습니다.
+        duplicates가 주어지면 유사 중복 기사는 키워드 집계와 news_data에서 모두 제외하고 대표 기사에 링크로만 남깁니다.
+        페이지 수익(새 기사 수)은 증분 수집이 아니어도 yield_index에 없는 기사 수로 계산합니다. (인덱스는 조회만 함)
+        
+        Args:
+            categories (list): 크롤링한 카테고리 목록
+            pages (iterable): 카테고리 순서의 (카테고리, 한 페이지의 뉴스 기사 목록)
+            top_n (int): 반환할 상위 키워드 수
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스
+            duplicates (DuplicateFilter): 유사 중복 기사 필터
+            yield_index (SeenUrlIndex): 페이지 수익 계산에 사용할 이미 수집한 URL 인덱스 (기본값: seen_index)
+            
+        Returns:
+            dict: 카테고리별 트렌드 키워드, 전체 트렌드 키워드, 카테고리별 페이지 수익(새 기사 수),
+                  전체 및 카테고리별 키워드 빈도 스케치(SpaceSaving)
+        """
+        word_freq = self.keyword_engine.counter(categories)
+        page_yields = {category: [] for category in categories}
+        news_data = []
+        if yield_index is None:
+            yield_index = seen_index
+        
+        for category, news_list in pages:
+            new_count = 0
+            
+            for news in news_list:
+                # 다른 언론사의 같은 기사는 한 번만 집계
+                if duplicates is not None and duplicates.check(news):
+                    continue
+                
+                word_freq.add(news['title'] + " " + news['summary'], category)
+                
+                # 증분 수집: 이전 수집에서 저장된 기사 제외
+                if seen_index is None or not seen_index.contains(news['url']):
+                    news_data.append(news)
+                
+                # 이전 수집에서 저장하지 않은 기사만 페이지 수익으로 계산
+                if yield_index is None or not yield_index.contains(news['url']):
+                    new_count += 1
+            
+            # 카테고리별 페이지 수익 (페이지당 새 기사 수)
+            page_yields[category].append(new_count)
+        
+        return {
+            'overall': word_freq.top(top_n),
+            'by_category': word_freq.top_by_group(10),
+            'news_data': news_data,
+            'page_yields': page_yields,
+            'keyword_sketch': word_freq.sketch(),
+            'category_sketches': word_freq.sketch_by_group()
+        }
+
+
+class BlogCrawler:
+    """
+    블로그 검색 크롤러의 공통 기반 클래스
+    
+    페이지 순회, 증분 수집 시 조기 중단, 키워드별 동시 검색은 이 클래스가 담당하고
+    소스별 하위 클래스는 SOURCE, NAME, PARSE_KEY, SELECTORS와 _search_url, _parse_blog_list만 정의합니다.
+    """
+    
+    # 포스트의 'source' 필드 값
+    SOURCE = None
+    
+    # 오류 메시지에 사용하는 소스 이름
+    NAME = None
+    
+    # 파싱 결과 캐시 키 접두어 (파싱 결과 형식이 바뀌면 버전을 올림)
+    PARSE_KEY = None
+    
+    # 페이지 파싱에 사용하는 CSS 선택자 (파서 백엔드별로 한 번만 컴파일됨)
+    SELECTORS = {}
+    
+    def __init__(self, rate_limiter=None, http_client=None, parser=None):
+        """
+        크롤러 초기화
+        
+        Args:
+            rate_limiter (HostRateLimiter): 호스트별 요청 속도 제한기 (기본값: 기본 제한을 사용하는 새 인스턴스)
+            http_client (HttpClient): 요청에 사용할 HTTP 클라이언트 (기본값: 모든 크롤러가 공유하는 기본 클라이언트)
+            parser (HtmlParser): HTML 파서 백엔드 (기본값: lxml을 사용할 수 있으면 lxml, 아니면 BeautifulSoup)
+        """
+        self.rate_limiter = rate_limiter if rate_limiter is not None else HostRateLimiter()
+        self.http = http_client if http_client is not None else get_default_client()
+        self.parser = parser if parser is not None else get_parser()
+        self.selectors = self.parser.compile_all(self.SELECTORS)
+        self.headers = dict(DEFAULT_HEADERS)
+    
+    def _search_url(self, keyword, page):
+        """
+        블로그 검색 결과 페이지의 URL을 만듭니다.
+        
+        Args:
+            keyword (str): 검색할 키워드
+            page (int): 페이지 번호 (1부터)
+            
+        Returns:
+            str: 검색 결과 페이지 URL
+        """
+        raise NotImplementedError
+    
+    def _parse_blog_list(self, html, keyword):
+        """
+        블로그 검색 결과 페이지 HTML에서 블로그 포스트 목록을 추출합니다.
+        
+        Args:
+            html (str): 검색 결과 페이지 HTML
+            keyword (str): 검색 키워드
+            
+        Returns:
+            list: 블로그 포스트 목록 (제목, URL, 작성자, 요약, 날짜, 키워드, 소스)
+        """
+        raise NotImplementedError
+    
+    def search_blogs(self, keyword, start_page=1, end_page=2, seen_index=None):
+        """
+        키워드로 블로그를 검색합니다.
+        
+        Args:
+            keyword (str): 검색할 키워드
+            start_page (int): 시작 페이지
+            end_page (int): 종료 페이지
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 새 포스트만 반환하고, 새 포스트가 없는 페이지에서 중단)
+            
+        Returns:
+            list: 블로그 포스트 목록 (제목, URL, 작성자, 요약, 날짜)
+        """
+        blog_posts = []
+        
+        for page in range(start_page, end_page + 1):
+            url = self._search_url(keyword, page)
+            
+            try:
+                # 호스트별 요청 속도 제한
+                self.rate_limiter.acquire(url)
+                
+                page_data = self.http.get_page(url, headers=self.headers)
+                
+                # 본문이 이전과 같으면 저장된 파싱 결과를 재사용
+                posts = self.http.parse_page(page_data, f"{self.PARSE_KEY}:{keyword}", lambda html: self._parse_blog_list(html, keyword))
+                
+                # 증분 수집: 이전 수집에서 저장된 포스트 제외
+                if seen_index is not None:
+                    new_posts = [post for post in posts if not seen_index.contains(post['url'])]
+                    blog_posts.extend(new_posts)
+                    if posts and not new_posts:
+                        break
+                else:
+                    blog_posts.extend(posts)
+            
+            except Exception as e:
+                print(f"{self.NAME} 블로그 검색 중 오류 발생: {e}")
+                continue
+        
+        return blog_posts
+    
+    async def search_blogs_async(self, keyword, start_page=1, end_page=2, semaphore=None, seen_index=None):
+        """
+        search_blogs의 비동기 버전입니다. 요청은 실행기 스레드에서 처리됩니다.
+        
+        Args:
+            keyword (str): 검색할 키워드
+            start_page (int): 시작 페이지
+            end_page (int): 종료 페이지
+            semaphore (asyncio.Semaphore): 전역 동시 요청 수 제한 세마포어
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 증분 수집)
+            
+        Returns:
+            list: 블로그 포스트 목록 (제목, URL, 작성자, 요약, 날짜)
+        """
+        return await run_blocking(self.search_blogs, keyword, start_page, end_page, seen_index, semaphore=semaphore)
+    
+    def get_trending_blogs(self, keywords, pages_per_keyword=2, seen_index=None):
+        """
+        여러 키워드에 대한 블로그 포스트를 수집합니다.
+        
+        Args:
+            keywords (list): 검색할 키워드 목록
+            pages_per_keyword (int): 각 키워드별로 검색할 페이지 수
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 증분 수집)
+            
+        Returns:
+            dict: 키워드별 블로그 포스트 및 전체 블로그 포스트
+        """
+        all_blogs = []
+        keyword_blogs = {}
+        
+        for keyword in keywords:
+            try:
+                blogs = self.search_blogs(keyword, start_page=1, end_page=pages_per_keyword, seen_index=seen_index)
+                all_blogs.extend(blogs)
+                keyword_blogs[keyword] = blogs
+            except Exception as e:
+                print(f"{keyword} 키워드 검색 중 오류: {e}")
+        
+        return {
+            'all_blogs': all_blogs,
+            'by_keyword': keyword_blogs
+        }
+    
+    async def get_trending_blogs_async(self, keywords, pages_per_keyword=2, semaphore=None, seen_index=None):
+        """
+        get_trending_blogs의 비동기 버전입니다. 모든 키워드를 동시에 검색합니다.
+        
+        Args:
+            keywords (list): 검색할 키워드 목록
+            pages_per_keyword (int): 각 키워드별로 검색할 페이지 수
+            semaphore (asyncio.Semaphore): 전역 동시 요청 수 제한 세마포어
+            seen_index (SeenUrlIndex): 이미 수집한 URL 인덱스 (지정 시 증분 수집)
+            
+        Returns:
+            dict: 키워드별 블로그 포스트 및 전체 블로그 포스트
+        """
+        results = await asyncio.gather(*[
+            self.search_blogs_async(keyword, 1, pages_per_keyword, semaphore=semaphore, seen_index=seen_index)
+            for keyword in keywords
+        ], return_exceptions=True)
+        
+        all_blogs = []
+        keyword_blogs = {}
+        
+        # 키워드 순서대로 결과 통합
+        for keyword, blogs in zip(keywords, results):
+            if isinstance(blogs, Exception):
+                print(f"{keyword} 키워드 검색 중 오류: {blogs}")
+                continue
+            all_blogs.extend(blogs)
+            keyword_blogs[keyword] = blogs
+        
+        return {
+            'all_blogs': all_blogs,
+            'by_keyword': keyword_blogs
+        }
@@ -0,0 +1,231 @@
+"""
+날짜별로 분할한 Parquet 컬럼형 아카이브
+
+수집한 기사와 블로그를 archive/news/date=YYYY-MM-DD/, archive/blogs/date=YYYY-MM-DD/ 아래에
+Parquet 파일로 저장하여, 몇 달치 데이터를 분석할 때 필요한 날짜 분할과 열만 읽습니다.
+(예: 한 달치 기사의 title, category, date 열만 읽기)
+
+저장된 데이터는 export 명령으로 한 번에 아카이브할 수 있습니다:
+    python -m src.services.archive export --data-dir data
+"""
+import argparse
+import os
+import sys
+import threading
+from pathlib import Path
+
+from src.services.storage import existing_storages
+
+# pyarrow는 선택 의존성 (없으면 TrendService가 아카이브를 만들지 않음)
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# 종류별 (기사/블로그 필드, 열 이름) 목록 (date 열은 분할 디렉토리 이름으로 저장)
+ARCHIVE_FIELDS = {
+    'news': (('source', 'source'), ('category', 'category'), ('title', 'title'), ('url', 'url'),
+             ('press', 'press'), ('summary', 'summary'), ('date', 'published')),
+    'blogs': (('source', 'source'), ('keyword', 'keyword'), ('title', 'title'), ('url', 'url'),
+              ('author', 'author'), ('summary', 'summary'), ('date', 'published'))
+}
+
+
+class ColumnarArchive:
+    """
+    기사와 블로그를 날짜별 Parquet 분할로 저장하고 필요한 분할/열만 읽는 클래스
+    
+    분할 디렉토리 이름(date=YYYY-MM-DD)으로 날짜 조건을 걸러 내므로
+    기간 밖의 파일은 열지 않으며, 요청한 열만 읽어 pyarrow.Table로 반환합니다.
+    """
+    
+    def __init__(self, root):
+        """
+        ColumnarArchive 초기화
+        
+        Args:
+            root (str): 아카이브 디렉토리
+        """
+        if not HAS_PYARROW:
+            raise ImportError("컬럼형 아카이브에는 pyarrow가 필요합니다.")
+        
+        self.root = Path(root)
+        self.partitioning = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+        self.schemas = {
+            kind: pa.schema([(column, pa.string()) for _, column in fields])
+            for kind, fields in ARCHIVE_FIELDS.items()
+        }
+    
+    def _partition_path(self, kind, date_str):
+        return self.root / kind / f"date={date_str}" / 'part-0.parquet'
+    
+    def write_day(self, date_str, trend_data):
+        """
+        하루치 기사와 블로그를 날짜 분할 파일로 저장합니다. (같은 날짜의 분할은 원자적으로 교체)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 트렌드 데이터
+            
+        Returns:
+            dict: 종류별 저장한 행 수 {'news': 기사 수, 'blogs': 블로그 수}
+        """
+        items = {
+            'news': trend_data.get('news_trends', {}).get('news_data', []),
+            'blogs': trend_data.get('blog_trends', {}).get('all_blogs', [])
+        }
+        # 내보낸 데이터의 수집 시간은 파일 메타데이터에 기록 (export에서 바뀐 날짜만 다시 쓰기 위함)
+        metadata = {b'collection_time': (trend_data.get('collection_time') or '').encode('utf-8')}
+        
+        counts = {}
+        for kind, fields in ARCHIVE_FIELDS.items():
+            columns = {
+                column: [item.get(key) for item in items[kind]]
+                for key, column in fields
+            }
+            table = pa.table(columns, schema=self.schemas[kind].with_metadata(metadata))
+            
+            path = self._partition_path(kind, date_str)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # '.'으로 시작하는 임시 파일은 데이터셋 탐색에서 제외되므로 쓰는 도중의 파일을 읽지 않음
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+            counts[kind] = table.num_rows
+        
+        return counts
+    
+    def collection_time(self, date_str):
+        """
+        날짜 분할에 기록된 수집 시간을 반환합니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            
+        Returns:
+            str: 수집 시간 (아카이브하지 않은 날짜이면 None)
+        """
+        path = self._partition_path('news', date_str)
+        if not path.exists():
+            return None
+        
+        metadata = pq.read_schema(path).metadata or {}
+        return metadata.get(b'collection_time', b'').decode('utf-8') or None
+    
+    def dates(self, kind='news'):
+        """
+        아카이브한 날짜 목록을 반환합니다.
+        
+        Args:
+            kind (str): 'news' 또는 'blogs'
+            
+        Returns:
+            list: 날짜 목록 (오름차순)
+        """
+        base = self.root / kind
+        if not base.exists():
+            return []
+        return sorted(path.name[len('date='):] for path in base.glob('date=*') if (path / 'part-0.parquet').exists())
+    
+    def scan(self, kind='news', start_date=None, end_date=None, columns=None, source=None, category=None):
+        """
+        기간 안의 날짜 분할에서 요청한 열만 읽습니다.
+        
+        Args:
+            kind (str): 'news' 또는 'blogs'
+            start_date (str): 시작 날짜 (YYYY-MM-DD 형식, 기본값: 처음부터)
+            end_date (str): 종료 날짜 (YYYY-MM-DD 형식, 기본값: 끝까지)
+            columns (list): 읽을 열 목록 (예: ['title', 'category', 'date'], 기본값: 모든 열)
+            source (str): 특정 소스만 ('naver' 또는 'daum')
+            category (str): 특정 카테고리만 (기사만 해당)
+            
+        Returns:
+            pyarrow.Table: 요청한 열의 테이블
+        """
+        if kind not in ARCHIVE_FIELDS:
+            raise ValueError(f"지원하지 않는 아카이브 종류입니다: {kind} (가능한 값: {list(ARCHIVE_FIELDS)})")
+        
+        schema = self.schemas[kind].append(pa.field('date', pa.string()))
+        base = self.root / kind
+        if not base.exists():
+            return schema.empty_table().select(columns or schema.names)
+        
+        # 날짜 조건은 분할 디렉토리 이름으로 평가되어 기간 밖의 파일은 열지 않음
+        conditions = []
+        if start_date is not None:
+            conditions.append(ds.field('date') >= start_date)
+        if end_date is not None:
+            conditions.append(ds.field('date') <= end_date)
+        if source is not None:
+            conditions.append(ds.field('source') == source)
+        if category is not None and kind == 'news':
+            conditions.append(ds.field('category') == category)
+        
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        
+        dataset = ds.dataset(str(base), schema=schema, format='parquet', partitioning=self.partitioning)
+        return dataset.to_table(columns=columns, filter=expression)
+    
+    def export(self, storage, force=False, skip=()):
+        """
+        저장소에 있는 날짜를 아카이브합니다.
+        
+        Args:
+            storage (SQLiteStorage | JsonStorage): 트렌드 데이터 저장소
+            force (bool): 이미 아카이브한 날짜도 다시 쓸지 여부 (기본값: 수집 시간이 바뀐 날짜만)
+            skip (set): 건너뛸 날짜 (다른 저장소에서 이미 내보낸 날짜)
+            
+        Returns:
+            dict: {날짜: {'news': 기사 수, 'blogs': 블로그 수}}
+        """
+        results = {}
+        for date_str in storage.dates():
+            if date_str in skip:
+                continue
+            trend_data = storage.load(date_str)
+            if trend_data is None:
+                continue
+            if not force and self.collection_time(date_str) == trend_data.get('collection_time'):
+                continue
+            
+            results[date_str] = self.write_day(date_str, trend_data)
+        
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='기사/블로그 컬럼형 아카이브')
+    parser.add_argument('command', choices=['export'], help='export: 저장된 데이터를 날짜별 Parquet 분할로 내보내기')
+    parser.add_argument('--data-dir', default=str(Path(__file__).resolve().parents[2] / 'data'), help='데이터 디렉토리')
+    parser.add_argument('--archive-dir', help='아카이브 디렉토리 (기본값: 데이터 디렉토리의 archive)')
+    parser.add_argument('--force', action='store_true', help='이미 아카이브한 날짜도 다시 쓰기')
+    args = parser.parse_args(argv)
+    
+    if not HAS_PYARROW:
+        print("pyarrow가 설치되어 있지 않습니다.", file=sys.stderr)
+        return 1
+    
+    archive = ColumnarArchive(args.archive_dir or Path(args.data_dir) / 'archive')
+    
+    # SQLite 저장소, 세그먼트, JSON 파일 순서로 내보내고 앞 저장소에서 내보낸 날짜는 건너뜀
+    results = {}
+    exported = set()
+    for storage in existing_storages(args.data_dir):
+        results.update(archive.export(storage, force=args.force, skip=exported))
+        exported.update(storage.dates())
+        storage.close()
+    
+    for date_str, counts in sorted(results.items()):
+        print(f"{date_str}: 기사 {counts['news']}개, 블로그 {counts['blogs']}개")
+    print(f"내보낸 날짜: {len(results)}일")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import heapq
+import json
+import math
+import os
+import threading
+from datetime import date
+from pathlib import Path
+
+
+class KeywordStatsStore:
+    """
+    키워드별 일간 빈도의 지수 가중 이동 평균(EWMA)과 분산을 누적하는 클래스
+    
+    하루 동안의 수집 결과는 '오늘의 빈도'로 덮어쓰다가 날짜가 바뀌는 시점에 한 번만 기준선에 반영하므로,
+    하루에 여러 번 수집해도 기준선이 치우치지 않습니다.
+    기준선과 비교한 오늘 빈도의 z-점수로 급상승 키워드를 고르며, 계산량은 키워드 수에 비례합니다.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, state_path, alpha=0.3, min_baseline_days=3, min_count=3, min_std=1.0, min_score=2.0,
+                 prune_below=0.05, max_keywords=1000):
+        """
+        KeywordStatsStore 초기화
+        
+        Args:
+            state_path (str): 통계 파일 경로
+            alpha (float): EWMA 평활 계수 (클수록 최근 날짜의 비중이 큼)
+            min_baseline_days (int): 급상승 점수를 계산하기 위한 최소 기준선 일수
+            min_count (int): 급상승 키워드로 인정할 오늘의 최소 빈도
+            min_std (float): z-점수 계산 시 표준편차의 하한 (처음 등장한 키워드의 점수 폭주 방지)
+            min_score (float): 급상승 키워드로 인정할 최소 z-점수
+            prune_below (float): 기준선 평균이 이 값보다 작아진 키워드는 기준선에서 제거
+            max_keywords (int): 하루에 기록할 최대 키워드 수 (빈도 상위 키워드만 기록)
+        """
+        self.state_path = Path(state_path)
+        self.alpha = alpha
+        self.min_baseline_days = min_baseline_days
+        self.min_count = min_count
+        self.min_std = min_std
+        self.min_score = min_score
+        self.prune_below = prune_below
+        self.max_keywords = max_keywords
+        self.lock = threading.Lock()
+        
+        self.current_date = None
+        self.current = {}
+        self.days = 0
+        self.stats = {}
+        self._load()
+    
+    def _load(self):
+        if not self.state_path.exists():
+            return
+        
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"키워드 통계 로드 중 오류 발생: {e}")
+            return
+        
+        if data.get('version') != self.FORMAT_VERSION:
+            return
+        
+        self.current_date = data.get('current_date')
+        self.current = data.get('current', {})
+        self.days = data.get('days', 0)
+        self.stats = {keyword: tuple(values) for keyword, values in data.get('stats', {}).items()}
+    
+    def save(self):
+        """통계를 파일에 원자적으로 저장합니다."""
+        with self.lock:
+            data = json.dumps({
+                'version': self.FORMAT_VERSION,
+                'current_date': self.current_date,
+                'current': self.current,
+                'days': self.days,
+                'stats': {keyword: [round(mean, 6), round(var, 6)] for keyword, (mean, var) in self.stats.items()}
+            }, ensure_ascii=False)
+        
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.state_path)
+    
+    def _fold_day(self, counts):
+        # 하루치 빈도를 기준선에 반영 (그날 등장하지 않은 키워드는 0으로 반영)
+        if self.days == 0:
+            # 첫날은 0에서 시작하지 않고 관측값 자체를 기준선으로 삼음
+            self.stats = {keyword: (float(count), 0.0) for keyword, count in counts.items()}
+            self.days = 1
+            return
+        
+        alpha = self.alpha
+        keywords = set(self.stats) | set(counts)
+        stats = {}
+        
+        for keyword in keywords:
+            mean, var = self.stats.get(keyword, (0.0, 0.0))
+            diff = counts.get(keyword, 0) - mean
+            increment = alpha * diff
+            mean += increment
+            var = (1 - alpha) * (var + diff * increment)
+            
+            if mean >= self.prune_below or keyword in counts:
+                stats[keyword] = (mean, var)
+        
+        self.stats = stats
+        self.days += 1
+    
+    def update(self, date_str, counts):
+        """
+        특정 날짜의 키워드 빈도를 기록합니다.
+        
+        같은 날짜로 다시 호출하면 그날의 빈도를 덮어쓰고, 더 늦은 날짜로 호출하면
+        이전 날짜(와 수집하지 않은 사이 날짜)를 기준선에 반영한 뒤 새 날짜를 시작합니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            counts (dict): {키워드: 그날의 빈도}
+        """
+        top = heapq.nlargest(self.max_keywords, counts.items(), key=lambda item: item[1])
+        counts = {keyword: int(count) for keyword, count in top}
+        
+        with self.lock:
+            if self.current_date is not None and date_str < self.current_date:
+                # 지난 날짜의 재수집은 기준선에 반영하지 않음
+                return
+            
+            if self.current_date is not None and date_str > self.current_date:
+                self._fold_day(self.current)
+                
+                # 수집하지 않은 사이 날짜는 빈도 0으로 반영 (최대 30일)
+                gap = (date.fromisoformat(date_str) - date.fromisoformat(self.current_date)).days - 1
+                for _ in range(min(max(gap, 0), 30)):
+                    self._fold_day({})
+            
+            self.current_date = date_str
+            self.current = counts
+    
+    def score(self, keyword, count):
+        """
+        키워드의 오늘 빈도가 기준선보다 얼마나 높은지 z-점수로 계산합니다.
+        
+        Args:
+            keyword (str): 키워드
+            count (int): 오늘의 빈도
+            
+        Returns:
+            float: z-점수
+        """
+        mean, var = self.stats.get(keyword, (0.0, 0.0))
+        return (count - mean) / max(math.sqrt(var), self.min_std)
+    
+    def rising_keywords(self, top_n=10, counts=None):
+        """
+        오늘의 빈도가 기준선보다 크게 높은 키워드를 점수 순으로 반환합니다.
+        
+        Args:
+            top_n (int): 반환할 키워드 수
+            counts (dict): 기록하지 않고 점수만 계산할 {키워드: 빈도} (기본값: 기록된 오늘의 빈도)
+            
+        Returns:
+            list: [{'keyword', 'count', 'baseline', 'score'}] (기준선이 부족하면 빈 목록)
+        """
+        with self.lock:
+            if self.days < self.min_baseline_days:
+                return []
+            
+            candidates = (
+                (self.score(keyword, count), keyword, count)
+                for keyword, count in (self.current if counts is None else counts).items()
+                if count >= self.min_count
+            )
+            top = heapq.nlargest(top_n, candidates, key=lambda item: item[0])
+            
+            return [
+                {
+                    'keyword': keyword,
+                    'count': count,
+                    'baseline': round(self.stats.get(keyword, (0.0, 0.0))[0], 2),
+                    'score': round(score, 2)
+                }
+                for score, keyword, count in top
+                if score >= self.min_score
+            ]
@@ -0,0 +1,145 @@
+import heapq
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class PageDepthPlanner:
+    """
+    카테고리별 페이지 수익(페이지당 새 기사 수)을 기록하고
+    전체 요청 예산 안에서 카테고리별 크롤링 페이지 수를 정하는 클래스
+    """
+    
+    def __init__(self, state_path, history_size=5, min_pages=1, max_pages=5,
+                 first_page_prior=20.0, decay=0.8):
+        """
+        PageDepthPlanner 초기화
+        
+        Args:
+            state_path (str): 페이지 수익 기록 파일 경로
+            history_size (int): 카테고리별로 유지할 최근 수집 횟수
+            min_pages (int): 카테고리별 최소 페이지 수
+            max_pages (int): 카테고리별 최대 페이지 수
+            first_page_prior (float): 기록이 없는 카테고리의 첫 페이지 예상 수익
+            decay (float): 기록이 없는 다음 페이지의 예상 수익 감소율
+        """
+        self.state_path = Path(state_path)
+        self.history_size = history_size
+        self.min_pages = min_pages
+        self.max_pages = max_pages
+        self.first_page_prior = first_page_prior
+        self.decay = decay
+        self.lock = threading.Lock()
+        self.history = self._load()
+    
+    def _load(self):
+        if not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"페이지 수익 기록 로드 중 오류 발생: {e}")
+            return {}
+    
+    def save(self):
+        """페이지 수익 기록을 파일에 원자적으로 저장합니다."""
+        with self.lock:
+            data = json.dumps(self.history, ensure_ascii=False, indent=2)
+        
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.state_path)
+    
+    def expected_yield(self, source, category, page):
+        """
+        카테고리의 특정 페이지에서 기대되는 새 기사 수를 추정합니다.
+        
+        최근 수집에서 해당 페이지를 가져온 기록이 있으면 그 평균을 사용하고,
+        없으면 이전 페이지 추정값에 감소율을 곱합니다.
+        
+        Args:
+            source (str): 데이터 소스 ('naver', 'daum')
+            category (str): 카테고리 이름
+            page (int): 페이지 번호 (1부터 시작)
+            
+        Returns:
+            float: 예상 새 기사 수
+        """
+        runs = self.history.get(source, {}).get(category, [])
+        observed = [run[page - 1] for run in runs if len(run) >= page]
+        
+        if observed:
+            return sum(observed) / len(observed)
+        if page == 1:
+            return self.first_page_prior
+        return self.expected_yield(source, category, page - 1) * self.decay
+    
+    def plan(self, targets, budget):
+        """
+        전체 요청 예산 안에서 (소스, 카테고리)별 페이지 수를 정합니다.
+        
+        첫 페이지 예상 수익이 큰 카테고리부터 최소 페이지를 배정한 뒤, 남은 예산은 다음 페이지의
+        예상 수익이 가장 큰 카테고리부터 한 페이지씩 배정합니다.
+        예산이 모든 카테고리의 최소 페이지보다 적으면 예상 수익이 작은 카테고리는 이번 수집에서 제외(0페이지)하므로
+        배정한 페이지 수의 합은 예산을 넘지 않습니다.
+        
+        Args:
+            targets (list): (소스, 카테고리) 튜플 목록
+            budget (int): 전체 페이지 요청 예산
+            
+        Returns:
+            dict: {소스: {카테고리: 페이지 수}}
+        """
+        depths = {target: 0 for target in targets}
+        remaining = max(0, budget)
+        
+        # 최소 페이지는 첫 페이지 예상 수익 순서로 예산이 남아 있는 동안만 배정
+        first_page_order = sorted(targets, key=lambda target: -self.expected_yield(target[0], target[1], 1))
+        for target in first_page_order:
+            depths[target] = min(self.min_pages, remaining)
+            remaining -= depths[target]
+        
+        heap = []
+        for order, (source, category) in enumerate(targets):
+            depth = depths[(source, category)]
+            if depth == self.min_pages and depth < self.max_pages:
+                gain = self.expected_yield(source, category, depth + 1)
+                heapq.heappush(heap, (-gain, order, source, category))
+        
+        while remaining > 0 and heap:
+            neg_gain, order, source, category = heapq.heappop(heap)
+            if -neg_gain <= 0:
+                break
+            
+            depths[(source, category)] += 1
+            remaining -= 1
+            
+            depth = depths[(source, category)]
+            if depth < self.max_pages:
+                gain = self.expected_yield(source, category, depth + 1)
+                heapq.heappush(heap, (-gain, order, source, category))
+        
+        result = {}
+        for (source, category), depth in depths.items():
+            result.setdefault(source, {})[category] = depth
+        return result
+    
+    def record(self, source, page_yields):
+        """
+        이번 수집에서 카테고리별 페이지 수익을 기록합니다.
+        
+        Args:
+            source (str): 데이터 소스
+            page_yields (dict): {카테고리: [페이지별 새 기사 수]}
+        """
+        with self.lock:
+            source_history = self.history.setdefault(source, {})
+            for category, yields in page_yields.items():
+                if not yields:
+                    continue
+                runs = source_history.setdefault(category, [])
+                runs.append(list(yields))
+                del runs[:-self.history_size]
@@ -0,0 +1,172 @@
+"""
+날짜별 요약(rollup) 레코드
+
+수집할 때마다 그날의 상위 키워드와 빈도, 카테고리별 키워드, 소스별 기사/블로그 수,
+주요 기사 몇 개와 단어 빈도 스케치만 담은 작은 요약을 rollups/YYYY-MM-DD.json으로 저장합니다.
+주간 리포트처럼 여러 날짜를 다루는 리포트는 기사 목록을 읽지 않고 이 요약만으로 만듭니다.
+"""
+import json
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+
+# 요약에 담는 주요 기사 수와 기사 필드
+HEADLINE_COUNT = 6
+HEADLINE_FIELDS = ('title', 'url', 'press', 'category')
+
+# 요약에 담는 빈도 포함 상위 키워드 수
+KEYWORD_COUNT = 20
+
+
+def build_rollup(date_str, trend_data, overall_sketch, source_sketches, recounted=False):
+    """
+    하루치 트렌드 데이터로 요약 레코드를 만듭니다.
+    
+    Args:
+        date_str (str): 날짜 (YYYY-MM-DD 형식)
+        trend_data (dict): 트렌드 데이터
+        overall_sketch (SpaceSaving): 모든 소스를 합친 그날의 단어 빈도 스케치
+        source_sketches (dict): {소스: SpaceSaving}
+        recounted (bool): 저장된 스케치 대신 기사를 다시 집계해 만든 스케치인지 여부
+        
+    Returns:
+        dict: 요약 레코드
+    """
+    news_data = trend_data.get('news_trends', {}).get('news_data', [])
+    blogs = trend_data.get('blog_trends', {}).get('all_blogs', [])
+    
+    return {
+        'version': DailyRollupStore.FORMAT_VERSION,
+        'date': date_str,
+        'collection_time': trend_data.get('collection_time'),
+        'top_keywords': trend_data.get('top_keywords', []),
+        'keyword_counts': [
+            {'keyword': keyword, 'count': count, 'error': error}
+            for keyword, count, error in overall_sketch.top_items(KEYWORD_COUNT)
+        ],
+        'category_keywords': trend_data.get('news_trends', {}).get('by_category', {}),
+        'rising_keywords': trend_data.get('rising_keywords', []),
+        'article_counts': dict(Counter(news.get('source') for news in news_data)),
+        'blog_counts': dict(Counter(blog.get('source') for blog in blogs)),
+        'category_counts': dict(Counter(news.get('category') for news in news_data if news.get('category'))),
+        'headlines': [
+            dict({field: news.get(field, '') for field in HEADLINE_FIELDS}, source=news.get('source'))
+            for news in news_data[:HEADLINE_COUNT]
+        ],
+        # 기간 상위 키워드 계산용 스케치 (리포트 응답에서는 제외)
+        'sketches': {
+            'overall': overall_sketch.to_dict(),
+            'by_source': {source: sketch.to_dict() for source, sketch in source_sketches.items()}
+        },
+        'recounted': recounted
+    }
+
+
+def summarize(rollup):
+    """
+    요약 레코드에서 스케치를 뺀 응답용 사전을 반환합니다.
+    
+    Args:
+        rollup (dict): 요약 레코드
+        
+    Returns:
+        dict: 스케치를 제외한 요약
+    """
+    return {key: value for key, value in rollup.items() if key != 'sketches'}
+
+
+class DailyRollupStore:
+    """
+    날짜별 요약 레코드를 파일 하나씩 저장하고 읽는 클래스
+    
+    요약은 수집 결과를 저장할 때마다 통째로 다시 쓰며(원자적 교체),
+    파일이 바뀌지 않았으면 메모리에 둔 것을 재사용합니다.
+    """
+    
+    # 2: 단어 빈도 스케치를 기사 수, 주요 기사와 같은 그날의 기사 전체에서 계산
+    FORMAT_VERSION = 2
+    
+    def __init__(self, root, max_cached=31):
+        """
+        DailyRollupStore 초기화
+        
+        Args:
+            root (str): 요약 파일 디렉토리
+            max_cached (int): 메모리에 유지할 최대 날짜 수
+        """
+        self.root = Path(root)
+        self.max_cached = max_cached
+        self.lock = threading.Lock()
+        # {날짜: (파일 수정 시각, 요약)}
+        self._cache = {}
+    
+    def path(self, date_str):
+        """
+        특정 날짜의 요약 파일 경로를 반환합니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            
+        Returns:
+            Path: 요약 파일 경로
+        """
+        return self.root / f"{date_str}.json"
+    
+    def _remember(self, date_str, mtime, rollup):
+        with self.lock:
+            self._cache.pop(date_str, None)
+            self._cache[date_str] = (mtime, rollup)
+            while len(self._cache) > self.max_cached:
+                del self._cache[next(iter(self._cache))]
+    
+    def save(self, date_str, rollup):
+        """
+        요약 레코드를 파일에 원자적으로 저장합니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            rollup (dict): 요약 레코드
+        """
+        path = self.path(date_str)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(rollup, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        self._remember(date_str, path.stat().st_mtime, rollup)
+    
+    def load(self, date_str):
+        """
+        특정 날짜의 요약 레코드를 읽습니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            
+        Returns:
+            dict: 요약 레코드 (없거나 형식이 다르면 None)
+        """
+        path = self.path(date_str)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        
+        with self.lock:
+            cached = self._cache.get(date_str)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                rollup = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"일별 요약 로드 중 오류 발생: {e}")
+            return None
+        
+        if rollup.get('version') != self.FORMAT_VERSION:
+            return None
+        
+        self._remember(date_str, mtime, rollup)
+        return rollup
@@ -0,0 +1,252 @@
+"""
+수집한 뉴스 기사와 블로그 포스트의 SQLite FTS5 전문 검색 색인
+
+수집이 끝날 때마다 그날의 기사/블로그를 색인에 추가하고(이미 색인한 URL은 건너뜀),
+이미 저장된 날짜(SQLite 저장소와 trends_YYYY-MM-DD.json 파일)는 backfill 명령으로 한 번에 색인합니다.
+
+사용법:
+    python -m src.services.search_index backfill --data-dir data
+    python -m src.services.search_index search "기준금리 인상" --data-dir data
+"""
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+from src.services.storage import existing_storages
+
+# 검색어에서 FTS5 구문으로 해석될 수 있는 문자를 지우는 패턴
+QUERY_CLEAN_PATTERN = re.compile(r'["*^():{}\[\]]')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    source TEXT,
+    category TEXT,
+    date TEXT NOT NULL,
+    title TEXT,
+    summary TEXT,
+    press TEXT,
+    published TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_date ON documents(date);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, summary,
+    content='documents', content_rowid='id',
+    tokenize='unicode61', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, title, summary) VALUES ('delete', old.id, old.title, old.summary);
+END;
+
+CREATE TABLE IF NOT EXISTS ingested_days (
+    date TEXT PRIMARY KEY,
+    collection_time TEXT
+);
+"""
+
+
+class SearchIndex:
+    """
+    뉴스 기사와 블로그 포스트를 SQLite FTS5로 색인하고 검색하는 클래스
+    
+    검색어의 각 단어는 접두어 검색으로 처리하므로 '금리'로 '금리가', '금리는'도 찾고,
+    결과는 제목에 가중치를 둔 BM25 점수 순으로 정렬됩니다.
+    (trigram 토크나이저는 세 글자 미만 검색어를 찾지 못해 두 글자 한국어 단어 검색에 쓸 수 없음)
+    """
+    
+    def __init__(self, db_path):
+        """
+        SearchIndex 초기화
+        
+        Args:
+            db_path (str): SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        
+        # 웹 요청 스레드와 수집 스레드가 함께 사용하므로 연결 하나를 잠금으로 보호
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.executescript(SCHEMA)
+    
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self.lock:
+            self.connection.close()
+    
+    def ingest_day(self, date_str, trend_data):
+        """
+        하루치 트렌드 데이터의 기사와 블로그를 색인에 추가합니다. (이미 색인한 URL은 건너뜀)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 트렌드 데이터
+            
+        Returns:
+            int: 새로 색인한 문서 수
+        """
+        rows = []
+        for news in trend_data.get('news_trends', {}).get('news_data', []):
+            if news.get('url'):
+                rows.append((news['url'], 'news', news.get('source'), news.get('category'), date_str,
+                             news.get('title', ''), news.get('summary', ''), news.get('press'), news.get('date')))
+        for blog in trend_data.get('blog_trends', {}).get('all_blogs', []):
+            if blog.get('url'):
+                rows.append((blog['url'], 'blog', blog.get('source'), None, date_str,
+                             blog.get('title', ''), blog.get('summary', ''), blog.get('author'), blog.get('date')))
+        
+        with self.lock, self.connection:
+            # 색인 테이블은 트리거가 함께 갱신
+            added = self.connection.executemany(
+                'INSERT OR IGNORE INTO documents (url, type, source, category, date, title, summary, press, published) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            ).rowcount
+            self.connection.execute(
+                'INSERT OR REPLACE INTO ingested_days (date, collection_time) VALUES (?, ?)',
+                (date_str, trend_data.get('collection_time'))
+            )
+        
+        return added
+    
+    def ingested_days(self):
+        """
+        색인한 날짜와 수집 시간을 반환합니다.
+        
+        Returns:
+            dict: {날짜: 수집 시간}
+        """
+        with self.lock:
+            return {row['date']: row['collection_time'] for row in self.connection.execute('SELECT * FROM ingested_days')}
+    
+    def backfill(self, storage, force=False):
+        """
+        저장소에 있는 날짜의 트렌드 데이터를 색인합니다.
+        
+        Args:
+            storage (SQLiteStorage | JsonStorage): 트렌드 데이터 저장소
+            force (bool): 이미 색인한 날짜도 다시 읽을지 여부 (기본값: 수집 시간이 바뀐 날짜만)
+            
+        Returns:
+            dict: {날짜: 새로 색인한 문서 수}
+        """
+        ingested = {} if force else self.ingested_days()
+        results = {}
+        
+        for date_str in storage.dates():
+            trend_data = storage.load(date_str)
+            if trend_data is None:
+                continue
+            
+            if date_str in ingested and ingested[date_str] == trend_data.get('collection_time'):
+                continue
+            
+            results[date_str] = self.ingest_day(date_str, trend_data)
+        
+        return results
+    
+    def _match_expression(self, query):
+        # 각 단어를 따옴표로 감싼 접두어 검색으로 바꾸고 모두 포함(AND)하도록 연결
+        terms = QUERY_CLEAN_PATTERN.sub(' ', query).split()
+        return ' '.join(f'"{term}"*' for term in terms)
+    
+    def search(self, query, date_from=None, date_to=None, source=None, category=None, page=1, per_page=20):
+        """
+        기사와 블로그를 검색합니다.
+        
+        Args:
+            query (str): 검색어 (여러 단어면 모두 포함한 문서)
+            date_from (str): 수집 날짜 하한 (YYYY-MM-DD 형식)
+            date_to (str): 수집 날짜 상한 (YYYY-MM-DD 형식)
+            source (str): 소스 ('naver' 또는 'daum')
+            category (str): 뉴스 카테고리
+            page (int): 페이지 번호 (1부터 시작)
+            per_page (int): 페이지당 결과 수
+            
+        Returns:
+            dict: 검색어, 전체 결과 수, 페이지 정보, 점수 순 결과 목록
+        """
+        page = max(1, page)
+        per_page = max(1, min(per_page, 100))
+        expression = self._match_expression(query)
+        
+        result = {'query': query, 'total': 0, 'page': page, 'per_page': per_page, 'results': []}
+        if not expression:
+            return result
+        
+        conditions = ['documents_fts MATCH ?']
+        params = [expression]
+        for column, operator, value in (('date', '>=', date_from), ('date', '<=', date_to),
+                                        ('source', '=', source), ('category', '=', category)):
+            if value:
+                conditions.append(f'd.{column} {operator} ?')
+                params.append(value)
+        where = ' AND '.join(conditions)
+        
+        with self.lock:
+            try:
+                result['total'] = self.connection.execute(
+                    f'SELECT COUNT(*) FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid WHERE {where}',
+                    params
+                ).fetchone()[0]
+                
+                rows = self.connection.execute(
+                    'SELECT d.url, d.type, d.source, d.category, d.date, d.title, d.summary, d.press, d.published, '
+                    "bm25(documents_fts, 5.0, 1.0) AS score, snippet(documents_fts, 1, '<mark>', '</mark>', '...', 16) AS snippet "
+                    f'FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid WHERE {where} '
+                    'ORDER BY score LIMIT ? OFFSET ?',
+                    params + [per_page, (page - 1) * per_page]
+                ).fetchall()
+            except sqlite3.OperationalError as e:
+                print(f"검색 중 오류 발생: {e}")
+                return result
+        
+        # bm25는 작을수록 관련도가 높으므로 부호를 바꿔 반환
+        result['results'] = [dict(row, score=round(-row['score'], 4)) for row in rows]
+        return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='수집 데이터 전문 검색 색인')
+    parser.add_argument('command', choices=['backfill', 'search'], help='backfill: 저장된 데이터 색인, search: 검색')
+    parser.add_argument('query', nargs='?', default='', help='검색어 (search 명령)')
+    parser.add_argument('--data-dir', default=str(Path(__file__).resolve().parents[2] / 'data'), help='데이터 디렉토리')
+    parser.add_argument('--db', help='색인 파일 경로 (기본값: 데이터 디렉토리의 search.db)')
+    parser.add_argument('--force', action='store_true', help='이미 색인한 날짜도 다시 읽기')
+    args = parser.parse_args(argv)
+    
+    index = SearchIndex(args.db or Path(args.data_dir) / 'search.db')
+    
+    if args.command == 'backfill':
+        # 데이터 디렉토리의 모든 저장소를 차례로 색인 (같은 URL은 한 번만 색인)
+        results = {}
+        for storage in existing_storages(args.data_dir):
+            for date_str, added in index.backfill(storage, force=args.force).items():
+                results[date_str] = results.get(date_str, 0) + added
+            storage.close()
+        for date_str, added in results.items():
+            print(f"{date_str}: {added}개 문서 색인")
+        print(f"색인한 날짜: {len(results)}일, 새 문서: {sum(results.values())}개")
+    else:
+        print(json.dumps(index.search(args.query), ensure_ascii=False, indent=2))
+    
+    index.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
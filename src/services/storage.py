@@ -0,0 +1,1091 @@
+"""
+날짜별 트렌드 데이터 저장소
+
+JsonStorage는 날짜마다 trends_YYYY-MM-DD.json 파일 하나를 쓰는 기존 방식이고
+(compression을 지정하면 gzip/zstd로 압축한 JSON Lines 파일 trends_YYYY-MM-DD.jsonl.gz/.jsonl.zst),
+SQLiteStorage는 수집 결과를 수집/기사/블로그/키워드 빈도 테이블로 나누어
+날짜, 소스, 카테고리 색인과 함께 data/trends.db 하나에 저장합니다.
+SegmentedStorage는 수집 실행마다 data/segments/YYYY-MM-DD/ 아래에 세그먼트 파일을 추가하고 읽을 때 합칩니다.
+세 저장소는 같은 save/append/load 인터페이스를 제공하므로 TrendService는 저장 방식과 관계없이 같은 데이터를 주고받습니다.
+
+기존 JSON 파일은 import 명령으로 한 번에 옮기고, 세그먼트는 compact 명령으로 날짜별 파일 하나로 합칠 수 있습니다:
+    python -m src.services.storage import --data-dir data
+    python -m src.services.storage compact --data-dir data
+    python -m src.services.storage convert --compression zstd --data-dir data
+"""
+import argparse
+import gzip
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+# zstandard는 선택 의존성 (없으면 zstd로 압축한 데이터 파일을 쓰거나 읽지 않음)
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# 데이터 파일 이름에서 날짜를 꺼내는 패턴 (압축하지 않은 JSON 파일과 압축한 JSON Lines 파일)
+DATA_FILE_PATTERN = re.compile(r'^trends_(\d{4}-\d{2}-\d{2})\.(?:json|jsonl\.gz|jsonl\.zst)$')
+
+# 압축 방식별 데이터 파일 확장자 (None은 기존 JSON 파일)
+DATA_FILE_SUFFIXES = {None: '.json', 'gzip': '.jsonl.gz', 'zstd': '.jsonl.zst'}
+
+# 압축 파일을 읽다가 날 수 있는 오류 (잘린 gzip 파일은 EOFError, zstandard가 없으면 ImportError)
+READ_ERRORS = (OSError, ValueError, EOFError, ImportError) + ((zstandard.ZstdError,) if HAS_ZSTD else ())
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS collections (
+    date TEXT PRIMARY KEY,
+    collection_time TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL REFERENCES collections(date) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    category TEXT,
+    title TEXT,
+    url TEXT,
+    press TEXT,
+    summary TEXT,
+    published TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS articles_date ON articles(date, position);
+CREATE INDEX IF NOT EXISTS articles_source_category ON articles(source, category, date);
+CREATE INDEX IF NOT EXISTS articles_category ON articles(category, date);
+
+CREATE TABLE IF NOT EXISTS blogs (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL REFERENCES collections(date) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    keyword TEXT,
+    title TEXT,
+    url TEXT,
+    author TEXT,
+    summary TEXT,
+    published TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS blogs_date ON blogs(date, position);
+CREATE INDEX IF NOT EXISTS blogs_source ON blogs(source, date);
+
+CREATE TABLE IF NOT EXISTS keyword_sketches (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL REFERENCES collections(date) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    category TEXT,
+    capacity INTEGER NOT NULL,
+    floor INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS keyword_sketches_date ON keyword_sketches(date);
+
+CREATE TABLE IF NOT EXISTS keyword_counts (
+    sketch_id INTEGER NOT NULL REFERENCES keyword_sketches(id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    error INTEGER NOT NULL,
+    PRIMARY KEY (sketch_id, rank)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS keyword_counts_keyword ON keyword_counts(keyword);
+"""
+
+# 기사/블로그 사전의 필드와 테이블 열 (crawler가 만드는 필드 순서, 나머지 필드는 extra 열에 JSON으로 저장)
+ARTICLE_FIELDS = (('title', 'title'), ('url', 'url'), ('press', 'press'), ('summary', 'summary'),
+                  ('date', 'published'), ('category', 'category'), ('source', 'source'))
+BLOG_FIELDS = (('title', 'title'), ('url', 'url'), ('author', 'author'), ('summary', 'summary'),
+               ('date', 'published'), ('keyword', 'keyword'), ('source', 'source'))
+
+# 트렌드 데이터 안의 (섹션, 기사/블로그 목록 키)
+ITEM_LISTS = (('news_trends', 'news_data'), ('blog_trends', 'all_blogs'))
+
+
+def merge_items(saved_items, new_items):
+    """
+    기사/블로그 목록을 URL 기준으로 합칩니다.
+    
+    같은 URL은 처음 저장된 위치를 유지하고 내용은 나중 항목으로 바꿉니다. (예: 중복 기사 링크가 추가된 대표 기사)
+    URL이 없는 항목은 모두 유지합니다.
+    
+    Args:
+        saved_items (list): 먼저 저장된 항목
+        new_items (list): 새 항목
+        
+    Returns:
+        list: 합친 항목 목록
+    """
+    merged = {}
+    for index, item in enumerate(saved_items + new_items):
+        merged[item.get('url') or index] = item
+    return list(merged.values())
+
+
+def merge_trend_data(saved_data, trend_data):
+    """
+    같은 날짜에 먼저 저장된 데이터에 새 수집 결과를 합칩니다.
+    
+    기사/블로그는 merge_items로 합치고, 집계 결과(상위 키워드, 스케치 등)는 새 수집 결과를 사용합니다.
+    
+    Args:
+        saved_data (dict): 먼저 저장된 트렌드 데이터 (없으면 None)
+        trend_data (dict): 새 수집 결과
+        
+    Returns:
+        dict: 합친 트렌드 데이터
+    """
+    if saved_data is None:
+        return trend_data
+    
+    merged = dict(trend_data)
+    for section, key in ITEM_LISTS:
+        if section in merged:
+            saved_items = saved_data.get(section, {}).get(key, [])
+            merged[section] = dict(merged[section], **{key: merge_items(saved_items, merged[section].get(key, []))})
+    return merged
+
+
+def _strip_items(trend_data):
+    # 기사/블로그 목록은 자리만 남긴 집계 결과 (읽을 때 같은 위치에 채움)
+    summary = dict(trend_data)
+    for section, key in ITEM_LISTS:
+        if section in summary:
+            summary[section] = dict(summary[section], **{key: None})
+    return summary
+
+
+def _fill_items(summary, news_data, blogs):
+    if 'news_trends' in summary:
+        summary['news_trends']['news_data'] = news_data
+    if 'blog_trends' in summary:
+        summary['blog_trends']['all_blogs'] = blogs
+    return summary
+
+
+def _write_records(f, trend_data, news_data, blogs):
+    # JSON Lines 기록: 첫 줄은 집계 결과, 이후 한 줄에 기사/블로그 하나 (기사가 블로그보다 먼저)
+    f.write(json.dumps({'summary': _strip_items(trend_data)}, ensure_ascii=False) + '\n')
+    for news in news_data:
+        f.write(json.dumps({'news': news}, ensure_ascii=False) + '\n')
+    for blog in blogs:
+        f.write(json.dumps({'blog': blog}, ensure_ascii=False) + '\n')
+
+
+def _limited_records(f, item_limit):
+    # 최대 개수를 넘는 기사/블로그 줄은 해석하지 않고 건너뜀
+    counts = {'{"news"': 0, '{"blog"': 0}
+    for line in f:
+        prefix = line[:len('{"news"')]
+        if prefix in counts:
+            if counts[prefix] >= item_limit:
+                continue
+            counts[prefix] += 1
+        yield json.loads(line)
+
+
+def _read_records(f, item_limit=None):
+    if item_limit is None:
+        # 전체를 읽을 때는 줄마다 해석하지 않고 배열 하나로 한 번에 해석 (줄바꿈 문자는 기록 안에서 항상 이스케이프됨)
+        records = json.loads('[' + f.read().rstrip('\n').replace('\n', ',') + ']')
+    else:
+        records = _limited_records(f, item_limit)
+    
+    summary = None
+    news_data = []
+    blogs = []
+    for record in records:
+        if 'news' in record:
+            news_data.append(record['news'])
+        elif 'blog' in record:
+            blogs.append(record['blog'])
+        else:
+            summary = record['summary']
+    return summary, news_data, blogs
+
+
+def _open_text(path, mode, target=None):
+    # 확장자에 따라 압축을 풀거나 압축하며 읽고 쓰는 텍스트 파일 (임시 파일에 쓸 때는 최종 경로 target의 확장자 기준)
+    name = (target or path).name
+    if name.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=6)
+    if name.endswith('.zst'):
+        if not HAS_ZSTD:
+            raise ImportError("zstd로 압축한 데이터 파일에는 zstandard가 필요합니다.")
+        return zstandard.open(path, mode + 't', encoding='utf-8', cctx=zstandard.ZstdCompressor(level=3))
+    return open(path, mode, encoding='utf-8')
+
+
+class JsonStorage:
+    """
+    날짜마다 데이터 파일 하나에 트렌드 데이터를 저장하는 클래스
+    
+    압축하지 않으면 기존처럼 들여쓴 trends_YYYY-MM-DD.json 파일을 쓰고,
+    compression을 지정하면 gzip/zstd로 압축한 JSON Lines 파일(첫 줄은 집계 결과, 이후 한 줄에 기사/블로그 하나)을 씁니다.
+    읽을 때는 압축 방식과 관계없이 그날 있는 파일을 읽으므로 기존 파일과 압축 파일을 함께 사용할 수 있습니다.
+    """
+    
+    def __init__(self, data_dir, compression=None):
+        """
+        JsonStorage 초기화
+        
+        Args:
+            data_dir (str): 데이터 디렉토리
+            compression (str): 새로 쓰는 파일의 압축 방식 ('gzip' 또는 'zstd', 기본값: 압축하지 않음)
+        """
+        if compression not in DATA_FILE_SUFFIXES:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression} (가능한 값: 'gzip', 'zstd')")
+        if compression == 'zstd' and not HAS_ZSTD:
+            raise ImportError("zstd 압축에는 zstandard가 필요합니다.")
+        
+        self.data_dir = Path(data_dir)
+        self.compression = compression
+        self.lock = threading.Lock()
+    
+    def _path(self, date_str, compression):
+        return self.data_dir / f"trends_{date_str}{DATA_FILE_SUFFIXES[compression]}"
+    
+    def path(self, date_str):
+        """
+        특정 날짜의 데이터 파일 경로를 반환합니다. (저장소에 지정한 압축 방식 기준)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            
+        Returns:
+            Path: 데이터 파일 경로
+        """
+        return self._path(date_str, self.compression)
+    
+    def existing_path(self, date_str):
+        """
+        특정 날짜에 실제로 있는 데이터 파일 경로를 반환합니다. (지정한 압축 방식의 파일을 먼저 찾음)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            
+        Returns:
+            Path: 데이터 파일 경로 (없으면 None)
+        """
+        compressions = [self.compression] + [name for name in DATA_FILE_SUFFIXES if name != self.compression]
+        for compression in compressions:
+            path = self._path(date_str, compression)
+            if path.exists():
+                return path
+        return None
+    
+    def save(self, date_str, trend_data):
+        """
+        하루치 트렌드 데이터를 저장합니다. (같은 날짜의 데이터는 다른 압축 방식의 파일까지 모두 대체)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 트렌드 데이터
+        """
+        path = self.path(date_str)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with _open_text(tmp_path, 'w', path) as f:
+            if self.compression is None:
+                json.dump(trend_data, f, ensure_ascii=False, indent=2)
+            else:
+                _write_records(f, trend_data,
+                               trend_data.get('news_trends', {}).get('news_data', []),
+                               trend_data.get('blog_trends', {}).get('all_blogs', []))
+        os.replace(tmp_path, path)
+        
+        # 이전 압축 방식으로 저장된 같은 날짜의 파일 삭제
+        for compression in DATA_FILE_SUFFIXES:
+            if compression != self.compression:
+                try:
+                    self._path(date_str, compression).unlink()
+                except FileNotFoundError:
+                    pass
+    
+    def append(self, date_str, trend_data):
+        """
+        수집 결과를 그날 저장된 데이터에 합쳐 저장합니다.
+        
+        날짜 파일 하나에 저장하므로 파일 전체를 다시 씁니다. (쓰기량이 새 데이터에 비례해야 하면 SQLite 또는 세그먼트 저장소 사용)
+        읽기, 합치기, 쓰기는 한 잠금 안에서 하므로 동시에 추가한 수집 결과가 서로를 덮어쓰지 않습니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 이번 수집 결과
+            
+        Returns:
+            dict: 합쳐서 저장한 트렌드 데이터
+        """
+        with self.lock:
+            merged = merge_trend_data(self.load(date_str), trend_data)
+            self.save(date_str, merged)
+        return merged
+    
+    def update_summary(self, date_str, fields):
+        """
+        그날 저장된 데이터의 집계 결과 일부를 바꿉니다. (기사/블로그는 그대로 유지)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            fields (dict): 바꿀 {키: 값}
+        """
+        with self.lock:
+            trend_data = self.load(date_str)
+            if trend_data is not None:
+                self.save(date_str, dict(trend_data, **fields))
+    
+    def load(self, date_str, item_limit=None):
+        """
+        하루치 트렌드 데이터를 읽습니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            item_limit (int): 기사/블로그 목록을 앞에서부터 최대 몇 개까지 반환할지 (기본값: 모두)
+            
+        Returns:
+            dict: 트렌드 데이터 (없거나 읽을 수 없으면 None)
+        """
+        data_path = self.existing_path(date_str)
+        if data_path is None:
+            return None
+        
+        try:
+            with _open_text(data_path, 'r') as f:
+                if data_path.suffix == '.json':
+                    trend_data = json.load(f)
+                else:
+                    # 압축 파일은 한 줄씩 풀면서 읽고 최대 개수를 넘는 기사/블로그는 해석하지 않음
+                    summary, news_data, blogs = _read_records(f, item_limit)
+                    return _fill_items(summary, news_data, blogs) if summary is not None else None
+        except READ_ERRORS as e:
+            print(f"트렌드 데이터 로드 중 오류 발생 ({data_path.name}): {e}")
+            return None
+        
+        # 파일 전체를 읽은 뒤 목록만 자름
+        if item_limit is not None:
+            if 'news_data' in trend_data.get('news_trends', {}):
+                trend_data['news_trends']['news_data'] = trend_data['news_trends']['news_data'][:item_limit]
+            if 'all_blogs' in trend_data.get('blog_trends', {}):
+                trend_data['blog_trends']['all_blogs'] = trend_data['blog_trends']['all_blogs'][:item_limit]
+        return trend_data
+    
+    def iter_items(self, date_str, kind='news'):
+        """
+        하루치 기사 또는 블로그를 하나씩 읽습니다.
+        
+        압축 파일은 한 줄씩 풀면서 읽으므로 문서 전체를 메모리에 올리지 않고,
+        기사만 읽을 때는 블로그 줄에 닿으면 멈춥니다. (압축하지 않은 기존 파일은 전체를 읽은 뒤 차례로 반환)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            kind (str): 'news' 또는 'blogs'
+            
+        Yields:
+            dict: 기사 또는 블로그 포스트
+        """
+        if kind not in ('news', 'blogs'):
+            raise ValueError(f"지원하지 않는 항목 종류입니다: {kind} (가능한 값: 'news', 'blogs')")
+        
+        data_path = self.existing_path(date_str)
+        if data_path is None:
+            return
+        
+        if data_path.suffix == '.json':
+            trend_data = self.load(date_str) or {}
+            section, key = ITEM_LISTS[0] if kind == 'news' else ITEM_LISTS[1]
+            yield from trend_data.get(section, {}).get(key) or []
+            return
+        
+        prefix = '{"news"' if kind == 'news' else '{"blog"'
+        record_key = 'news' if kind == 'news' else 'blog'
+        with _open_text(data_path, 'r') as f:
+            for line in f:
+                if line.startswith(prefix):
+                    yield json.loads(line)[record_key]
+                elif kind == 'news' and line.startswith('{"blog"'):
+                    break
+    
+    def convert(self):
+        """
+        다른 압축 방식으로 저장된 날짜 파일을 저장소에 지정한 압축 방식으로 다시 씁니다.
+        
+        Returns:
+            dict: {날짜: (이전 파일 크기, 새 파일 크기)} (바이트)
+        """
+        results = {}
+        for date_str in self.dates():
+            data_path = self.existing_path(date_str)
+            if data_path == self.path(date_str):
+                continue
+            
+            trend_data = self.load(date_str)
+            if trend_data is None:
+                continue
+            
+            old_size = data_path.stat().st_size
+            self.save(date_str, trend_data)
+            results[date_str] = (old_size, self.path(date_str).stat().st_size)
+        return results
+    
+    def dates(self):
+        """
+        데이터가 저장된 날짜 목록을 반환합니다.
+        
+        Returns:
+            list: 날짜 목록 (오름차순)
+        """
+        dates = set()
+        for path in self.data_dir.glob('trends_*'):
+            match = DATA_FILE_PATTERN.match(path.name)
+            if match is not None:
+                dates.add(match.group(1))
+        return sorted(dates)
+    
+    def close(self):
+        """저장소를 닫습니다. (파일 저장소는 할 일 없음)"""
+
+
+class SQLiteStorage:
+    """
+    트렌드 데이터를 정규화된 SQLite 테이블에 저장하는 클래스
+    
+    기사와 블로그는 행 단위로(날짜 안의 순서 유지), 소스/카테고리별 키워드 스케치는
+    키워드 빈도 행으로 저장하고, 나머지 집계 결과(상위 키워드, 페이지 수익 등)는 수집 행에 JSON으로 둡니다.
+    """
+    
+    def __init__(self, db_path):
+        """
+        SQLiteStorage 초기화
+        
+        Args:
+            db_path (str): SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        
+        # 웹 요청 스레드와 수집 스레드가 함께 사용하므로 연결 하나를 잠금으로 보호
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self.lock:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA foreign_keys=ON')
+            self.connection.executescript(SCHEMA)
+    
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self.lock:
+            self.connection.close()
+    
+    @staticmethod
+    def _item_row(date_str, position, item, fields):
+        # 알려진 필드는 열로, 나머지 필드(중복 기사 링크 등)는 extra 열에 JSON으로 저장
+        values = [item.get(key) for key, _ in fields]
+        extra = {key: value for key, value in item.items() if key not in dict(fields)}
+        return [date_str, position] + values + [json.dumps(extra, ensure_ascii=False) if extra else None]
+    
+    @staticmethod
+    def _item_dict(row, keys):
+        # 행은 필드 순서의 열 값 뒤에 extra 열
+        item = {key: value for key, value in zip(keys, row) if value is not None}
+        if row[-1]:
+            item.update(json.loads(row[-1]))
+        return item
+    
+    def _write_summary(self, date_str, trend_data):
+        # 행으로 저장하는 목록과 스케치는 자리만 남기고 나머지 집계 결과를 JSON으로 저장
+        # (INSERT OR REPLACE는 외래 키로 그날의 기사/블로그까지 지우므로 UPDATE로 갱신)
+        keyword_sketches = trend_data.get('keyword_sketches')
+        summary = _strip_items(trend_data)
+        if keyword_sketches is not None:
+            summary['keyword_sketches'] = None
+        
+        self.connection.execute(
+            'INSERT INTO collections (date, collection_time, data) VALUES (?, ?, ?) '
+            'ON CONFLICT(date) DO UPDATE SET collection_time = excluded.collection_time, data = excluded.data',
+            (date_str, trend_data.get('collection_time'), json.dumps(summary, ensure_ascii=False))
+        )
+        
+        # 스케치는 크기가 제한된 집계 결과이므로 이번 수집 결과로 교체
+        self.connection.execute('DELETE FROM keyword_sketches WHERE date = ?', (date_str,))
+        for source, sketches in (keyword_sketches or {}).items():
+            scopes = [(None, sketches['overall'])] + list(sketches.get('by_category', {}).items())
+            for category, sketch in scopes:
+                sketch_id = self.connection.execute(
+                    'INSERT INTO keyword_sketches (date, source, category, capacity, floor) VALUES (?, ?, ?, ?, ?)',
+                    (date_str, source, category, sketch['capacity'], sketch['floor'])
+                ).lastrowid
+                self.connection.executemany(
+                    'INSERT INTO keyword_counts (sketch_id, rank, keyword, count, error) VALUES (?, ?, ?, ?, ?)',
+                    ((sketch_id, rank, keyword, count, error) for rank, (keyword, count, error) in enumerate(sketch['items']))
+                )
+    
+    def _upsert_items(self, table, fields, date_str, items):
+        """
+        기사/블로그를 URL 기준으로 그날의 행에 합칩니다. (merge_items와 같은 규칙)
+        
+        이미 있는 URL은 위치를 유지하고 내용이 바뀐 경우에만 행을 갱신하며,
+        새 URL과 URL이 없는 항목은 그날의 마지막 위치 뒤에 추가합니다.
+        
+        Args:
+            table (str): 'articles' 또는 'blogs'
+            fields (tuple): 필드와 열 목록
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            items (list): 이번 수집의 기사/블로그 목록
+            
+        Returns:
+            tuple: (추가한 행 수, 갱신한 행 수)
+        """
+        columns = [column for _, column in fields]
+        url_index = columns.index('url')
+        
+        # 그날 저장된 행의 URL별 (행 번호, 열 값)
+        stored = {}
+        last_position = -1
+        for row in self.connection.execute(
+            f'SELECT id, position, {", ".join(columns)}, extra FROM {table} WHERE date = ?', (date_str,)
+        ):
+            last_position = max(last_position, row[1])
+            if row[2 + url_index]:
+                stored[row[2 + url_index]] = (row[0], list(row[2:]))
+        
+        inserts = []
+        pending = {}
+        updates = {}
+        for item in items:
+            values = self._item_row(date_str, 0, item, fields)[2:]
+            url = item.get('url')
+            if url and url in pending:
+                # 이번 수집 안에서 같은 URL이 다시 나오면 먼저 나온 위치에 나중 내용
+                inserts[pending[url]][2:] = values
+            elif url and url in stored:
+                row_id, stored_values = stored[url]
+                if stored_values != values:
+                    updates[row_id] = values
+            else:
+                last_position += 1
+                if url:
+                    pending[url] = len(inserts)
+                inserts.append([date_str, last_position] + values)
+        
+        placeholders = ', '.join('?' for _ in range(len(columns) + 3))
+        self.connection.executemany(
+            f'INSERT INTO {table} (date, position, {", ".join(columns)}, extra) VALUES ({placeholders})', inserts
+        )
+        assignments = ', '.join(f'{column} = ?' for column in columns + ['extra'])
+        self.connection.executemany(
+            f'UPDATE {table} SET {assignments} WHERE id = ?', (values + [row_id] for row_id, values in updates.items())
+        )
+        return len(inserts), len(updates)
+    
+    def save(self, date_str, trend_data):
+        """
+        하루치 트렌드 데이터를 저장합니다. (같은 날짜의 데이터는 한 트랜잭션에서 교체)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 트렌드 데이터
+        """
+        news_data = trend_data.get('news_trends', {}).get('news_data', [])
+        blogs = trend_data.get('blog_trends', {}).get('all_blogs', [])
+        
+        article_columns = ', '.join(column for _, column in ARTICLE_FIELDS)
+        blog_columns = ', '.join(column for _, column in BLOG_FIELDS)
+        
+        with self.lock, self.connection:
+            # 기사/블로그/스케치 행은 외래 키로 함께 삭제됨
+            self.connection.execute('DELETE FROM collections WHERE date = ?', (date_str,))
+            self._write_summary(date_str, trend_data)
+            self.connection.executemany(
+                f'INSERT INTO articles (date, position, {article_columns}, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (self._item_row(date_str, position, news, ARTICLE_FIELDS) for position, news in enumerate(news_data))
+            )
+            self.connection.executemany(
+                f'INSERT INTO blogs (date, position, {blog_columns}, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (self._item_row(date_str, position, blog, BLOG_FIELDS) for position, blog in enumerate(blogs))
+            )
+    
+    def _read_day(self, date_str, item_limit=None):
+        # 잠금을 잡은 상태에서 호출
+        # SQLite에서 음수 LIMIT은 제한 없음
+        limit = -1 if item_limit is None else item_limit
+        article_columns = ', '.join(column for _, column in ARTICLE_FIELDS)
+        blog_columns = ', '.join(column for _, column in BLOG_FIELDS)
+        
+        row = self.connection.execute('SELECT data FROM collections WHERE date = ?', (date_str,)).fetchone()
+        if row is None:
+            return None
+        
+        articles = self.connection.execute(
+            f'SELECT {article_columns}, extra FROM articles WHERE date = ? ORDER BY position LIMIT ?', (date_str, limit)
+        ).fetchall()
+        blogs = self.connection.execute(
+            f'SELECT {blog_columns}, extra FROM blogs WHERE date = ? ORDER BY position LIMIT ?', (date_str, limit)
+        ).fetchall()
+        counts = self.connection.execute(
+            'SELECT s.id, s.source, s.category, s.capacity, s.floor, c.keyword, c.count, c.error '
+            'FROM keyword_sketches s LEFT JOIN keyword_counts c ON c.sketch_id = s.id '
+            'WHERE s.date = ? ORDER BY s.id, c.rank',
+            (date_str,)
+        ).fetchall()
+        
+        article_keys = [key for key, _ in ARTICLE_FIELDS]
+        blog_keys = [key for key, _ in BLOG_FIELDS]
+        trend_data = _fill_items(json.loads(row[0]),
+                                 [self._item_dict(article, article_keys) for article in articles],
+                                 [self._item_dict(blog, blog_keys) for blog in blogs])
+        
+        if 'keyword_sketches' in trend_data:
+            keyword_sketches = {}
+            sketch_id = None
+            for current_id, source, category, capacity, floor, keyword, count, error in counts:
+                if current_id != sketch_id:
+                    sketch_id = current_id
+                    items = []
+                    sketch = {'capacity': capacity, 'floor': floor, 'items': items}
+                    source_sketches = keyword_sketches.setdefault(source, {'overall': None, 'by_category': {}})
+                    if category is None:
+                        source_sketches['overall'] = sketch
+                    else:
+                        source_sketches['by_category'][category] = sketch
+                if keyword is not None:
+                    items.append([keyword, count, error])
+            trend_data['keyword_sketches'] = keyword_sketches
+        
+        return trend_data
+    
+    def load(self, date_str, item_limit=None):
+        """
+        하루치 트렌드 데이터를 읽습니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            item_limit (int): 기사/블로그 목록을 앞에서부터 최대 몇 개까지 읽을지 (기본값: 모두)
+            
+        Returns:
+            dict: 트렌드 데이터 (없으면 None)
+        """
+        with self.lock:
+            return self._read_day(date_str, item_limit)
+    
+    def append(self, date_str, trend_data):
+        """
+        수집 결과를 그날 저장된 데이터에 합칩니다.
+        
+        그날의 행을 지우고 다시 쓰지 않고, 새 URL의 행만 추가하고 내용이 바뀐 행만 갱신하므로
+        쓰기량은 새 데이터에 비례합니다. 읽기, 합치기, 쓰기를 한 잠금과 한 트랜잭션 안에서 하므로
+        동시에 추가한 수집 결과가 서로를 덮어쓰지 않습니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 이번 수집 결과
+            
+        Returns:
+            dict: 합쳐서 저장한 트렌드 데이터
+        """
+        with self.lock, self.connection:
+            self._write_summary(date_str, trend_data)
+            for (section, key), table, fields in zip(ITEM_LISTS, ('articles', 'blogs'), (ARTICLE_FIELDS, BLOG_FIELDS)):
+                self._upsert_items(table, fields, date_str, trend_data.get(section, {}).get(key, []))
+            return self._read_day(date_str)
+    
+    def update_summary(self, date_str, fields):
+        """
+        그날 저장된 데이터의 집계 결과 일부를 바꿉니다. (기사/블로그 행은 건드리지 않음)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            fields (dict): 바꿀 {키: 값}
+        """
+        with self.lock, self.connection:
+            row = self.connection.execute('SELECT data FROM collections WHERE date = ?', (date_str,)).fetchone()
+            if row is None:
+                return
+            
+            summary = json.loads(row[0])
+            summary.update(fields)
+            self.connection.execute('UPDATE collections SET data = ? WHERE date = ?',
+                                    (json.dumps(summary, ensure_ascii=False), date_str))
+    
+    def dates(self):
+        """
+        데이터가 저장된 날짜 목록을 반환합니다.
+        
+        Returns:
+            list: 날짜 목록 (오름차순)
+        """
+        with self.lock:
+            return [date_str for date_str, in self.connection.execute('SELECT date FROM collections ORDER BY date')]
+    
+    def collection_times(self):
+        """
+        날짜별 수집 시간을 반환합니다.
+        
+        Returns:
+            dict: {날짜: 수집 시간}
+        """
+        with self.lock:
+            return dict(self.connection.execute('SELECT date, collection_time FROM collections'))
+    
+    def import_json(self, data_dir, force=False):
+        """
+        JSON 저장소의 날짜별 파일을 가져옵니다.
+        
+        Args:
+            data_dir (str): trends_YYYY-MM-DD.json 파일이 있는 디렉토리
+            force (bool): 이미 가져온 날짜도 다시 가져올지 여부 (기본값: 수집 시간이 바뀐 날짜만)
+            
+        Returns:
+            dict: {날짜: (기사 수, 블로그 수)}
+        """
+        source = JsonStorage(data_dir)
+        imported = {} if force else self.collection_times()
+        results = {}
+        
+        for date_str in source.dates():
+            trend_data = source.load(date_str)
+            if trend_data is None:
+                continue
+            if date_str in imported and imported[date_str] == trend_data.get('collection_time'):
+                continue
+            
+            # 이전 형식의 네이버 기사/블로그에는 source 필드가 없음
+            for section, key in ITEM_LISTS:
+                for item in trend_data.get(section, {}).get(key, []):
+                    item.setdefault('source', 'naver')
+            
+            self.save(date_str, trend_data)
+            results[date_str] = (len(trend_data.get('news_trends', {}).get('news_data', [])),
+                                 len(trend_data.get('blog_trends', {}).get('all_blogs', [])))
+        
+        return results
+
+
+class SegmentedStorage:
+    """
+    날짜별 디렉토리에 수집 실행마다 세그먼트 파일을 하나씩 추가하는 추가 전용 저장소
+    
+    세그먼트는 JSON Lines 파일(첫 줄은 집계 결과, 이후 한 줄에 기사/블로그 하나)이며,
+    임시 파일에 다 쓴 뒤 이름을 바꾸어 추가하므로 쓰는 도중 중단되어도 기존 세그먼트는 손상되지 않습니다.
+    수집 결과는 이전 세그먼트에 없거나 내용이 바뀐 기사/블로그만 기록하고(쓰기량은 새 데이터에 비례),
+    읽을 때 세그먼트를 순서대로 합칩니다. compact()는 그날의 세그먼트를 중복 없는 파일 하나로 합칩니다.
+    """
+    
+    def __init__(self, root):
+        """
+        SegmentedStorage 초기화
+        
+        Args:
+            root (str): 세그먼트 디렉토리 (날짜별 하위 디렉토리 생성)
+        """
+        self.root = Path(root)
+        self.lock = threading.Lock()
+    
+    def _day_dir(self, date_str):
+        return self.root / date_str
+    
+    @staticmethod
+    def _new_stem():
+        # 이름 순서가 쓰기 순서가 되도록 나노초 시각을 0으로 채운 이름 (프로세스 간 충돌 방지용 pid 포함)
+        return f"{time.time_ns():020d}-{os.getpid()}"
+    
+    def _segment_files(self, date_str):
+        # 가장 최근 압축 파일과 그 이후에 추가된 세그먼트 (읽을 순서)
+        day_dir = self._day_dir(date_str)
+        if not day_dir.is_dir():
+            return []
+        
+        compacts = []
+        segments = []
+        for path in day_dir.iterdir():
+            if path.name.startswith('.') or path.suffix != '.jsonl':
+                continue
+            if path.name.startswith('compact-'):
+                compacts.append(path)
+            else:
+                segments.append(path)
+        
+        files = []
+        through = ''
+        if compacts:
+            latest = max(compacts, key=lambda path: path.stem[len('compact-'):])
+            through = latest.stem[len('compact-'):]
+            files.append(latest)
+        files.extend(sorted((path for path in segments if path.stem > through), key=lambda path: path.stem))
+        return files
+    
+    @staticmethod
+    def _read_segment(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return _read_records(f)
+    
+    def _merge_files(self, files, item_limit=None):
+        summary = None
+        news_data = []
+        blogs = []
+        for path in files:
+            try:
+                segment_summary, segment_news, segment_blogs = self._read_segment(path)
+            except ValueError as e:
+                print(f"세그먼트 로드 중 오류 발생 ({path.name}): {e}")
+                continue
+            
+            # 집계 결과는 마지막 세그먼트, 기사/블로그는 URL 기준으로 합침
+            summary = segment_summary
+            news_data = merge_items(news_data, segment_news)
+            blogs = merge_items(blogs, segment_blogs)
+        
+        if summary is None:
+            return None
+        
+        if item_limit is not None:
+            news_data = news_data[:item_limit]
+            blogs = blogs[:item_limit]
+        return _fill_items(summary, news_data, blogs)
+    
+    def _write(self, date_str, name, trend_data, news_data, blogs):
+        day_dir = self._day_dir(date_str)
+        day_dir.mkdir(parents=True, exist_ok=True)
+        
+        # '.'으로 시작하는 임시 파일은 읽을 때 무시되므로 다 쓴 뒤에만 세그먼트로 보임
+        path = day_dir / name
+        tmp_path = day_dir / f".{name}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            _write_records(f, trend_data, news_data, blogs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return path
+    
+    def _remove(self, paths, keep):
+        for path in paths:
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    
+    def save(self, date_str, trend_data):
+        """
+        하루치 트렌드 데이터를 저장합니다. (그날의 이전 세그먼트를 모두 대체)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 트렌드 데이터
+        """
+        with self.lock:
+            files = self._segment_files(date_str)
+            path = self._write(date_str, f"compact-{self._new_stem()}.jsonl", trend_data,
+                               trend_data.get('news_trends', {}).get('news_data', []),
+                               trend_data.get('blog_trends', {}).get('all_blogs', []))
+            self._remove(files, path)
+    
+    def append(self, date_str, trend_data):
+        """
+        수집 결과를 그날의 새 세그먼트로 추가합니다. (이전 세그먼트에 없거나 내용이 바뀐 기사/블로그만 기록)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 이번 수집 결과
+            
+        Returns:
+            dict: 그날의 세그먼트를 모두 합친 트렌드 데이터
+        """
+        with self.lock:
+            saved_data = self.load(date_str)
+            
+            changed = []
+            for section, key in ITEM_LISTS:
+                items = trend_data.get(section, {}).get(key, [])
+                saved = {item.get('url'): item for item in (saved_data or {}).get(section, {}).get(key, [])}
+                changed.append([item for item in items if not item.get('url') or saved.get(item['url']) != item])
+            
+            self._write(date_str, f"{self._new_stem()}.jsonl", trend_data, *changed)
+        
+        return merge_trend_data(saved_data, trend_data)
+    
+    def update_summary(self, date_str, fields):
+        """
+        그날의 집계 결과 일부를 바꾼 세그먼트를 추가합니다. (기사/블로그 없이 집계 결과만 기록)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            fields (dict): 바꿀 {키: 값}
+        """
+        with self.lock:
+            summary = self.load(date_str, item_limit=0)
+            if summary is not None:
+                self._write(date_str, f"{self._new_stem()}.jsonl", dict(summary, **fields), [], [])
+    
+    def load(self, date_str, item_limit=None):
+        """
+        그날의 세그먼트를 순서대로 합쳐 하루치 트렌드 데이터를 읽습니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            item_limit (int): 기사/블로그 목록을 앞에서부터 최대 몇 개까지 반환할지 (기본값: 모두)
+            
+        Returns:
+            dict: 트렌드 데이터 (없으면 None)
+        """
+        for _ in range(3):
+            try:
+                return self._merge_files(self._segment_files(date_str), item_limit)
+            except FileNotFoundError:
+                # 읽는 도중 압축으로 세그먼트가 지워졌으면 목록을 다시 읽음
+                continue
+        return None
+    
+    def compact(self, date_str):
+        """
+        그날의 세그먼트를 중복 없는 파일 하나로 합칩니다. (압축 중에 추가된 세그먼트는 유지)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            
+        Returns:
+            int: 합친 세그먼트 수 (합칠 것이 없으면 0)
+        """
+        with self.lock:
+            files = self._segment_files(date_str)
+            if not files or (len(files) == 1 and files[0].name.startswith('compact-')):
+                return 0
+            
+            trend_data = self._merge_files(files)
+            if trend_data is None:
+                return 0
+            
+            # 새 압축 파일은 마지막으로 합친 세그먼트까지를 대체
+            path = self._write(date_str, f"compact-{files[-1].stem}.jsonl", trend_data,
+                               trend_data.get('news_trends', {}).get('news_data', []),
+                               trend_data.get('blog_trends', {}).get('all_blogs', []))
+            self._remove(files, path)
+            return len(files)
+    
+    def compact_all(self):
+        """
+        세그먼트가 여러 개인 모든 날짜를 압축합니다.
+        
+        Returns:
+            dict: {날짜: 합친 세그먼트 수}
+        """
+        results = {}
+        for date_str in self.dates():
+            folded = self.compact(date_str)
+            if folded:
+                results[date_str] = folded
+        return results
+    
+    def dates(self):
+        """
+        데이터가 저장된 날짜 목록을 반환합니다.
+        
+        Returns:
+            list: 날짜 목록 (오름차순)
+        """
+        if not self.root.exists():
+            return []
+        return sorted(path.name for path in self.root.iterdir() if path.is_dir() and self._segment_files(path.name))
+    
+    def close(self):
+        """저장소를 닫습니다. (파일 저장소는 할 일 없음)"""
+
+
+STORAGE_BACKENDS = ('sqlite', 'segments', 'json')
+
+
+def get_storage(backend, data_dir, compression=None):
+    """
+    트렌드 데이터 저장소를 생성합니다.
+    
+    Args:
+        backend (str): 'sqlite'(data_dir/trends.db), 'segments'(data_dir/segments의 날짜별 세그먼트)
+                       또는 'json'(날짜별 trends_YYYY-MM-DD.json 파일)
+        data_dir (str): 데이터 디렉토리
+        compression (str): 'json' 저장소의 날짜 파일 압축 방식 ('gzip' 또는 'zstd', 기본값: 압축하지 않음,
+                           다른 저장소에 지정하면 ValueError)
+        
+    Returns:
+        SQLiteStorage | SegmentedStorage | JsonStorage: 저장소
+    """
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"지원하지 않는 저장소입니다: {backend} (가능한 값: {list(STORAGE_BACKENDS)})")
+    
+    # 압축은 날짜별 JSON 파일에만 적용되므로 다른 저장소에서 조용히 무시하지 않음
+    if compression is not None and backend != 'json':
+        raise ValueError(f"압축은 'json' 저장소에서만 사용할 수 있습니다: storage_backend={backend}, compression={compression}")
+    
+    if backend == 'sqlite':
+        return SQLiteStorage(Path(data_dir) / 'trends.db')
+    if backend == 'segments':
+        return SegmentedStorage(Path(data_dir) / 'segments')
+    return JsonStorage(data_dir, compression)
+
+
+def existing_storages(data_dir):
+    """
+    데이터 디렉토리에 있는 저장소를 모두 엽니다. (색인/아카이브 명령이 저장 방식과 관계없이 전체 날짜를 읽기 위함)
+    
+    Args:
+        data_dir (str): 데이터 디렉토리
+        
+    Returns:
+        list: 저장소 목록 (SQLite, 세그먼트, JSON 파일 순서)
+    """
+    data_dir = Path(data_dir)
+    storages = []
+    if (data_dir / 'trends.db').exists():
+        storages.append(SQLiteStorage(data_dir / 'trends.db'))
+    if (data_dir / 'segments').is_dir():
+        storages.append(SegmentedStorage(data_dir / 'segments'))
+    storages.append(JsonStorage(data_dir))
+    return storages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='트렌드 데이터 저장소 관리')
+    parser.add_argument('command', choices=['import', 'compact', 'convert'],
+                        help='import: trends_* 파일을 SQLite 저장소로 가져오기, compact: 날짜별 세그먼트를 파일 하나로 합치기, '
+                             'convert: trends_* 파일을 지정한 압축 방식으로 다시 쓰기')
+    parser.add_argument('--data-dir', default=str(Path(__file__).resolve().parents[2] / 'data'), help='데이터 디렉토리')
+    parser.add_argument('--db', help='SQLite 저장소 경로 (기본값: 데이터 디렉토리의 trends.db)')
+    parser.add_argument('--force', action='store_true', help='이미 가져온 날짜도 다시 가져오기')
+    parser.add_argument('--compression', choices=['none', 'gzip', 'zstd'], default='zstd',
+                        help='convert 명령의 압축 방식 (none이면 압축하지 않은 JSON 파일로 되돌림)')
+    args = parser.parse_args(argv)
+    
+    if args.command == 'convert':
+        storage = JsonStorage(args.data_dir, None if args.compression == 'none' else args.compression)
+        results = storage.convert()
+        for date_str, (old_size, new_size) in results.items():
+            print(f"{date_str}: {old_size:,} -> {new_size:,} 바이트")
+        print(f"변환한 날짜: {len(results)}일")
+        return 0
+    
+    if args.command == 'compact':
+        storage = SegmentedStorage(Path(args.data_dir) / 'segments')
+        results = storage.compact_all()
+        for date_str, folded in results.items():
+            print(f"{date_str}: 세그먼트 {folded}개 합침")
+        print(f"압축한 날짜: {len(results)}일")
+        return 0
+    
+    storage = SQLiteStorage(args.db or Path(args.data_dir) / 'trends.db')
+    results = storage.import_json(args.data_dir, force=args.force)
+    for date_str, (news_count, blog_count) in results.items():
+        print(f"{date_str}: 기사 {news_count}개, 블로그 {blog_count}개")
+    print(f"가져온 날짜: {len(results)}일")
+    storage.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
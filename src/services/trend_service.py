@@ -1,23 +1,88 @@
 from src.crawlers import NaverNewsCrawler, NaverBlogCrawler, DaumNewsCrawler, DaumBlogCrawler
+from src.services.pagination import PageDepthPlanner
+from src.services.keyword_stats import KeywordStatsStore
+from src.services.search_index import SearchIndex
+from src.services.storage import JsonStorage, get_storage, merge_items
+from src.services.archive import ColumnarArchive, HAS_PYARROW
+from src.services.rollups import DailyRollupStore, build_rollup, summarize
+from src.utils import HostRateLimiter, HttpClient, ResponseCache, SeenUrlIndex, get_parser
+from src.utils import FixtureArchive, enable_recording, enable_replay
+from src.utils import KeywordEngine, TokenCache, TopicMatcher, get_tokenizer
+from src.utils import DuplicateFilter, NearDuplicateIndex, SpaceSaving, TermMatrix
+from src.utils import KeywordIndex
+from src.utils.term_matrix import HAS_SCIPY
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-import json
 import os
 from pathlib import Path
+from urllib.parse import urlparse
 import threading
 import time
-import re
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 # pandas 의존성 제거
 
 class TrendService:
     """트렌드 데이터를 수집하고 관리하는 서비스 클래스"""
     
-    def __init__(self, data_dir=None):
+    # 경제 관련 기사/블로그 분류에 사용하는 기본 어휘
+    ECONOMY_KEYWORDS = [
+        '경제', '금융', '주식', '상승', '하락', '원화', '달러', '환율',
+        '금리', '인플레', '인플레이션', '디플레', '디플레이션', '물가',
+        '재테크', '재무', '투자', '시장', '무역', '수출', '수입', '관세',
+        '환율', '상품', '사업', '기업', '산업', '일자리', '고용', '실업',
+        'GDP', '국내총생산', '경제성장', '경제위기', '경제정책', '기준금리',
+        '중앙은행', '세금', '세제', '세수', '세정', '예산', '부채', '국채'
+    ]
+    
+    def __init__(self, data_dir=None, rate_limits=None, max_workers=4, max_concurrency=8,
+                 use_http_cache=True, http_cache_max_bytes=100 * 1024 * 1024, parser_backend=None,
+                 pages_per_category=2, adaptive_pagination=False, page_budget=None, max_pages_per_category=5,
+                 fixture_path=None, fixture_mode=None, tokenizer=None, morph_analyzer='Okt', morph_workers=None,
+                 token_cache_size=20000, topic_lexicons=None, near_duplicates=True, analytics_backend=None,
+                 search_index=True, storage_backend='sqlite', columnar_archive=True, storage_compression=None):
         """
         TrendService 초기화
         
         Args:
             data_dir (str): 데이터를 저장할 디렉토리 경로 (기본값: 프로젝트 루트의 data 디렉토리)
+            rate_limits (dict): 호스트별 요청 제한 {호스트: (초당 요청 수, 버스트 크기)} (기본값: HostRateLimiter.DEFAULT_LIMITS)
+            max_workers (int): 뉴스 페이지를 동시에 가져올 최대 작업자 수 (크롤러 직접 호출 시)
+            max_concurrency (int): collect_trends 실행 시 전체 소스에 걸친 최대 동시 요청 수
+            use_http_cache (bool): 목록/검색 페이지 응답을 data_dir/http_cache에 캐시할지 여부
+            http_cache_max_bytes (int): 응답 캐시의 최대 크기 (바이트)
+            parser_backend (str): HTML 파서 백엔드 ('lxml' 또는 'bs4', 기본값: 사용 가능한 가장 빠른 백엔드)
+            pages_per_category (int): 카테고리별로 크롤링할 뉴스 페이지 수 (고정 모드)
+            adaptive_pagination (bool): 카테고리별 최근 페이지 수익에 따라 뉴스 페이지 수를 조절할지 여부
+            page_budget (int): 적응형 모드에서 한 번의 수집에 사용할 전체 뉴스 페이지 요청 수 (기본값: 카테고리 수 x pages_per_category)
+            max_pages_per_category (int): 적응형 모드에서 카테고리별 최대 페이지 수
+            fixture_path (str): HTTP 요청/응답 픽스처 아카이브 경로 (.jsonl.gz)
+            fixture_mode (str): 'record'이면 모든 요청/응답을 아카이브에 기록, 'replay'이면 네트워크 대신 아카이브로 응답
+            tokenizer (str): 키워드 추출 토크나이저 ('whitespace' 또는 'morph', 기본값: 'whitespace')
+            morph_analyzer (str): 형태소 토크나이저에서 사용할 konlpy 분석기 이름
+            morph_workers (int): 형태소 분석 작업자 프로세스 수 (기본값: CPU 코어 수)
+            token_cache_size (int): 기사별 단어 빈도 캐시에 유지할 최대 기사 수 (0이면 캐시 사용 안 함)
+            topic_lexicons (dict): 주제별 추가 어휘 {주제: 단어 목록} ('economy'이면 기본 경제 어휘에 추가)
+            near_duplicates (bool): 언론사/소스 간 유사 중복 기사를 하나로 묶어 한 번만 집계할지 여부
+            analytics_backend (str): 리포트 키워드 집계 방식 ('matrix'이면 희소 행렬 연산, 'python'이면 사전 누적,
+                                     기본값: numpy/scipy가 있으면 'matrix')
+            search_index (bool): 수집한 기사/블로그를 data_dir/search.db 전문 검색 색인에 추가할지 여부
+            storage_backend (str): 트렌드 데이터 저장 방식 ('sqlite'이면 data_dir/trends.db의 정규화된 테이블,
+                                   'segments'이면 data_dir/segments에 수집마다 추가하는 세그먼트 파일,
+                                   'json'이면 날짜별 trends_YYYY-MM-DD.json 파일)
+            storage_compression (str): 'json' 저장소의 날짜 파일 압축 방식 ('gzip' 또는 'zstd', 기본값: 압축하지 않음,
+                                       읽을 때는 압축 방식과 관계없이 그날 있는 파일을 읽음,
+                                       다른 저장소와 함께 지정하면 ValueError)
+            columnar_archive (bool): 수집한 기사/블로그를 data_dir/archive에 날짜별 Parquet 분할로도 저장할지 여부
+                                     (pyarrow가 없으면 저장하지 않음)
         """
+        if analytics_backend not in (None, 'matrix', 'python'):
+            raise ValueError(f"유효한 집계 방식이 아닙니다: {analytics_backend} (가능한 값: 'matrix', 'python')")
+        if fixture_mode not in (None, 'record', 'replay'):
+            raise ValueError(f"유효한 픽스처 모드가 아닙니다: {fixture_mode} (가능한 값: 'record', 'replay')")
+        if fixture_mode is not None and fixture_path is None:
+            raise ValueError("픽스처 모드를 사용하려면 fixture_path가 필요합니다.")
+        
         if data_dir is None:
             self.data_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))) / 'data'
         else:
@@ -26,11 +91,99 @@ class TrendService:
         # 데이터 디렉토리가 없으면 생성
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
+        # 날짜별 트렌드 데이터 저장소
+        # (새 저장소로 아직 가져오지 않은 날짜는 기존 JSON 파일 또는 압축 파일에서 읽음)
+        self.storage = get_storage(storage_backend, self.data_dir, storage_compression)
+        self.legacy_storage = JsonStorage(self.data_dir) if storage_backend != 'json' else None
+        
+        # 모든 크롤러가 공유하는 호스트별 요청 속도 제한기
+        self.rate_limiter = HostRateLimiter(limits=rate_limits)
+        
+        self.max_concurrency = max_concurrency
+        
+        # 조건부 요청 재검증 및 파싱 결과 재사용을 위한 응답 캐시
+        # (녹화 시에는 304 응답에 본문이 없으므로 캐시를 사용하지 않음)
+        if fixture_mode == 'record':
+            use_http_cache = False
+        self.http_cache = ResponseCache(self.data_dir / 'http_cache', max_bytes=http_cache_max_bytes) if use_http_cache else None
+        
+        # 모든 크롤러가 공유하는 HTTP 클라이언트 (호스트별 연결 풀 유지)
+        self.http_client = HttpClient(pool_maxsize=max(10, max_workers, max_concurrency), cache=self.http_cache)
+        
+        # 픽스처 녹화/재생 설정
+        self.fixture_mode = fixture_mode
+        self.fixture_archive = FixtureArchive(fixture_path) if fixture_mode is not None else None
+        self.replay_adapter = None
+        if fixture_mode == 'record':
+            enable_recording(self.http_client, self.fixture_archive)
+        elif fixture_mode == 'replay':
+            self.replay_adapter = enable_replay(self.http_client, self.fixture_archive)
+            # 오프라인 재생에서는 요청 속도 제한이 필요 없음
+            self.rate_limiter.enabled = False
+        
+        # 모든 크롤러가 공유하는 HTML 파서 (선택자 컴파일 결과 공유)
+        self.parser = get_parser(parser_backend)
+        
+        # 기사별 단어 빈도 캐시 (같은 기사를 다시 집계할 때 토큰화 생략, 날짜별 파일로 저장)
+        self.token_cache = TokenCache(max_entries=token_cache_size) if token_cache_size else None
+        if self.token_cache is not None:
+            self.token_cache.load(self._get_token_cache_path())
+        
+        # 뉴스 크롤러와 리포트가 공유하는 키워드 추출 엔진
+        # (형태소 모드에서는 조사를 떼어 낸 명사로 집계, konlpy가 없으면 공백 기준으로 대체)
+        if tokenizer is None or tokenizer == 'whitespace':
+            keyword_tokenizer = get_tokenizer()
+        else:
+            keyword_tokenizer = get_tokenizer(tokenizer, analyzer=morph_analyzer, max_workers=morph_workers)
+        self.keyword_engine = KeywordEngine(tokenizer=keyword_tokenizer, token_cache=self.token_cache)
+        
+        # 리포트용 문서 x 단어 희소 행렬 집계 (numpy/scipy가 없으면 사전 누적으로 대체)
+        if analytics_backend == 'matrix' and not HAS_SCIPY:
+            print("numpy/scipy가 설치되어 있지 않아 사전 기반 키워드 집계를 사용합니다.")
+        self.use_term_matrix = HAS_SCIPY and analytics_backend != 'python'
+        self._news_matrix_cache = (None, None)
+        
+        # 날짜별 키워드 역색인 캐시 {날짜: (파일 수정 시각, KeywordIndex)}
+        self._keyword_indexes = OrderedDict()
+        self._keyword_index_lock = threading.Lock()
+        
+        # 기사/블로그 전문 검색 색인 (SQLite FTS5, 날짜에 걸쳐 누적)
+        self.search_index = SearchIndex(self.data_dir / 'search.db') if search_index else None
+        
+        # 기간 분석용 날짜별 Parquet 아카이브 (pyarrow가 없으면 사용 안 함)
+        self.archive = ColumnarArchive(self.data_dir / 'archive') if columnar_archive and HAS_PYARROW else None
+        
+        # 주간/기간 리포트용 날짜별 요약 (상위 키워드, 기사 수, 주요 기사, 단어 빈도 스케치)
+        self.rollups = DailyRollupStore(self.data_dir / 'rollups')
+        
         # 크롤러 초기화
-        self.naver_news_crawler = NaverNewsCrawler()
-        self.naver_blog_crawler = NaverBlogCrawler()
-        self.daum_news_crawler = DaumNewsCrawler()
-        self.daum_blog_crawler = DaumBlogCrawler()
+        crawler_options = {'rate_limiter': self.rate_limiter, 'http_client': self.http_client, 'parser': self.parser}
+        self.naver_news_crawler = NaverNewsCrawler(max_workers=max_workers, keyword_engine=self.keyword_engine, **crawler_options)
+        self.naver_blog_crawler = NaverBlogCrawler(**crawler_options)
+        self.daum_news_crawler = DaumNewsCrawler(max_workers=max_workers, keyword_engine=self.keyword_engine, **crawler_options)
+        self.daum_blog_crawler = DaumBlogCrawler(**crawler_options)
+        
+        # 주제 분류용 어휘 사전과 다중 패턴 자동자 (한 번만 생성)
+        self.topic_lexicons = {'economy': list(self.ECONOMY_KEYWORDS)}
+        for topic, terms in (topic_lexicons or {}).items():
+            self.topic_lexicons.setdefault(topic, []).extend(terms)
+        self.topic_matcher = TopicMatcher(self.topic_lexicons)
+        self._economy_blog_matcher = (None, None)
+        
+        # 이미 저장한 기사/블로그 URL 인덱스 (증분 수집용)
+        self.seen_index = SeenUrlIndex(self.data_dir / 'seen_urls.idx')
+        
+        # 유사 중복 기사 인덱스 (MinHash + LSH, 소스와 날짜에 걸쳐 유지)
+        self.duplicate_index = NearDuplicateIndex(self.data_dir / 'near_duplicates.idx') if near_duplicates else None
+        
+        # 카테고리별 페이지 수 결정 (고정 또는 적응형 모드)
+        self.pages_per_category = pages_per_category
+        self.adaptive_pagination = adaptive_pagination
+        self.page_budget = page_budget
+        self.page_planner = PageDepthPlanner(self.data_dir / 'page_yields.json', max_pages=max_pages_per_category)
+        
+        # 키워드별 일간 빈도 기준선 (급상승 키워드 계산용)
+        self.keyword_stats = KeywordStatsStore(self.data_dir / 'keyword_stats.json')
         
         # 최근 수집 데이터 캐시
         self.recent_data = None
@@ -40,104 +193,191 @@ class TrendService:
         self.collection_thread = None
         self.is_collecting = False
     
-    def _get_data_path(self, date_str=None):
+    def _load_trends(self, date_str=None, item_limit=None):
+        """
+        저장소에서 특정 날짜의 트렌드 데이터를 읽습니다.
+        
+        Args:
+            date_str (str): 날짜 문자열 (YYYY-MM-DD 형식, 기본값: 오늘)
+            item_limit (int): 기사/블로그 목록을 앞에서부터 최대 몇 개까지 읽을지 (기본값: 모두)
+            
+        Returns:
+            dict: 트렌드 데이터 (없거나 읽을 수 없으면 None)
+        """
+        if date_str is None:
+            date_str = datetime.now().strftime('%Y-%m-%d')
+        
+        trend_data = self.storage.load(date_str, item_limit)
+        if trend_data is None and self.legacy_storage is not None:
+            trend_data = self.legacy_storage.load(date_str, item_limit)
+        return trend_data
+    
+    def _get_keyword_index_path(self, date_str=None):
         """
-        특정 날짜의 데이터 파일 경로를 반환합니다.
+        특정 날짜의 키워드 역색인 파일 경로를 반환합니다.
         
         Args:
             date_str (str): 날짜 문자열 (YYYY-MM-DD 형식, 기본값: 오늘)
             
         Returns:
-            Path: 데이터 파일 경로
+            Path: 역색인 파일 경로
         """
         if date_str is None:
             date_str = datetime.now().strftime('%Y-%m-%d')
         
-        return self.data_dir / f"trends_{date_str}.json"
+        return self.data_dir / f"keyword_index_{date_str}.json"
     
-    def collect_trends(self, categories=None, keywords=None, save=True, sources=None):
+    def _get_token_cache_path(self, date_str=None):
+        """
+        특정 날짜의 토큰 캐시 파일 경로를 반환합니다.
+        
+        Args:
+            date_str (str): 날짜 문자열 (YYYY-MM-DD 형식, 기본값: 오늘)
+            
+        Returns:
+            Path: 토큰 캐시 파일 경로
+        """
+        if date_str is None:
+            date_str = datetime.now().strftime('%Y-%m-%d')
+        
+        return self.data_dir / f"tokens_{date_str}.json"
+    
+    def collect_trends(self, categories=None, keywords=None, save=True, sources=None, incremental=False):
         """
         트렌드 데이터를 수집합니다.
         
+        비동기 수집 엔진(collect_trends_async)을 새 이벤트 루프에서 실행하는 동기 래퍼입니다.
+        
         Args:
             categories (list): 수집할 뉴스 카테고리 목록 (기본값: 모든 카테고리)
             keywords (list): 수집할 블로그 키워드 목록 (기본값: 뉴스에서 추출한 상위 키워드)
             save (bool): 수집한 데이터를 파일로 저장할지 여부
             sources (list): 사용할 데이터 소스 (기본값: ['naver', 'daum'])
+            incremental (bool): 이미 저장한 기사/블로그를 건너뛰고 새 항목만 오늘 데이터에 추가할지 여부
+            
+        Returns:
+            dict: 수집한 트렌드 데이터
+        """
+        return asyncio.run(self.collect_trends_async(categories=categories, keywords=keywords, save=save,
+                                                     sources=sources, incremental=incremental))
+    
+    async def collect_trends_async(self, categories=None, keywords=None, save=True, sources=None, incremental=False):
+        """
+        트렌드 데이터를 비동기로 수집합니다.
+        
+        소스별 뉴스 수집과 소스/키워드별 블로그 검색을 동시에 실행하며,
+        전체 동시 요청 수는 self.max_concurrency로 제한됩니다.
+        
+        Args:
+            categories (list): 수집할 뉴스 카테고리 목록 (기본값: 모든 카테고리)
+            keywords (list): 수집할 블로그 키워드 목록 (기본값: 뉴스에서 추출한 상위 키워드)
+            save (bool): 수집한 데이터를 파일로 저장할지 여부
+            sources (list): 사용할 데이터 소스 (기본값: ['naver', 'daum'])
+            incremental (bool): 이미 저장한 기사/블로그를 건너뛰고 새 항목만 오늘 데이터에 추가할지 여부
             
         Returns:
             dict: 수집한 트렌드 데이터
         """
         if sources is None:
             sources = ['naver', 'daum']
-            
+        
+        # 블로킹 요청을 처리할 실행기와 전역 동시 요청 수 제한
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        loop.set_default_executor(executor)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        try:
+            return await self._collect_trends(categories, keywords, save, sources, incremental, semaphore)
+        finally:
+            executor.shutdown(wait=False)
+    
+    async def _collect_trends(self, categories, keywords, save, sources, incremental, semaphore):
+        """collect_trends_async의 실제 수집 및 집계 로직입니다."""
+        # 증분 수집 시 이미 저장한 URL은 건너뜀
+        seen_index = self.seen_index if incremental else None
+        
+        # 오늘 저장된 데이터 (증분 수집 여부와 관계없이 유사 중복 기사를 오늘 저장된 대표 기사와 비교하기 위해 미리 로드)
+        saved_data = self._load_saved_trends()
+        
         all_news_data = []
-        all_news_keywords = []
         all_blog_data = []
-        category_keywords = {}
+        source_sketches = {}
         
-        # 네이버 뉴스 수집
+        # 뉴스 수집 (소스별 동시 실행)
+        news_crawlers = []
         if 'naver' in sources:
             print("\n네이버 뉴스 수집 중...")
-            naver_news_trends = self.naver_news_crawler.get_trending_keywords(categories=categories, pages_per_category=2)
-            all_news_data.extend(naver_news_trends['news_data'])
-            all_news_keywords.extend(naver_news_trends['overall'])
-            
-            # 카테고리별 키워드 통합
-            for category, keywords_list in naver_news_trends['by_category'].items():
-                if category not in category_keywords:
-                    category_keywords[category] = []
-                category_keywords[category].extend(keywords_list)
-        
-        # 다음 뉴스 수집
+            news_crawlers.append(('naver', self.naver_news_crawler))
         if 'daum' in sources:
             print("\n다음 뉴스 수집 중...")
-            daum_news_trends = self.daum_news_crawler.get_trending_keywords(categories=categories, pages_per_category=2)
-            all_news_data.extend(daum_news_trends['news_data'])
-            all_news_keywords.extend(daum_news_trends['overall'])
-            
-            # 카테고리별 키워드 통합
-            for category, keywords_list in daum_news_trends['by_category'].items():
-                if category not in category_keywords:
-                    category_keywords[category] = []
-                category_keywords[category].extend(keywords_list)
-        
-        # 키워드 빈도수 계산
-        keyword_freq = {}
-        for keyword in all_news_keywords:
-            if keyword in keyword_freq:
-                keyword_freq[keyword] += 1
-            else:
-                keyword_freq[keyword] = 1
+            news_crawlers.append(('daum', self.daum_news_crawler))
+        
+        # 소스/카테고리별 페이지 수 결정
+        pagination = self._plan_pagination(news_crawlers, categories)
         
-        # 빈도수 기준 상위 키워드 추출
-        sorted_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)
-        top_keywords = [keyword for keyword, freq in sorted_keywords[:20]]
+        # 모든 소스의 페이지를 동시에 가져온 뒤 소스 순서(네이버, 다음)대로 집계
+        # (중복 기사의 대표 기사가 실행마다 같은 소스에서 정해지도록 순서를 고정)
+        fetched_pages = await asyncio.gather(*[
+            crawler.fetch_pages_async(categories=categories, pages_per_category=pagination['pages'][source],
+                                      semaphore=semaphore, seen_index=seen_index)
+            for source, crawler in news_crawlers
+        ])
+        
+        duplicates = None
+        if self.duplicate_index is not None:
+            known_records = saved_data.get('news_trends', {}).get('news_data', []) if saved_data else ()
+            duplicates = DuplicateFilter(self.duplicate_index, known_records)
+        
+        # 소스 순서(네이버, 다음)대로 결과 통합
+        pagination_report = {}
+        page_yields = {}
+        for (source, crawler), pages in zip(news_crawlers, fetched_pages):
+            crawler_categories = categories if categories is not None else list(crawler.categories.keys())
+            # 페이지 수익은 증분 수집 여부와 관계없이 이전에 저장한 URL 기준으로 계산
+            news_trends = crawler.build_trends(crawler_categories, pages, 20, seen_index, duplicates,
+                                               yield_index=self.seen_index)
+            
+            # 페이지 수익 (저장할 때만 기록)
+            page_yields[source] = news_trends['page_yields']
+            pagination_report[source] = {
+                category: {
+                    'pages': pagination['pages'][source].get(category, 0),
+                    'yields': yields
+                }
+                for category, yields in news_trends['page_yields'].items()
+            }
+            
+            all_news_data.extend(news_trends['news_data'])
+            
+            # 소스별 전체/카테고리별 단어 빈도 스케치
+            source_sketches[source] = {
+                'overall': news_trends['keyword_sketch'],
+                'by_category': news_trends['category_sketches']
+            }
+        
+        top_keywords, category_keywords, keyword_sketches = self._aggregate_keywords(source_sketches)
         
         # 키워드가 지정되지 않은 경우 뉴스에서 추출한 키워드 사용
         if keywords is None:
             keywords = top_keywords[:5]  # 상위 5개 키워드만 사용
         
-        # 블로그 데이터 수집
+        # 블로그 데이터 수집 (소스/키워드별 동시 실행)
+        blog_crawlers = []
         if 'naver' in sources:
             print("\n네이버 블로그 수집 중...")
-            naver_blog_trends = self.naver_blog_crawler.get_trending_blogs(keywords, pages_per_keyword=1)
-            all_blog_data.extend(naver_blog_trends['all_blogs'])
-        
+            blog_crawlers.append(self.naver_blog_crawler)
         if 'daum' in sources:
             print("\n다음 블로그 수집 중...")
-            daum_blog_trends = self.daum_blog_crawler.get_trending_blogs(keywords, pages_per_keyword=1)
-            all_blog_data.extend(daum_blog_trends['all_blogs'])
-        
-        # 카테고리별 키워드 중복 제거
-        for category in category_keywords:
-            unique_keywords = []
-            seen = set()
-            for keyword in category_keywords[category]:
-                if keyword not in seen:
-                    seen.add(keyword)
-                    unique_keywords.append(keyword)
-            category_keywords[category] = unique_keywords[:10]  # 상위 10개만 유지
+            blog_crawlers.append(self.daum_blog_crawler)
+        
+        blog_results = await asyncio.gather(*[
+            crawler.get_trending_blogs_async(keywords, pages_per_keyword=1, semaphore=semaphore, seen_index=seen_index)
+            for crawler in blog_crawlers
+        ])
+        
+        for blog_trends in blog_results:
+            all_blog_data.extend(blog_trends['all_blogs'])
         
         # 결과 데이터 구성
         trend_data = {
@@ -151,28 +391,586 @@ class TrendService:
                 'all_blogs': all_blog_data
             },
             'top_keywords': top_keywords[:10],  # 상위 10개 키워드
-            'sources': sources
+            # 날짜 범위 상위 키워드 계산용 소스/카테고리별 단어 빈도 스케치 (저장할 때는 그날의 기사 전체 기준으로 다시 집계)
+            'keyword_sketches': keyword_sketches,
+            'sources': sources,
+            'duplicates': duplicates.stats() if duplicates is not None else None,
+            'pagination': {
+                'mode': pagination['mode'],
+                'budget': pagination['budget'],
+                'by_source': pagination_report
+            }
         }
         
+        # 녹화한 요청/응답을 아카이브에 저장
+        if self.fixture_mode == 'record':
+            self.fixture_archive.save()
+        
+        # 증분 수집: 오늘 이미 저장된 기사/블로그 뒤에 새 항목만 추가 (키워드 집계도 합친 기사 기준)
+        if incremental:
+            trend_data = self._merge_with_saved(trend_data, saved_data)
+        elif save and saved_data is not None:
+            # 오늘 저장된 대표 기사에 이번에 추가한 중복 기사 링크도 함께 저장
+            news_trends = trend_data['news_trends']
+            if duplicates is not None:
+                news_trends['news_data'] = merge_items(news_trends['news_data'], duplicates.linked_records())
+            
+            # 저장소가 기사를 그날 저장된 기사와 합치므로 키워드 집계도 합친 기사 기준으로 다시 계산
+            saved_news = saved_data.get('news_trends', {}).get('news_data', [])
+            self._recount_keywords(trend_data, merge_items(saved_news, news_trends['news_data']))
+        
+        # 저장하지 않는 수집은 키워드 기준선을 바꾸지 않고 이번 결과의 급상승 키워드만 계산
+        if not save:
+            trend_data['rising_keywords'] = self.keyword_stats.rising_keywords(counts=self._keyword_counts(trend_data))
+        
         # 데이터 캐싱
         self.recent_data = trend_data
         self.last_collected = datetime.now()
         
-        # 파일로 저장
+        # 저장소에 저장 (오늘 먼저 수집한 데이터와 합친 결과를 이후 색인과 캐시에 사용)
         if save:
-            data_path = self._get_data_path()
-            with open(data_path, 'w', encoding='utf-8') as f:
-                json.dump(trend_data, f, ensure_ascii=False, indent=2)
+            today = datetime.now().strftime('%Y-%m-%d')
+            trend_data = self._save_trends(trend_data)
+            
+            # 오늘 저장된 기사 전체로 키워드 기준선을 갱신하고 급상승 키워드를 그날 데이터에 기록
+            trend_data['rising_keywords'] = self._update_keyword_stats(today, trend_data)
+            self.storage.update_summary(today, {'rising_keywords': trend_data['rising_keywords']})
+            self.recent_data = trend_data
+            
+            # 저장한 URL을 인덱스에 기록
+            self.seen_index.add_all(all_news_data)
+            self.seen_index.add_all(all_blog_data)
+            self.seen_index.save()
+            
+            if self.duplicate_index is not None:
+                self.duplicate_index.save()
+            
+            # 소스/카테고리별 페이지 수익 기록 (다음 수집의 페이지 수 결정에 사용)
+            for source, yields in page_yields.items():
+                self.page_planner.record(source, yields)
+            self.page_planner.save()
+            
+            self.keyword_stats.save()
+            
+            # 키워드 -> 기사/블로그 역색인 저장 (드릴다운 조회용)
+            self._save_keyword_index(trend_data)
+            
+            # 새 기사/블로그를 전문 검색 색인에 추가
+            if self.search_index is not None:
+                self.search_index.ingest_day(datetime.now().strftime('%Y-%m-%d'), trend_data)
+            
+            # 오늘 분할을 컬럼형 아카이브에 저장 (같은 날짜는 교체)
+            if self.archive is not None:
+                self.archive.write_day(datetime.now().strftime('%Y-%m-%d'), trend_data)
+            
+            # 오늘의 요약을 다시 만들어 저장 (주간/기간 리포트용)
+            self._save_rollup(datetime.now().strftime('%Y-%m-%d'), trend_data)
+            
+            # 오늘 집계한 기사별 단어 빈도 저장 (리포트 생성 및 다음 실행 시 재사용)
+            if self.token_cache is not None:
+                self.token_cache.save(self._get_token_cache_path())
         
         return trend_data
     
-    def get_trends(self, date_str=None, force_collect=False):
+    def _save_trends(self, trend_data):
+        """
+        수집 결과를 오늘 날짜로 저장소에 추가합니다.
+        
+        오늘 먼저 수집한 기사/블로그는 유지되며 같은 URL은 한 번만 저장됩니다.
+        (세그먼트 저장소는 새로 추가되거나 바뀐 항목만 기록)
+        
+        Args:
+            trend_data (dict): 저장할 트렌드 데이터
+            
+        Returns:
+            dict: 오늘 저장된 데이터를 모두 합친 트렌드 데이터
+        """
+        return self.storage.append(datetime.now().strftime('%Y-%m-%d'), trend_data)
+    
+    def compact_storage(self):
+        """
+        세그먼트 저장소의 날짜별 세그먼트를 중복 없는 파일 하나로 합칩니다.
+        
+        SQLite 저장소는 수집 결과를 행 단위로 바로 합치므로(새 행 추가, 바뀐 행 갱신) 합칠 세그먼트가 없습니다.
+        
+        Returns:
+            dict: {날짜: 합친 세그먼트 수} (세그먼트 저장소가 아니면 빈 사전)
+        """
+        if not hasattr(self.storage, 'compact_all'):
+            return {}
+        return self.storage.compact_all()
+    
+    def _save_keyword_index(self, trend_data, date_str=None):
+        """
+        트렌드 데이터의 기사/블로그로 키워드 역색인을 만들어 날짜별 파일로 저장합니다.
+        
+        Args:
+            trend_data (dict): 트렌드 데이터
+            date_str (str): 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            
+        Returns:
+            KeywordIndex: 저장한 역색인
+        """
+        if date_str is None:
+            date_str = datetime.now().strftime('%Y-%m-%d')
+        
+        index = KeywordIndex.build(
+            self.keyword_engine,
+            trend_data.get('news_trends', {}).get('news_data', []),
+            trend_data.get('blog_trends', {}).get('all_blogs', []),
+            trend_data.get('collection_time')
+        )
+        
+        index_path = self._get_keyword_index_path(date_str)
+        index.save(index_path)
+        self._cache_keyword_index(date_str, index_path.stat().st_mtime, index)
+        return index
+    
+    def _save_rollup(self, date_str, trend_data):
+        """
+        하루치 트렌드 데이터로 요약을 만들어 저장합니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 트렌드 데이터
+            
+        Returns:
+            dict: 저장한 요약
+        """
+        daily_data = {date_str: trend_data}
+        sources = trend_data.get('keyword_sketches') or {
+            news.get('source') for news in trend_data.get('news_trends', {}).get('news_data', [])
+        }
+        
+        rollup = build_rollup(
+            date_str,
+            trend_data,
+            self._day_sketches(daily_data)[date_str],
+            {source: self._day_sketches(daily_data, source)[date_str] for source in sorted(sources)},
+            recounted='keyword_sketches' not in trend_data
+        )
+        self.rollups.save(date_str, rollup)
+        return rollup
+    
+    def _get_rollup(self, date_str):
+        """
+        특정 날짜의 요약을 반환합니다.
+        
+        요약 파일이 없는 이전 날짜는 저장된 트렌드 데이터로 한 번 만들어 저장합니다.
+        이때 단어 빈도는 저장된 기사로 다시 집계합니다. (예전에 저장한 날짜의 스케치는 그날 마지막 수집만
+        반영했을 수 있어 기사 수, 주요 기사와 같은 기사 목록 기준으로 맞춤)
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            
+        Returns:
+            dict: 요약 (그날의 데이터가 없으면 None)
+        """
+        rollup = self.rollups.load(date_str)
+        if rollup is not None:
+            return rollup
+        
+        trend_data = self._load_trends(date_str)
+        if trend_data is None:
+            return None
+        
+        trend_data = {key: value for key, value in trend_data.items() if key != 'keyword_sketches'}
+        return self._save_rollup(date_str, trend_data)
+    
+    def get_rollups(self, start_date, end_date=None):
+        """
+        날짜 범위의 요약을 반환합니다. (기사 목록은 읽지 않음)
+        
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD 형식)
+            end_date (str): 종료 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            
+        Returns:
+            dict: {날짜: 요약} (데이터가 없는 날짜는 제외, 날짜 오름차순)
+        """
+        if end_date is None:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        current_date = datetime.strptime(start_date, '%Y-%m-%d')
+        end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
+        
+        rollups = {}
+        while current_date <= end_date_obj:
+            date_str = current_date.strftime('%Y-%m-%d')
+            rollup = self._get_rollup(date_str)
+            if rollup is not None:
+                rollups[date_str] = rollup
+            current_date += timedelta(days=1)
+        
+        return rollups
+    
+    def _cache_keyword_index(self, date_str, mtime, index):
+        with self._keyword_index_lock:
+            self._keyword_indexes[date_str] = (mtime, index)
+            self._keyword_indexes.move_to_end(date_str)
+            # 최근 7일치만 메모리에 유지
+            while len(self._keyword_indexes) > 7:
+                self._keyword_indexes.popitem(last=False)
+    
+    def _get_keyword_index(self, date_str):
+        """
+        특정 날짜의 키워드 역색인을 반환합니다.
+        
+        색인은 파일이 바뀌지 않았으면 메모리에 둔 것을 재사용하고,
+        색인 파일이 없는 이전 날짜는 저장된 트렌드 데이터로 한 번 만들어 저장합니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            
+        Returns:
+            KeywordIndex: 역색인 (그날의 데이터가 없으면 None)
+        """
+        index_path = self._get_keyword_index_path(date_str)
+        
+        if index_path.exists():
+            mtime = index_path.stat().st_mtime
+            with self._keyword_index_lock:
+                cached = self._keyword_indexes.get(date_str)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            
+            index = KeywordIndex.load(index_path)
+            if index is not None:
+                self._cache_keyword_index(date_str, mtime, index)
+                return index
+        
+        trend_data = self._load_trends(date_str)
+        if trend_data is None:
+            return None
+        
+        return self._save_keyword_index(trend_data, date_str)
+    
+    def get_keyword_articles(self, keyword, date_str=None, prefix=False, limit=50):
+        """
+        키워드를 언급한 기사와 블로그를 역색인으로 찾습니다. (일치한 문서 수에 비례하는 시간)
+        
+        Args:
+            keyword (str): 찾을 키워드 (여러 단어면 모두 포함한 문서)
+            date_str (str): 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            prefix (bool): 키워드로 시작하는 단어도 포함할지 여부 (예: '금리'로 '금리가', '금리는'도 찾음)
+            limit (int): 반환할 기사/블로그 최대 수 (None이면 모두)
+            
+        Returns:
+            dict: 키워드, 정규화된 단어, 날짜, 전체 일치 수, 소스별/카테고리별 기사 수, 기사 및 블로그 목록
+        """
+        if date_str is None:
+            date_str = datetime.now().strftime('%Y-%m-%d')
+        
+        terms = self.keyword_engine.tokenize(keyword)
+        if not terms:
+            return {'error': f"검색할 수 없는 키워드입니다: {keyword}"}
+        
+        index = self._get_keyword_index(date_str)
+        if index is None:
+            return {'error': f"{date_str} 날짜의 트렌드 데이터가 없습니다. 데이터 수집을 먼저 실행해주세요."}
+        
+        news = []
+        blogs = []
+        by_source = Counter()
+        by_category = Counter()
+        
+        for doc_id in index.lookup(terms, prefix):
+            document = index.documents[doc_id]
+            by_source[document['source']] += 1
+            if document['type'] == 'news':
+                by_category[document['category']] += 1
+                news.append(document)
+            else:
+                blogs.append(document)
+        
+        return {
+            'keyword': keyword,
+            'terms': terms,
+            'date': date_str,
+            'total': len(news) + len(blogs),
+            'news_count': len(news),
+            'blog_count': len(blogs),
+            'by_source': dict(by_source),
+            'by_category': dict(by_category),
+            'news': news[:limit] if limit is not None else news,
+            'blogs': blogs[:limit] if limit is not None else blogs
+        }
+    
+    def search(self, query, date_from=None, date_to=None, source=None, category=None, page=1, per_page=20):
+        """
+        수집한 기사와 블로그를 전문 검색합니다. (BM25 점수 순, 페이지 단위)
+        
+        Args:
+            query (str): 검색어 (여러 단어면 모두 포함한 문서, 각 단어는 접두어 검색)
+            date_from (str): 수집 날짜 하한 (YYYY-MM-DD 형식)
+            date_to (str): 수집 날짜 상한 (YYYY-MM-DD 형식)
+            source (str): 소스 ('naver' 또는 'daum', 기본값: 모든 소스)
+            category (str): 뉴스 카테고리 (기본값: 전체)
+            page (int): 페이지 번호 (1부터 시작)
+            per_page (int): 페이지당 결과 수 (최대 100)
+            
+        Returns:
+            dict: 검색어, 전체 결과 수, 페이지 정보, 결과 목록
+        """
+        if self.search_index is None:
+            return {'error': "전문 검색 색인을 사용하지 않도록 설정되어 있습니다."}
+        
+        return self.search_index.search(query, date_from=date_from, date_to=date_to, source=source,
+                                        category=category, page=page, per_page=per_page)
+    
+    def query_archive(self, start_date, end_date=None, columns=None, kind='news', source=None, category=None):
+        """
+        컬럼형 아카이브에서 기간 안의 날짜 분할과 요청한 열만 읽습니다.
+        
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD 형식)
+            end_date (str): 종료 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            columns (list): 읽을 열 목록 (예: ['title', 'category', 'date'], 기본값: 모든 열)
+            kind (str): 'news'(기사) 또는 'blogs'(블로그)
+            source (str): 특정 소스만 ('naver' 또는 'daum')
+            category (str): 특정 카테고리만 (기사만 해당)
+            
+        Returns:
+            pyarrow.Table: 요청한 열의 테이블 (아카이브를 사용하지 않으면 오류 사전)
+        """
+        if self.archive is None:
+            return {'error': "컬럼형 아카이브를 사용하지 않거나 pyarrow가 설치되어 있지 않습니다."}
+        
+        if end_date is None:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        return self.archive.scan(kind, start_date, end_date, columns=columns, source=source, category=category)
+    
+    def get_category_volume(self, start_date, end_date=None, source=None):
+        """
+        기간 안의 날짜별/카테고리별 기사 수를 아카이브의 date, category 열만 읽어 계산합니다.
+        
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD 형식)
+            end_date (str): 종료 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            source (str): 특정 소스만 ('naver' 또는 'daum', 기본값: 모든 소스)
+            
+        Returns:
+            dict: 기간, {날짜: {카테고리: 기사 수}}, 카테고리별 합계
+        """
+        table = self.query_archive(start_date, end_date, columns=['date', 'category'], source=source)
+        if isinstance(table, dict):
+            return table
+        
+        grouped = table.group_by(['date', 'category']).aggregate([('category', 'count')])
+        
+        by_date = {}
+        totals = Counter()
+        for date_str, category, count in sorted(zip(grouped['date'].to_pylist(), grouped['category'].to_pylist(),
+                                                    grouped['category_count'].to_pylist())):
+            by_date.setdefault(date_str, {})[category] = count
+            totals[category] += count
+        
+        return {
+            'period': {'start': start_date, 'end': end_date or datetime.now().strftime('%Y-%m-%d')},
+            'by_date': by_date,
+            'totals': dict(totals.most_common())
+        }
+    
+    def _update_keyword_stats(self, date_str, trend_data):
+        """
+        그날 저장된 뉴스 데이터로 키워드별 일간 빈도를 기록하고 급상승 키워드를 반환합니다.
+        
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD 형식)
+            trend_data (dict): 저장소가 그날 먼저 저장된 데이터와 합쳐 반환한 트렌드 데이터
+            
+        Returns:
+            list: 급상승 키워드 목록 [{'keyword', 'count', 'baseline', 'score'}]
+        """
+        self.keyword_stats.update(date_str, self._keyword_counts(trend_data))
+        return self.keyword_stats.rising_keywords()
+    
+    def _keyword_counts(self, trend_data):
+        """
+        트렌드 데이터의 뉴스 기사로 키워드별 빈도를 집계합니다.
+        
+        기사별 단어 빈도는 토큰 캐시에서 재사용하므로 추가 토큰화가 거의 없습니다.
+        
+        Args:
+            trend_data (dict): 트렌드 데이터
+            
+        Returns:
+            dict: {키워드: 빈도}
+        """
+        if self.use_term_matrix:
+            return self._news_matrix(trend_data).counts()
+        
+        word_freq = self.keyword_engine.counter()
+        for news in trend_data['news_trends']['news_data']:
+            word_freq.add(news.get('title', '') + " " + news.get('summary', ''))
+        word_freq.flush()
+        return word_freq.overall
+    
+    def _news_matrix(self, trend_data):
+        """
+        트렌드 데이터의 뉴스 기사로 문서 x 단어 빈도 행렬을 만듭니다.
+        
+        같은 수집 결과에 대해서는 행렬을 한 번만 만들고 급상승 키워드 계산과 경제 리포트가 함께 사용합니다.
+        
+        Args:
+            trend_data (dict): 트렌드 데이터
+            
+        Returns:
+            TermMatrix: 행 순서가 news_data와 같은 단어 빈도 행렬 (레이블: category)
+        """
+        news_data = trend_data['news_trends']['news_data']
+        key = (trend_data.get('collection_time'), len(news_data))
+        
+        cached_key, matrix = self._news_matrix_cache
+        if matrix is not None and cached_key == key:
+            return matrix
+        
+        matrix = TermMatrix.build(
+            self.keyword_engine,
+            [news.get('title', '') + " " + news.get('summary', '') for news in news_data],
+            labels={'category': [news.get('category', '') for news in news_data]}
+        )
+        self._news_matrix_cache = (key, matrix)
+        return matrix
+    
+    def _plan_pagination(self, news_crawlers, categories):
+        """
+        소스/카테고리별로 크롤링할 뉴스 페이지 수를 정합니다.
+        
+        Args:
+            news_crawlers (list): (소스, 뉴스 크롤러) 튜플 목록
+            categories (list): 수집할 카테고리 목록 (기본값: 크롤러별 모든 카테고리)
+            
+        Returns:
+            dict: 모드('fixed' 또는 'adaptive'), 전체 페이지 예산, {소스: {카테고리: 페이지 수}}
+        """
+        targets = []
+        for source, crawler in news_crawlers:
+            for category in (categories if categories is not None else crawler.categories.keys()):
+                targets.append((source, category))
+        
+        if not self.adaptive_pagination:
+            pages = {}
+            for source, category in targets:
+                pages.setdefault(source, {})[category] = self.pages_per_category
+            return {'mode': 'fixed', 'budget': self.pages_per_category * len(targets), 'pages': pages}
+        
+        budget = self.page_budget if self.page_budget is not None else self.pages_per_category * len(targets)
+        pages = self.page_planner.plan(targets, budget)
+        return {'mode': 'adaptive', 'budget': budget, 'pages': pages}
+    
+    def _load_saved_trends(self):
+        """
+        오늘 저장된 트렌드 데이터를 읽습니다.
+        
+        Returns:
+            dict: 저장된 트렌드 데이터 (없거나 읽을 수 없으면 None)
+        """
+        return self._load_trends()
+    
+    def _merge_with_saved(self, trend_data, saved_data=None):
+        """
+        오늘 저장된 데이터의 기사/블로그 목록 뒤에 새로 수집한 항목을 추가합니다.
+        
+        Args:
+            trend_data (dict): 이번에 수집한 트렌드 데이터 (새 항목만 포함)
+            saved_data (dict): 오늘 저장된 트렌드 데이터 (기본값: 파일에서 읽음)
+            
+        Returns:
+            dict: 저장된 항목이 합쳐진 트렌드 데이터
+        """
+        if saved_data is None:
+            saved_data = self._load_saved_trends()
+        if saved_data is None:
+            return trend_data
+        
+        saved_news = saved_data.get('news_trends', {}).get('news_data', [])
+        saved_blogs = saved_data.get('blog_trends', {}).get('all_blogs', [])
+        saved_urls = {item.get('url') for item in saved_news + saved_blogs}
+        
+        trend_data['news_trends']['news_data'] = saved_news + [
+            news for news in trend_data['news_trends']['news_data'] if news.get('url') not in saved_urls
+        ]
+        trend_data['blog_trends']['all_blogs'] = saved_blogs + [
+            blog for blog in trend_data['blog_trends']['all_blogs'] if blog.get('url') not in saved_urls
+        ]
+        
+        # 이번 수집의 스케치는 이번에 가져온 기사만 반영하므로 합친 기사 전체로 다시 집계
+        self._recount_keywords(trend_data, trend_data['news_trends']['news_data'])
+        
+        return trend_data
+    
+    def _aggregate_keywords(self, source_sketches):
+        """
+        소스별 단어 빈도 스케치로 전체/카테고리별 상위 키워드와 저장용 스케치를 만듭니다.
+        
+        Args:
+            source_sketches (dict): {소스: {'overall': SpaceSaving, 'by_category': {카테고리: SpaceSaving}}}
+            
+        Returns:
+            tuple: (상위 20개 키워드, {카테고리: 상위 10개 키워드}, 저장용 소스/카테고리별 스케치 사전)
+        """
+        # 소스별 스케치를 합쳐 실제 단어 빈도 기준으로 상위 키워드 추출
+        top_keywords = SpaceSaving.merge_all(sketches['overall'] for sketches in source_sketches.values()).top(20)
+        
+        # 같은 이름의 카테고리는 소스에 관계없이 합쳐서 상위 10개 키워드 추출
+        category_sketches = {}
+        for sketches in source_sketches.values():
+            for category, sketch in sketches['by_category'].items():
+                if category in category_sketches:
+                    category_sketches[category] = category_sketches[category].merge(sketch)
+                else:
+                    category_sketches[category] = sketch
+        category_keywords = {category: sketch.top(10) for category, sketch in category_sketches.items()}
+        
+        keyword_sketches = {
+            source: {
+                'overall': sketches['overall'].to_dict(),
+                'by_category': {category: sketch.to_dict() for category, sketch in sketches['by_category'].items()}
+            }
+            for source, sketches in source_sketches.items()
+        }
+        return top_keywords, category_keywords, keyword_sketches
+    
+    def _recount_keywords(self, trend_data, news_data):
+        """
+        하루치 기사 전체로 소스/카테고리별 스케치를 다시 만들어 트렌드 데이터의 키워드 집계를 바꿉니다.
+        
+        같은 날 여러 번 수집하면 각 수집의 스케치는 그 수집에서 가져온 기사만 반영하므로,
+        저장하기 전에 그날의 기사 목록으로 다시 집계해 기사 목록과 키워드 빈도가 어긋나지 않게 합니다.
+        기사별 단어 빈도는 토큰 캐시에서 재사용하므로 추가 토큰화가 거의 없습니다.
+        
+        Args:
+            trend_data (dict): 키워드 집계를 바꿀 트렌드 데이터
+            news_data (list): 그날의 뉴스 기사 전체
+        """
+        counters = {}
+        for news in news_data:
+            source = news.get('source')
+            if source not in counters:
+                counters[source] = self.keyword_engine.counter()
+            counters[source].add(news.get('title', '') + " " + news.get('summary', ''), news.get('category'))
+        
+        source_sketches = {
+            source: {'overall': counter.sketch(), 'by_category': counter.sketch_by_group()}
+            for source, counter in counters.items()
+        }
+        top_keywords, category_keywords, keyword_sketches = self._aggregate_keywords(source_sketches)
+        
+        trend_data['news_trends']['overall'] = top_keywords
+        trend_data['news_trends']['by_category'] = category_keywords
+        trend_data['top_keywords'] = top_keywords[:10]
+        trend_data['keyword_sketches'] = keyword_sketches
+    
+    def get_trends(self, date_str=None, force_collect=False, item_limit=None):
         """
         특정 날짜의 트렌드 데이터를 가져옵니다.
         
         Args:
             date_str (str): 날짜 문자열 (YYYY-MM-DD 형식, 기본값: 오늘)
             force_collect (bool): 데이터가 없거나 오래된 경우 강제로 수집할지 여부
+            item_limit (int): 기사/블로그 목록을 앞에서부터 최대 몇 개까지 읽을지 (기본값: 모두, 메모리에 캐시된 오늘 데이터는 그대로 반환)
             
         Returns:
             dict: 트렌드 데이터
@@ -186,11 +984,10 @@ class TrendService:
             if self.last_collected and (datetime.now() - self.last_collected).seconds < 3600:
                 return self.recent_data
         
-        # 파일에서 데이터 로드
-        data_path = self._get_data_path(date_str)
-        if data_path.exists():
-            with open(data_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        # 저장소에서 데이터 로드
+        trend_data = self._load_trends(date_str, item_limit)
+        if trend_data is not None:
+            return trend_data
         
         # 데이터가 없고 강제 수집이 활성화된 경우
         if force_collect and date_str == datetime.now().strftime('%Y-%m-%d'):
@@ -215,11 +1012,18 @@ class TrendService:
             self.is_collecting = True
             while self.is_collecting:
                 try:
-                    self.collect_trends()
+                    # 주기 수집은 새 기사/블로그만 가져와 오늘 데이터에 추가
+                    self.collect_trends(incremental=True)
                     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 트렌드 데이터 수집 완료")
                 except Exception as e:
                     print(f"트렌드 데이터 수집 중 오류 발생: {e}")
                 
+                # 수집 사이에 쌓인 세그먼트를 날짜별 파일 하나로 압축
+                try:
+                    self.compact_storage()
+                except OSError as e:
+                    print(f"저장소 압축 중 오류 발생: {e}")
+                
                 # 다음 수집 시간까지 대기
                 for _ in range(interval_hours * 60 * 60):
                     if not self.is_collecting:
@@ -263,32 +1067,47 @@ class TrendService:
                 'date': date_str
             }
         
-        # 경제 관련 뉴스 필터링
+        # 경제 관련 뉴스 필터링 (행렬 집계용으로 news_data 안의 위치도 기록)
         economy_news = []
         global_economy_news = []
+        economy_rows = []
+        global_economy_rows = []
         
         # 뉴스 데이터가 있는지 확인
         if 'news_data' in trends_data['news_trends']:
-            for news in trends_data['news_trends']['news_data']:
+            for row, news in enumerate(trends_data['news_trends']['news_data']):
                 # 카테고리 필드가 있는지 확인
                 category = news.get('category', '')
-                source = news.get('source', 'unknown')
+                source = news.get('source')
+                
+                title = news.get('title', '')
                 
-                # 경제 뉴스 추출
-                if category == '경제' or '경제' in news.get('title', ''):
-                    economy_news.append(news)
+                # 경제 뉴스 추출 (제목에서 찾은 경제 어휘를 분류 근거로 함께 반환)
+                if category == '경제' or '경제' in title:
+                    economy_news.append(dict(news, matched_terms=self.topic_matcher.find(title, 'economy')))
+                    economy_rows.append(row)
                 # 세계 경제 뉴스 추출
-                elif include_global and (category == '세계' or category == '국제') and self._is_economy_related(news.get('title', '')):
-                    global_economy_news.append(news)
+                elif include_global and (category == '세계' or category == '국제'):
+                    matched_terms = self.topic_matcher.find(title, 'economy')
+                    if matched_terms:
+                        global_economy_news.append(dict(news, matched_terms=matched_terms))
+                        global_economy_rows.append(row)
         
-        # 경제 관련 키워드 추출
-        all_economy_text = ""
-        for news in economy_news + global_economy_news:
-            all_economy_text += news.get('title', '') + " " + news.get('summary', '') + " "
+        has_text = any(
+            (news.get('title', '') + " " + news.get('summary', '')).strip()
+            for news in economy_news + global_economy_news
+        )
         
         # 경제 키워드 추출 (텍스트가 없으면 기본 키워드 사용)
-        if all_economy_text.strip():
-            economy_keywords = self._extract_keywords(all_economy_text, 20)
+        if has_text and self.use_term_matrix:
+            # 수집 시 만든 단어 빈도 행렬에서 경제 기사 행만 합산
+            economy_keywords = self._news_matrix(trends_data).top(20, economy_rows + global_economy_rows)
+        elif has_text:
+            # 기사 단위로 단어 빈도 누적
+            word_freq = self.keyword_engine.counter()
+            for news in economy_news + global_economy_news:
+                word_freq.add(news.get('title', '') + " " + news.get('summary', ''))
+            economy_keywords = word_freq.top(20)
         else:
             economy_keywords = [
                 '경제', '금융', '주식', '상승', '하락', '환율', '금리',
@@ -296,14 +1115,16 @@ class TrendService:
                 '기업', '산업', '고용', 'GDP', '경제성장', '중앙은행'
             ]
         
-        # 경제 관련 블로그 필터링
+        # 경제 관련 블로그 필터링 (경제 어휘 + 상위 경제 키워드를 한 자동자로 탐색)
         economy_blogs = []
+        blog_matcher = self._get_economy_blog_matcher(economy_keywords[:10])
         
         # 블로그 데이터가 있는지 확인
         if 'all_blogs' in trends_data['blog_trends']:
             for blog in trends_data['blog_trends']['all_blogs']:
-                if self._is_economy_related(blog.get('title', '')) or any(keyword in blog.get('title', '') for keyword in economy_keywords[:10]):
-                    economy_blogs.append(blog)
+                matched_terms = blog_matcher.find(blog.get('title', ''))
+                if matched_terms:
+                    economy_blogs.append(dict(blog, matched_terms=matched_terms))
         
         # 결과 데이터 구성
         return {
@@ -326,16 +1147,36 @@ class TrendService:
         Returns:
             bool: 경제 관련 여부
         """
-        economy_keywords = [
-            '경제', '금융', '주식', '상승', '하락', '원화', '달러', '환율',
-            '금리', '인플레', '인플레이션', '디플레', '디플레이션', '물가',
-            '재테크', '재무', '투자', '시장', '무역', '수출', '수입', '관세',
-            '환율', '상품', '사업', '기업', '산업', '일자리', '고용', '실업',
-            'GDP', '국내총생산', '경제성장', '경제위기', '경제정책', '기준금리',
-            '중앙은행', '세금', '세제', '세수', '세정', '예산', '부채', '국채'
-        ]
+        return self.topic_matcher.matches(text, 'economy')
+    
+    def match_topics(self, text):
+        """
+        텍스트가 속한 주제와 주제별로 일치한 어휘를 반환합니다.
         
-        return any(keyword in text for keyword in economy_keywords)
+        Args:
+            text (str): 분류할 텍스트
+            
+        Returns:
+            dict: {주제: 일치한 단어 목록}
+        """
+        return self.topic_matcher.match(text)
+    
+    def _get_economy_blog_matcher(self, keywords):
+        """
+        경제 어휘와 주어진 상위 키워드로 블로그 분류 자동자를 반환합니다. (키워드가 같으면 재사용)
+        
+        Args:
+            keywords (list): 리포트의 상위 경제 키워드
+            
+        Returns:
+            AhoCorasick: 블로그 제목 탐색용 자동자
+        """
+        keywords = tuple(keywords)
+        cached_keywords, matcher = self._economy_blog_matcher
+        if matcher is None or cached_keywords != keywords:
+            matcher = TopicMatcher({'economy': self.topic_lexicons['economy'] + list(keywords)}).automaton
+            self._economy_blog_matcher = (keywords, matcher)
+        return matcher
     
     def _extract_keywords(self, text, top_n=10):
         """
@@ -348,82 +1189,190 @@ class TrendService:
         Returns:
             list: 키워드 목록
         """
-        # 불용어 목록
-        stopwords = ['있다', '하다', '이다', '되다', '않다', '그', '및', '등', '를', '을', '이', '가', '의', '에', '로', '으로']
+        return self.keyword_engine.extract(text, top_n)
+    
+    def get_weekly_report(self, end_date=None, include_raw=False):
+        """
+        주간 리포트 데이터를 날짜별 요약으로 생성합니다.
         
-        # 특수문자 및 숫자 제거
-        clean_text = re.sub(r'[^\w\s]', '', text)
-        clean_text = re.sub(r'\d+', '', clean_text)
+        Args:
+            end_date (str): 종료 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            include_raw (bool): 날짜별 전체 트렌드 데이터(기사/블로그 목록)도 함께 반환할지 여부
+            
+        Returns:
+            dict: 주간 리포트 데이터 (daily_data는 날짜별 요약, include_raw이면 raw_data에 전체 데이터)
+        """
+        if end_date is None:
+            end_date = datetime.now().strftime('%Y-%m-%d')
         
-        # 단어 분리
-        words = clean_text.split()
+        end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
+        start_date_obj = end_date_obj - timedelta(days=6)  # 7일간의 데이터
         
-        # 불용어 제거 및 단어 길이 필터링
-        filtered_words = [word for word in words if word not in stopwords and len(word) > 1]
+        rollups = self.get_rollups(start_date_obj.strftime('%Y-%m-%d'), end_date)
         
-        # 단어 빈도수 계산
-        word_freq = {}
-        for word in filtered_words:
-            if word in word_freq:
-                word_freq[word] += 1
-            else:
-                word_freq[word] = 1
+        # 날짜별 스케치를 합쳐 실제 단어 빈도 기준으로 상위 키워드 추출
+        merged = SpaceSaving.merge_all(SpaceSaving.from_dict(rollup['sketches']['overall']) for rollup in rollups.values())
         
-        # 빈도수 기준 상위 키워드 추출
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+        report = {
+            'period': {
+                'start': start_date_obj.strftime('%Y-%m-%d'),
+                'end': end_date_obj.strftime('%Y-%m-%d')
+            },
+            'top_keywords': merged.top(20),
+            'keyword_counts': [
+                {'keyword': keyword, 'count': count, 'error': error}
+                for keyword, count, error in merged.top_items(20)
+            ],
+            'daily_data': {date_str: summarize(rollup) for date_str, rollup in rollups.items()}
+        }
         
-        return [word for word, freq in sorted_words[:top_n]]
+        # 기사/블로그 목록은 요청한 경우에만 읽음
+        if include_raw:
+            report['raw_data'] = {date_str: self.get_trends(date_str) for date_str in rollups}
         
-    def get_weekly_report(self, end_date=None):
+        return report
+    
+    def _day_sketch(self, data, source=None, category=None):
         """
-        주간 리포트 데이터를 생성합니다.
+        하루치 트렌드 데이터에 저장된 단어 빈도 스케치를 합칩니다.
         
         Args:
+            data (dict): 트렌드 데이터
+            source (str): 특정 소스만 사용 ('naver' 또는 'daum', 기본값: 모든 소스)
+            category (str): 특정 카테고리만 사용 (기본값: 전체 빈도)
+            
+        Returns:
+            SpaceSaving: 합쳐진 스케치 (스케치가 없는 이전 형식의 데이터이면 None)
+        """
+        source_sketches = data.get('keyword_sketches')
+        if source_sketches is None:
+            return None
+        
+        sketches = []
+        for name, sketch_data in source_sketches.items():
+            if source is not None and name != source:
+                continue
+            if category is None:
+                sketches.append(SpaceSaving.from_dict(sketch_data['overall']))
+            elif category in sketch_data['by_category']:
+                sketches.append(SpaceSaving.from_dict(sketch_data['by_category'][category]))
+        
+        return SpaceSaving.merge_all(sketches)
+    
+    def _day_sketches(self, daily_data, source=None, category=None):
+        """
+        날짜별 단어 빈도 스케치를 반환합니다.
+        
+        스케치가 없는 이전 형식의 데이터는 저장된 뉴스 기사를 날짜 레이블로 묶어 한 번에 다시 집계합니다.
+        
+        Args:
+            daily_data (dict): {날짜: 트렌드 데이터}
+            source (str): 특정 소스만 사용 ('naver' 또는 'daum', 기본값: 모든 소스)
+            category (str): 특정 카테고리만 사용 (기본값: 전체 빈도)
+            
+        Returns:
+            dict: {날짜: SpaceSaving}
+        """
+        sketches = {}
+        texts = []
+        days = []
+        
+        for date_str, data in daily_data.items():
+            sketch = self._day_sketch(data, source, category)
+            if sketch is not None:
+                sketches[date_str] = sketch
+                continue
+            
+            sketches[date_str] = SpaceSaving()
+            for news in data.get('news_trends', {}).get('news_data', []):
+                if category is not None and news.get('category') != category:
+                    continue
+                if source is not None and source not in urlparse(news.get('url', '')).netloc:
+                    continue
+                texts.append(news.get('title', '') + " " + news.get('summary', ''))
+                days.append(date_str)
+        
+        if texts:
+            # 날짜 x 단어 빈도
+            if self.use_term_matrix:
+                day_counts = TermMatrix.build(self.keyword_engine, texts, labels={'day': days}).counts_by('day')
+            else:
+                counter = self.keyword_engine.count_by_group(zip(days, texts))
+                counter.flush()
+                day_counts = counter.by_group
+            
+            for date_str, counts in day_counts.items():
+                sketches[date_str] = SpaceSaving.from_counts(counts)
+        
+        return sketches
+    
+    def get_keyword_range(self, start_date, end_date=None, top_n=20, source=None, category=None):
+        """
+        날짜 범위의 상위 키워드를 저장된 단어 빈도 스케치만으로 계산합니다. (기사를 다시 집계하지 않음)
+        
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD 형식)
             end_date (str): 종료 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)
+            top_n (int): 반환할 키워드 수
+            source (str): 특정 소스만 집계 ('naver' 또는 'daum', 기본값: 모든 소스)
+            category (str): 특정 카테고리만 집계 (기본값: 전체)
             
         Returns:
-            dict: 주간 리포트 데이터
+            dict: 기간, 키워드별 추정 빈도와 최대 과대 추정치, 집계한 날짜, 스케치가 없어 기사를 다시 집계한 날짜
         """
         if end_date is None:
             end_date = datetime.now().strftime('%Y-%m-%d')
         
+        # 전체/소스별 빈도는 날짜별 요약의 스케치만 합침 (카테고리별 빈도만 저장된 데이터의 스케치를 읽음)
+        if category is None:
+            rollups = self.get_rollups(start_date, end_date)
+            sketches = []
+            for rollup in rollups.values():
+                if source is None:
+                    sketches.append(SpaceSaving.from_dict(rollup['sketches']['overall']))
+                elif source in rollup['sketches']['by_source']:
+                    sketches.append(SpaceSaving.from_dict(rollup['sketches']['by_source'][source]))
+            merged = SpaceSaving.merge_all(sketches)
+            
+            return {
+                'period': {'start': start_date, 'end': end_date},
+                'keywords': [
+                    {'keyword': keyword, 'count': count, 'error': error}
+                    for keyword, count, error in merged.top_items(top_n)
+                ],
+                'days': list(rollups),
+                'recounted_days': [date_str for date_str, rollup in rollups.items() if rollup['recounted']]
+            }
+        
+        start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
         end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
-        start_date_obj = end_date_obj - timedelta(days=6)  # 7일간의 데이터
         
         daily_data = {}
-        all_keywords = []
         
-        # 각 날짜별 데이터 수집
         current_date = start_date_obj
         while current_date <= end_date_obj:
             date_str = current_date.strftime('%Y-%m-%d')
-            data = self.get_trends(date_str)
+            # 스케치만 필요하므로 기사 목록은 읽지 않음 (스케치가 없는 이전 형식의 날짜만 다시 읽음)
+            data = self.get_trends(date_str, item_limit=0)
+            if 'error' not in data and 'keyword_sketches' not in data:
+                data = self.get_trends(date_str)
             
             if 'error' not in data:
                 daily_data[date_str] = data
-                all_keywords.extend(data.get('top_keywords', []))
             
             current_date += timedelta(days=1)
         
-        # 키워드 빈도수 계산
-        keyword_freq = {}
-        for keyword in all_keywords:
-            if keyword in keyword_freq:
-                keyword_freq[keyword] += 1
-            else:
-                keyword_freq[keyword] = 1
-        
-        # 빈도수 기준 상위 키워드 추출
-        sorted_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)
-        top_weekly_keywords = [keyword for keyword, freq in sorted_keywords[:20]]
+        sketches = self._day_sketches(daily_data, source, category)
+        merged = SpaceSaving.merge_all(sketches[date_str] for date_str in daily_data)
         
         return {
-            'period': {
-                'start': start_date_obj.strftime('%Y-%m-%d'),
-                'end': end_date_obj.strftime('%Y-%m-%d')
-            },
-            'top_keywords': top_weekly_keywords,
-            'daily_data': daily_data
+            'period': {'start': start_date, 'end': end_date},
+            'keywords': [
+                {'keyword': keyword, 'count': count, 'error': error}
+                for keyword, count, error in merged.top_items(top_n)
+            ],
+            'days': list(daily_data),
+            'recounted_days': [date_str for date_str, data in daily_data.items() if 'keyword_sketches' not in data]
         }
 
 
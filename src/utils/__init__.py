@@ -0,0 +1,23 @@
+from .rate_limiter import TokenBucket, HostRateLimiter
+from .concurrency import map_ordered, imap_ordered, run_blocking
+from .http_cache import ResponseCache
+from .http import HttpClient, Page, get_default_client
+from .html_parser import HtmlParser, SoupParser, LxmlParser, get_parser
+from .seen_index import SeenUrlIndex
+from .fixtures import FixtureArchive, ReplayAdapter, enable_recording, enable_replay
+from .keywords import KeywordEngine, KeywordCounter, WhitespaceTokenizer, get_keyword_engine, get_tokenizer
+from .morphology import MorphTokenizer
+from .token_cache import TokenCache
+from .matcher import AhoCorasick, TopicMatcher
+from .sketch import SpaceSaving
+from .term_matrix import TermMatrix
+from .keyword_index import KeywordIndex
+from .near_duplicates import NearDuplicateIndex, DuplicateFilter, minhash_signature
+
+__all__ = ['TokenBucket', 'HostRateLimiter', 'map_ordered', 'imap_ordered', 'run_blocking', 'ResponseCache', 'HttpClient', 'Page', 'get_default_client',
+           'HtmlParser', 'SoupParser', 'LxmlParser', 'get_parser', 'SeenUrlIndex',
+           'FixtureArchive', 'ReplayAdapter', 'enable_recording', 'enable_replay',
+           'KeywordEngine', 'KeywordCounter', 'WhitespaceTokenizer', 'get_keyword_engine', 'get_tokenizer',
+           'MorphTokenizer', 'TokenCache', 'AhoCorasick', 'TopicMatcher',
+           'NearDuplicateIndex', 'DuplicateFilter', 'minhash_signature', 'SpaceSaving',
+           'TermMatrix', 'KeywordIndex']
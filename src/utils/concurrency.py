@@ -0,0 +1,62 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+def map_ordered(func, jobs, max_workers=4):
+    """
+    작업 목록을 스레드 풀에서 병렬로 실행하고 입력 순서대로 결과를 반환합니다.
+    
+    Args:
+        func (callable): 각 작업 인자를 풀어서 호출할 함수
+        jobs (list): 작업 인자 튜플 목록
+        max_workers (int): 최대 작업자 수 (1 이하이면 순차 실행)
+        
+    Returns:
+        list: 작업 순서와 동일한 순서의 결과 목록
+    """
+    return list(imap_ordered(func, jobs, max_workers))
+
+
+def imap_ordered(func, jobs, max_workers=4):
+    """
+    map_ordered의 제너레이터 버전입니다. 결과를 입력 순서대로 준비되는 즉시 하나씩 반환합니다.
+    
+    Args:
+        func (callable): 각 작업 인자를 풀어서 호출할 함수
+        jobs (list): 작업 인자 튜플 목록
+        max_workers (int): 최대 작업자 수 (1 이하이면 순차 실행)
+        
+    Yields:
+        작업 순서와 동일한 순서의 결과
+    """
+    jobs = list(jobs)
+    
+    if max_workers is None or max_workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield func(*job)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        yield from executor.map(lambda job: func(*job), jobs)
+
+
+async def run_blocking(func, *args, semaphore=None):
+    """
+    블로킹 함수를 이벤트 루프의 실행기(스레드 풀)에서 실행합니다.
+    
+    Args:
+        func (callable): 실행할 블로킹 함수
+        *args: 함수에 전달할 인자
+        semaphore (asyncio.Semaphore): 동시 실행 수를 제한할 세마포어 (기본값: 제한 없음)
+        
+    Returns:
+        함수의 반환값
+    """
+    loop = asyncio.get_running_loop()
+    
+    if semaphore is None:
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+    
+    async with semaphore:
+        return await loop.run_in_executor(None, functools.partial(func, *args))
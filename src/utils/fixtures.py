@@ -0,0 +1,245 @@
+import gzip
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+ARCHIVE_FORMAT = 'marketing-report-fixtures'
+ARCHIVE_VERSION = 1
+
+# 재생 시 함께 돌려줄 응답 헤더 (Location은 리다이렉트 응답을 재생할 때 다음 요청 URL)
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Location')
+
+# 날짜 형식(YYYYMMDD) 쿼리 값: 다른 날짜에 녹화한 응답도 재생할 수 있도록 비교에서 제외
+DATE_VALUE_PATTERN = re.compile(r'^\d{8}$')
+
+
+def normalize_url(url):
+    """
+    날짜 형식의 쿼리 파라미터를 제외한 URL을 반환합니다.
+    
+    Args:
+        url (str): 원본 URL
+        
+    Returns:
+        str: 정규화된 URL
+    """
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not DATE_VALUE_PATTERN.match(value)]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+class FixtureArchive:
+    """
+    HTTP 요청/응답 기록을 gzip 압축 JSON Lines 파일로 저장하는 클래스
+    
+    첫 줄은 형식 정보, 이후 각 줄은 하나의 요청/응답 기록입니다.
+    같은 메서드와 정규화된 URL의 기록은 하나만 유지하며 나중 기록이 이전 기록을 대체합니다.
+    """
+    
+    def __init__(self, path):
+        """
+        FixtureArchive 초기화
+        
+        Args:
+            path (str): 아카이브 파일 경로 (.jsonl.gz)
+        """
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.records = []
+        # {(메서드, 정규화된 URL): records 안의 위치}
+        self.positions = {}
+        self.by_url = {}
+        self.by_normalized_url = {}
+        
+        if self.path.exists():
+            self._load()
+    
+    def _load(self):
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline() or '{}')
+            if header.get('format') != ARCHIVE_FORMAT:
+                raise ValueError(f"픽스처 아카이브 형식이 아닙니다: {self.path}")
+            
+            for line in f:
+                line = line.strip()
+                if line:
+                    self._index(json.loads(line))
+    
+    def _index(self, record):
+        normalized = normalize_url(record['url'])
+        key = (record.get('method', 'GET'), normalized)
+        
+        # 같은 요청이 다시 기록되면 이전 기록을 같은 위치에서 대체
+        position = self.positions.get(key)
+        if position is None:
+            self.positions[key] = len(self.records)
+            self.records.append(record)
+        else:
+            previous = self.records[position]
+            if self.by_url.get(previous['url']) is previous:
+                del self.by_url[previous['url']]
+            self.records[position] = record
+        
+        self.by_url[record['url']] = record
+        self.by_normalized_url[normalized] = record
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def add(self, url, status, headers, body, method='GET'):
+        """
+        요청/응답 기록을 추가합니다. (같은 메서드와 정규화된 URL의 기록이 있으면 대체)
+        
+        Args:
+            url (str): 요청 URL
+            status (int): HTTP 상태 코드
+            headers (dict): 응답 헤더
+            body (str): 응답 본문
+            method (str): HTTP 메서드
+        """
+        record = {
+            'method': method,
+            'url': url,
+            'status': status,
+            'headers': {name: headers[name] for name in RECORDED_HEADERS if name in headers},
+            'body': body
+        }
+        with self.lock:
+            self._index(record)
+    
+    def find(self, url):
+        """
+        URL에 해당하는 기록을 찾습니다. 정확히 일치하는 기록이 없으면 날짜 파라미터를 무시하고 찾습니다.
+        
+        Args:
+            url (str): 요청 URL
+            
+        Returns:
+            dict: 요청/응답 기록 (없으면 None)
+        """
+        record = self.by_url.get(url)
+        if record is None:
+            record = self.by_normalized_url.get(normalize_url(url))
+        return record
+    
+    def save(self):
+        """아카이브를 파일에 원자적으로 저장합니다."""
+        header = {
+            'format': ARCHIVE_FORMAT,
+            'version': ARCHIVE_VERSION,
+            'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        
+        with self.lock:
+            records = list(self.records)
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps(header, ensure_ascii=False) + '\n')
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, self.path)
+
+
+class ReplayAdapter(BaseAdapter):
+    """네트워크 대신 픽스처 아카이브에서 응답을 돌려주는 requests 어댑터 클래스"""
+    
+    def __init__(self, archive):
+        """
+        ReplayAdapter 초기화
+        
+        Args:
+            archive (FixtureArchive): 재생할 아카이브
+        """
+        super().__init__()
+        self.archive = archive
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def send(self, request, **kwargs):
+        record = self.archive.find(request.url)
+        
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        response.headers = CaseInsensitiveDict()
+        
+        with self.lock:
+            if record is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        
+        if record is None:
+            # 기록이 없는 요청은 404로 응답
+            response.status_code = 404
+            response._content = b''
+            response.headers['X-Fixture-Miss'] = '1'
+            return response
+        
+        response.headers.update(record.get('headers', {}))
+        
+        # 조건부 요청 재검증도 재현
+        etag = record.get('headers', {}).get('ETag')
+        if etag and request.headers.get('If-None-Match') == etag:
+            response.status_code = 304
+            response._content = b''
+            return response
+        
+        response.status_code = record['status']
+        response._content = record['body'].encode('utf-8')
+        return response
+    
+    def close(self):
+        pass
+
+
+def enable_recording(http_client, archive):
+    """
+    HttpClient가 받은 모든 응답을 요청 URL 기준으로 아카이브에 기록하도록 설정합니다.
+    
+    리다이렉트는 단계마다 기록하고 Location 헤더를 함께 저장하므로, 재생할 때도 원래 URL에서 같은 경로로 따라갑니다.
+    조건부 요청의 304 응답에는 본문이 없으므로, 녹화할 때는 응답 캐시를 사용하지 않아야 합니다.
+    
+    Args:
+        http_client (HttpClient): 기록할 HTTP 클라이언트
+        archive (FixtureArchive): 기록을 저장할 아카이브
+    """
+    def record_response(response, *args, **kwargs):
+        # response.url은 리다이렉트 이후 URL일 수 있으므로 이 응답을 받은 요청의 URL로 기록
+        request = response.request
+        archive.add(request.url if request is not None else response.url,
+                    response.status_code, response.headers, response.text,
+                    method=request.method if request is not None else 'GET')
+        return response
+    
+    http_client.session.hooks['response'].append(record_response)
+
+
+def enable_replay(http_client, archive):
+    """
+    HttpClient가 네트워크 대신 아카이브에서 응답을 받도록 설정합니다.
+    
+    Args:
+        http_client (HttpClient): 재생할 HTTP 클라이언트
+        archive (FixtureArchive): 재생할 아카이브
+        
+    Returns:
+        ReplayAdapter: 설치된 재생 어댑터 (적중/미스 횟수 확인용)
+    """
+    adapter = ReplayAdapter(archive)
+    http_client.session.mount('http://', adapter)
+    http_client.session.mount('https://', adapter)
+    return adapter
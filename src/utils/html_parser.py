@@ -0,0 +1,217 @@
+import threading
+from bs4 import BeautifulSoup
+import soupsieve
+
+# lxml + cssselect는 선택 의존성 (없으면 BeautifulSoup 백엔드 사용)
+try:
+    from lxml import etree
+    import lxml.html
+    from cssselect import HTMLTranslator
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+
+class HtmlParser:
+    """HTML 파서 백엔드의 공통 인터페이스 클래스"""
+    
+    name = None
+    
+    def __init__(self):
+        self._compiled = {}
+        self._lock = threading.Lock()
+    
+    def compile(self, selector):
+        """
+        CSS 선택자를 컴파일합니다. 같은 선택자는 한 번만 컴파일됩니다.
+        
+        Args:
+            selector (str): CSS 선택자
+            
+        Returns:
+            백엔드별 컴파일된 선택자
+        """
+        with self._lock:
+            compiled = self._compiled.get(selector)
+            if compiled is None:
+                compiled = self._compile(selector)
+                self._compiled[selector] = compiled
+            return compiled
+    
+    def compile_all(self, selectors):
+        """
+        선택자 사전을 한 번에 컴파일합니다.
+        
+        Args:
+            selectors (dict): {이름: CSS 선택자}
+            
+        Returns:
+            dict: {이름: 컴파일된 선택자}
+        """
+        return {name: self.compile(selector) for name, selector in selectors.items()}
+    
+    def _compile(self, selector):
+        raise NotImplementedError
+    
+    def parse(self, html):
+        """
+        HTML 문자열을 파싱하여 루트 노드를 반환합니다.
+        
+        Args:
+            html (str): HTML 문자열
+            
+        Returns:
+            루트 노드 (빈 문서이면 None)
+        """
+        raise NotImplementedError
+    
+    def select(self, node, compiled):
+        """
+        노드의 하위 요소 중 선택자와 일치하는 요소를 문서 순서대로 반환합니다.
+        
+        Args:
+            node: 기준 노드
+            compiled: 컴파일된 선택자
+            
+        Returns:
+            list: 일치하는 요소 목록
+        """
+        raise NotImplementedError
+    
+    def select_one(self, node, compiled):
+        """
+        노드의 하위 요소 중 선택자와 일치하는 첫 번째 요소를 반환합니다.
+        
+        Args:
+            node: 기준 노드
+            compiled: 컴파일된 선택자
+            
+        Returns:
+            일치하는 요소 (없으면 None)
+        """
+        matches = self.select(node, compiled)
+        return matches[0] if matches else None
+    
+    def text(self, node):
+        """
+        요소의 텍스트 내용을 반환합니다.
+        
+        Args:
+            node: 요소
+            
+        Returns:
+            str: 하위 요소를 포함한 텍스트 내용
+        """
+        raise NotImplementedError
+    
+    def attr(self, node, name):
+        """
+        요소의 속성 값을 반환합니다. 속성이 없으면 KeyError가 발생합니다.
+        
+        Args:
+            node: 요소
+            name (str): 속성 이름
+            
+        Returns:
+            str: 속성 값
+        """
+        raise NotImplementedError
+
+
+class SoupParser(HtmlParser):
+    """BeautifulSoup(html.parser) 기반 파서 백엔드 클래스"""
+    
+    name = 'bs4'
+    
+    def _compile(self, selector):
+        return soupsieve.compile(selector)
+    
+    def parse(self, html):
+        return BeautifulSoup(html, 'html.parser')
+    
+    def select(self, node, compiled):
+        if node is None:
+            return []
+        return compiled.select(node)
+    
+    def select_one(self, node, compiled):
+        if node is None:
+            return None
+        return compiled.select_one(node)
+    
+    def text(self, node):
+        return node.text
+    
+    def attr(self, node, name):
+        return node[name]
+
+
+class LxmlParser(HtmlParser):
+    """lxml + cssselect 기반 파서 백엔드 클래스"""
+    
+    name = 'lxml'
+    
+    def __init__(self):
+        if not HAS_LXML:
+            raise ImportError("lxml 백엔드를 사용하려면 lxml과 cssselect 패키지가 필요합니다.")
+        super().__init__()
+        self._translator = HTMLTranslator()
+    
+    def _compile(self, selector):
+        # BeautifulSoup.select와 같이 기준 노드 자신은 제외하고 하위 요소만 검색
+        return etree.XPath(self._translator.css_to_xpath(selector, prefix='descendant::'))
+    
+    def parse(self, html):
+        if not html or not html.strip():
+            return None
+        try:
+            return lxml.html.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            # XML 인코딩 선언이 포함된 문자열 등은 바이트로 다시 파싱
+            try:
+                return lxml.html.document_fromstring(html.encode('utf-8'))
+            except etree.ParserError:
+                return None
+    
+    def select(self, node, compiled):
+        if node is None:
+            return []
+        return compiled(node)
+    
+    def text(self, node):
+        return node.text_content()
+    
+    def attr(self, node, name):
+        value = node.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+
+PARSER_BACKENDS = {
+    'lxml': LxmlParser,
+    'bs4': SoupParser
+}
+
+
+def get_parser(backend=None):
+    """
+    HTML 파서 백엔드를 생성합니다.
+    
+    Args:
+        backend (str): 'lxml' 또는 'bs4' (기본값: lxml을 사용할 수 있으면 lxml, 아니면 bs4)
+        
+    Returns:
+        HtmlParser: 파서 백엔드
+    """
+    if backend is None:
+        backend = 'lxml' if HAS_LXML else 'bs4'
+    
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않는 파서 백엔드입니다: {backend} (가능한 값: {list(PARSER_BACKENDS.keys())})")
+    
+    if backend == 'lxml' and not HAS_LXML:
+        print("lxml을 사용할 수 없어 BeautifulSoup 파서를 사용합니다.")
+        backend = 'bs4'
+    
+    return PARSER_BACKENDS[backend]()
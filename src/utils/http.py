@@ -0,0 +1,287 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .http_cache import hash_text
+
+# brotli 디코더가 설치된 경우에만 br 인코딩 요청 (urllib3가 자동으로 해제)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class Page:
+    """조회한 페이지 본문과 내용 해시를 담는 클래스"""
+    
+    def __init__(self, url, status_code, body_hash, text=None, loader=None, from_cache=False, headers=None):
+        """
+        Page 초기화
+        
+        Args:
+            url (str): 요청 URL
+            status_code (int): 최종 HTTP 상태 코드 (캐시 재사용 시 304)
+            body_hash (str): 본문 SHA-256 해시
+            text (str): 본문 (지연 로딩 시 None)
+            loader (callable): 본문이 필요할 때 호출할 로더
+            from_cache (bool): 캐시된 본문을 재사용했는지 여부
+            headers (dict): 요청할 때 사용한 추가 헤더 (캐시된 본문이 제거되어 다시 요청할 때 사용)
+        """
+        self.url = url
+        self.status_code = status_code
+        self.body_hash = body_hash
+        self.from_cache = from_cache
+        self.headers = headers
+        self._text = text
+        self._loader = loader
+    
+    @property
+    def text(self):
+        if self._text is None and self._loader is not None:
+            self._text = self._loader()
+        return self._text
+
+
+class HttpClient:
+    """연결 풀링, 타임아웃, 재시도를 제공하는 공용 HTTP 클라이언트 클래스"""
+    
+    def __init__(self, connect_timeout=3.05, read_timeout=10, retries=3, backoff_factor=0.5,
+                 pool_connections=10, pool_maxsize=10, cache=None):
+        """
+        HttpClient 초기화
+        
+        Args:
+            connect_timeout (float): 연결 타임아웃 (초)
+            read_timeout (float): 응답 읽기 타임아웃 (초)
+            retries (int): 연결 오류 및 429/5xx 응답에 대한 최대 재시도 횟수
+            backoff_factor (float): 재시도 간 지수 백오프 계수 (초)
+            pool_connections (int): 연결 풀을 유지할 호스트 수
+            pool_maxsize (int): 호스트별로 유지할 최대 연결 수
+            cache (ResponseCache): get_page에서 사용할 응답 캐시 (기본값: 캐시 사용 안 함)
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+        
+        self.session = requests.Session()
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+        self.session.headers.update({
+            'User-Agent': DEFAULT_USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        
+        # 요청 통계
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.retry_count = 0
+        self.error_count = 0
+    
+    def get(self, url, headers=None, **kwargs):
+        """
+        GET 요청을 보냅니다.
+        
+        Args:
+            url (str): 요청할 URL
+            headers (dict): 추가 요청 헤더
+            **kwargs: requests.Session.get에 전달할 추가 인자 (timeout 미지정 시 기본 타임아웃 사용)
+            
+        Returns:
+            requests.Response: 응답 객체
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        
+        try:
+            response = self.session.get(url, headers=headers, **kwargs)
+        except requests.RequestException:
+            with self.lock:
+                self.request_count += 1
+                self.error_count += 1
+            raise
+        
+        retries = response.raw.retries if response.raw is not None else None
+        with self.lock:
+            self.request_count += 1
+            if retries is not None:
+                self.retry_count += len(retries.history)
+        
+        return response
+    
+    def get_page(self, url, headers=None):
+        """
+        페이지를 가져옵니다. 캐시가 설정된 경우 조건부 요청으로 재검증합니다.
+        
+        Args:
+            url (str): 요청할 URL
+            headers (dict): 추가 요청 헤더
+            
+        Returns:
+            Page: 페이지 본문과 내용 해시
+        """
+        if self.cache is None:
+            response = self.get(url, headers=headers)
+            text = response.text
+            return Page(url, response.status_code, hash_text(text), text=text)
+        
+        entry = self.cache.lookup(url)
+        request_headers = dict(headers or {})
+        request_headers.update(self.cache.conditional_headers(entry))
+        
+        response = self.get(url, headers=request_headers)
+        
+        # 304: 저장된 본문을 재사용 (본문은 파싱이 필요할 때만 읽음)
+        if response.status_code == 304 and entry and (self.cache.bodies_dir / entry['body_hash']).exists():
+            self.cache.mark_hit()
+            body_hash = entry['body_hash']
+            return Page(url, 304, body_hash, loader=lambda: self.cache.load_body(body_hash), from_cache=True,
+                        headers=headers)
+        
+        if response.status_code == 304:
+            # 본문이 제거된 경우 조건 없이 다시 요청
+            response = self.get(url, headers=headers)
+        
+        return self._store_response(url, response, entry)
+    
+    def _store_response(self, url, response, entry):
+        """
+        응답 본문을 캐시에 저장하고 페이지로 반환합니다. (200 이외의 응답은 저장하지 않음)
+        
+        Args:
+            url (str): 요청 URL
+            response (requests.Response): 응답 객체
+            entry (dict): 요청 전에 조회한 캐시 항목
+            
+        Returns:
+            Page: 페이지 본문과 내용 해시
+        """
+        text = response.text
+        if response.status_code != 200:
+            return Page(url, response.status_code, hash_text(text), text=text)
+        
+        body_hash = self.cache.store(
+            url, text,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            previous=entry
+        )
+        return Page(url, 200, body_hash, text=text)
+    
+    def parse_page(self, page, key, parse_func):
+        """
+        페이지를 파싱합니다. 같은 본문 해시의 파싱 결과가 캐시에 있으면 파싱을 생략합니다.
+        
+        Args:
+            page (Page): 파싱할 페이지
+            key (str): 파싱 방식을 구분하는 키 (크롤러, 카테고리 등)
+            parse_func (callable): 본문 문자열을 받아 JSON 직렬화 가능한 결과를 반환하는 함수
+            
+        Returns:
+            파싱 결과
+        """
+        if self.cache is None or page.status_code not in (200, 304):
+            return parse_func(page.text)
+        
+        result = self.cache.load_parsed(page.body_hash, key)
+        if result is not None:
+            return result
+        
+        text = page.text
+        if text is None:
+            # 304 응답을 받은 뒤 본문이 캐시에서 제거된 경우 조건 없이 다시 받아 파싱
+            page = self._store_response(page.url, self.get(page.url, headers=page.headers), self.cache.lookup(page.url))
+            if page.status_code != 200:
+                return parse_func(page.text)
+            text = page.text
+        
+        result = parse_func(text)
+        self.cache.store_parsed(page.body_hash, key, result)
+        return result
+    
+    def _pool_stats(self):
+        """
+        호스트별 연결 풀에서 연결 생성 및 요청 수를 집계합니다.
+        
+        Returns:
+            tuple: (생성된 연결 수, 연결 풀을 거친 요청 수)
+        """
+        pools = self.adapter.poolmanager.pools
+        connections = 0
+        pooled_requests = 0
+        
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections += pool.num_connections
+            pooled_requests += pool.num_requests
+        
+        return connections, pooled_requests
+    
+    def stats(self):
+        """
+        요청 통계를 반환합니다.
+        
+        Returns:
+            dict: 요청 수, 재시도 수, 오류 수, 새 연결 수, 재사용된 연결 수, 캐시 통계
+        """
+        connections, pooled_requests = self._pool_stats()
+        
+        with self.lock:
+            stats = {
+                'requests': self.request_count,
+                'retries': self.retry_count,
+                'errors': self.error_count,
+                'new_connections': connections,
+                'reused_connections': max(0, pooled_requests - connections)
+            }
+        
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        
+        return stats
+    
+    def close(self):
+        """세션과 연결 풀을 닫습니다."""
+        self.session.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client():
+    """
+    모든 크롤러가 공유하는 기본 HttpClient를 반환합니다.
+    
+    Returns:
+        HttpClient: 공용 HTTP 클라이언트
+    """
+    global _default_client
+    
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
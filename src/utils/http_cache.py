@@ -0,0 +1,334 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+def hash_text(text):
+    """
+    문자열의 SHA-256 해시를 반환합니다.
+    
+    Args:
+        text (str): 해시할 문자열
+        
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _write_atomic(path, data):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class ResponseCache:
+    """
+    응답 본문을 내용 해시로 저장하는 디스크 캐시 클래스
+    
+    디렉토리 구조:
+        entries/<URL 해시>.json   URL별 메타데이터 (ETag, Last-Modified, 본문 해시)
+        bodies/<본문 해시>        응답 본문
+        parsed/<본문 해시>-<키 해시>.json   본문 파싱 결과
+    """
+    
+    def __init__(self, cache_dir, max_bytes=100 * 1024 * 1024):
+        """
+        ResponseCache 초기화
+        
+        Args:
+            cache_dir (str): 캐시 디렉토리 경로
+            max_bytes (int): 메타데이터, 본문 및 파싱 결과의 최대 총 크기 (초과 시 오래된 항목부터 제거)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.entries_dir = self.cache_dir / 'entries'
+        self.bodies_dir = self.cache_dir / 'bodies'
+        self.parsed_dir = self.cache_dir / 'parsed'
+        for directory in (self.entries_dir, self.bodies_dir, self.parsed_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total_bytes = self._scan_size()
+        
+        # 캐시 통계
+        self.counters = {
+            'hits': 0,           # 304 응답으로 저장된 본문을 재사용
+            'misses': 0,         # 캐시 항목이 없거나 본문이 바뀜
+            'unchanged': 0,      # 200 응답이지만 본문 해시가 동일
+            'parse_hits': 0,     # 저장된 파싱 결과 재사용
+            'parse_misses': 0,
+            'evictions': 0
+        }
+    
+    def _scan_size(self):
+        total = 0
+        for directory in (self.entries_dir, self.bodies_dir, self.parsed_dir):
+            for path in directory.iterdir():
+                try:
+                    total += path.stat().st_size
+                except OSError:
+                    continue
+        return total
+    
+    def _count(self, name):
+        with self.lock:
+            self.counters[name] += 1
+    
+    def _entry_path(self, url):
+        return self.entries_dir / f"{hash_text(url)}.json"
+    
+    def _parsed_path(self, body_hash, key):
+        return self.parsed_dir / f"{body_hash}-{hash_text(key)[:16]}.json"
+    
+    def lookup(self, url):
+        """
+        URL의 캐시 항목을 조회합니다.
+        
+        Args:
+            url (str): 요청 URL
+            
+        Returns:
+            dict: 캐시 항목 (없으면 None)
+        """
+        path = self._entry_path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def conditional_headers(self, entry):
+        """
+        캐시 항목으로 조건부 요청 헤더를 만듭니다.
+        
+        Args:
+            entry (dict): 캐시 항목
+            
+        Returns:
+            dict: If-None-Match / If-Modified-Since 헤더
+        """
+        headers = {}
+        if not entry:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def load_body(self, body_hash):
+        """
+        저장된 응답 본문을 읽습니다.
+        
+        Args:
+            body_hash (str): 본문 해시
+            
+        Returns:
+            str: 응답 본문 (제거된 경우 None)
+        """
+        path = self.bodies_dir / body_hash
+        try:
+            with open(path, 'rb') as f:
+                body = f.read().decode('utf-8')
+        except OSError:
+            return None
+        
+        self._touch(path)
+        return body
+    
+    def mark_hit(self):
+        """304 응답으로 저장된 본문을 재사용했음을 기록합니다."""
+        self._count('hits')
+    
+    def store(self, url, body, etag=None, last_modified=None, previous=None):
+        """
+        응답을 캐시에 저장합니다.
+        
+        Args:
+            url (str): 요청 URL
+            body (str): 응답 본문
+            etag (str): ETag 헤더 값
+            last_modified (str): Last-Modified 헤더 값
+            previous (dict): 요청 전에 조회한 캐시 항목
+            
+        Returns:
+            str: 본문 해시
+        """
+        body_hash = hash_text(body)
+        
+        if previous and previous.get('body_hash') == body_hash:
+            self._count('unchanged')
+        else:
+            self._count('misses')
+        
+        body_path = self.bodies_dir / body_hash
+        if not body_path.exists():
+            data = body.encode('utf-8')
+            _write_atomic(body_path, data)
+            with self.lock:
+                self.total_bytes += len(data)
+        else:
+            self._touch(body_path)
+        
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'body_hash': body_hash,
+            'stored_at': time.time()
+        }
+        data = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        entry_path = self._entry_path(url)
+        
+        # 같은 URL의 항목을 다시 쓰면 기존 파일 크기를 빼고 새 크기만 더함
+        with self.lock:
+            try:
+                previous_size = entry_path.stat().st_size
+            except OSError:
+                previous_size = 0
+            _write_atomic(entry_path, data)
+            self.total_bytes += len(data) - previous_size
+        
+        self._evict_if_needed()
+        return body_hash
+    
+    def load_parsed(self, body_hash, key):
+        """
+        본문 해시와 파싱 키에 해당하는 파싱 결과를 읽습니다.
+        
+        Args:
+            body_hash (str): 본문 해시
+            key (str): 파싱 방식을 구분하는 키 (크롤러, 카테고리 등)
+            
+        Returns:
+            파싱 결과 (없으면 None)
+        """
+        path = self._parsed_path(body_hash, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            self._count('parse_misses')
+            return None
+        
+        self._touch(path)
+        self._count('parse_hits')
+        return result
+    
+    def store_parsed(self, body_hash, key, result):
+        """
+        파싱 결과를 저장합니다.
+        
+        Args:
+            body_hash (str): 본문 해시
+            key (str): 파싱 방식을 구분하는 키
+            result: JSON으로 직렬화 가능한 파싱 결과
+        """
+        data = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        path = self._parsed_path(body_hash, key)
+        
+        # 같은 파싱 결과를 다시 저장하면 기존 파일 크기를 빼고 새 크기만 더함
+        with self.lock:
+            try:
+                previous_size = path.stat().st_size
+            except OSError:
+                previous_size = 0
+            _write_atomic(path, data)
+            self.total_bytes += len(data) - previous_size
+        
+        self._evict_if_needed()
+    
+    def _touch(self, path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+    
+    def _scan_entries(self):
+        """
+        URL별 메타데이터 파일을 본문 해시별로 모읍니다.
+        
+        Returns:
+            tuple: ({본문 해시: [(크기, 경로), ...]}, 메타데이터 파일 총 크기)
+        """
+        entries = {}
+        total = 0
+        for path in self.entries_dir.iterdir():
+            if path.suffix == '.tmp':
+                continue
+            try:
+                size = path.stat().st_size
+                with open(path, 'r', encoding='utf-8') as f:
+                    body_hash = json.load(f).get('body_hash')
+            except (OSError, ValueError):
+                continue
+            entries.setdefault(body_hash, []).append((size, path))
+            total += size
+        return entries, total
+    
+    def _evict_if_needed(self):
+        """
+        최대 크기를 넘으면 최근에 사용되지 않은 본문과 파싱 결과부터 제거합니다.
+        
+        본문을 제거하면 그 본문을 가리키는 URL별 메타데이터도 함께 지워 다음 요청이 조건부 요청 없이 다시 받도록 합니다.
+        """
+        with self.lock:
+            if self.total_bytes <= self.max_bytes:
+                return
+            
+            entries, entries_total = self._scan_entries()
+            
+            files = []
+            for directory in (self.bodies_dir, self.parsed_dir):
+                for path in directory.iterdir():
+                    if path.suffix == '.tmp':
+                        continue
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, path))
+            
+            files.sort(key=lambda x: x[0])
+            
+            # 한 번에 최대 크기의 80%까지 줄여 잦은 제거를 방지
+            target = int(self.max_bytes * 0.8)
+            total = entries_total + sum(size for _, size, _ in files)
+            for _, size, path in files:
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                self.counters['evictions'] += 1
+                
+                # 제거한 본문을 가리키는 메타데이터 삭제
+                if path.parent == self.bodies_dir:
+                    for entry_size, entry_path in entries.pop(path.name, []):
+                        try:
+                            entry_path.unlink()
+                        except OSError:
+                            continue
+                        total -= entry_size
+            
+            self.total_bytes = total
+    
+    def stats(self):
+        """
+        캐시 통계를 반환합니다.
+        
+        Returns:
+            dict: 적중/미스/파싱 재사용/제거 횟수 및 현재 크기
+        """
+        with self.lock:
+            stats = dict(self.counters)
+            stats['bytes'] = self.total_bytes
+            stats['max_bytes'] = self.max_bytes
+        return stats
@@ -0,0 +1,173 @@
+import bisect
+import heapq
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class KeywordIndex:
+    """
+    정규화된 키워드에서 기사/블로그 번호로 가는 역색인 클래스
+    
+    문서 목록(출처, 카테고리, 제목, URL 등 조회 결과에 필요한 필드만)과
+    키워드별 문서 번호 목록(오름차순)을 함께 저장하므로, 날짜 파일 전체를 읽지 않고
+    일치한 문서 수에 비례하는 시간에 키워드 조회에 답합니다.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    NEWS_FIELDS = ('title', 'url', 'press', 'category', 'date')
+    BLOG_FIELDS = ('title', 'url', 'author', 'keyword', 'date')
+    
+    def __init__(self, documents=None, postings=None, collection_time=None):
+        """
+        KeywordIndex 초기화 (보통은 build() 또는 load()로 생성)
+        
+        Args:
+            documents (list): 문서 목록 [{'type': 'news' | 'blog', 'source', ...}]
+            postings (dict): {키워드: 문서 번호 목록 (오름차순)}
+            collection_time (str): 색인한 데이터의 수집 시간
+        """
+        self.documents = documents or []
+        self.postings = postings or {}
+        self.collection_time = collection_time
+        self._sorted_terms = None
+        self.lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.documents)
+    
+    @classmethod
+    def build(cls, engine, news_data, blogs=(), collection_time=None):
+        """
+        뉴스 기사와 블로그 포스트로 역색인을 만듭니다.
+        
+        Args:
+            engine (KeywordEngine): 키워드 정규화에 사용할 엔진 (키워드 집계와 같은 단어 분리, 토큰 캐시 재사용)
+            news_data (list): 뉴스 기사 목록
+            blogs (list): 블로그 포스트 목록
+            collection_time (str): 수집 시간
+            
+        Returns:
+            KeywordIndex: 역색인
+        """
+        documents = []
+        texts = []
+        
+        for news in news_data:
+            document = {field: news.get(field, '') for field in cls.NEWS_FIELDS}
+            document['type'] = 'news'
+            document['source'] = news.get('source')
+            documents.append(document)
+            texts.append(news.get('title', '') + " " + news.get('summary', ''))
+        
+        for blog in blogs:
+            document = {field: blog.get(field, '') for field in cls.BLOG_FIELDS}
+            document['type'] = 'blog'
+            document['source'] = blog.get('source')
+            documents.append(document)
+            texts.append(blog.get('title', '') + " " + blog.get('summary', ''))
+        
+        postings = {}
+        for doc_id, words in enumerate(engine.document_tokens_many(texts)):
+            # 문서 안에서 처음 등장한 순서로 한 번씩만 기록 (문서 번호가 오름차순으로 쌓임)
+            for word in dict.fromkeys(words):
+                postings.setdefault(word, []).append(doc_id)
+        
+        return cls(documents, postings, collection_time)
+    
+    def _terms_with_prefix(self, prefix):
+        with self.lock:
+            if self._sorted_terms is None:
+                self._sorted_terms = sorted(self.postings)
+            terms = self._sorted_terms
+        
+        start = bisect.bisect_left(terms, prefix)
+        end = bisect.bisect_left(terms, prefix + '\U0010ffff')
+        return terms[start:end]
+    
+    def _postings(self, term, prefix):
+        if not prefix:
+            return self.postings.get(term, [])
+        
+        # 접두어가 같은 키워드의 문서 번호를 정렬 상태로 병합 (조사가 붙은 표기 포함)
+        merged = []
+        for doc_id in heapq.merge(*(self.postings[match] for match in self._terms_with_prefix(term))):
+            if not merged or merged[-1] != doc_id:
+                merged.append(doc_id)
+        return merged
+    
+    def lookup(self, terms, prefix=False):
+        """
+        모든 키워드를 포함하는 문서 번호를 반환합니다.
+        
+        Args:
+            terms (list): 정규화된 키워드 목록
+            prefix (bool): 키워드로 시작하는 단어도 일치로 볼지 여부 (예: '금리'로 '금리가', '금리는' 포함)
+            
+        Returns:
+            list: 문서 번호 목록 (오름차순)
+        """
+        if not terms:
+            return []
+        
+        # 가장 짧은 목록부터 교집합
+        postings = sorted((self._postings(term, prefix) for term in terms), key=len)
+        result = postings[0]
+        for other in postings[1:]:
+            if not result:
+                break
+            other_set = set(other)
+            result = [doc_id for doc_id in result if doc_id in other_set]
+        
+        return list(result)
+    
+    def save(self, path):
+        """
+        역색인을 파일에 원자적으로 저장합니다.
+        
+        Args:
+            path (str): 색인 파일 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        data = {
+            'version': self.FORMAT_VERSION,
+            'collection_time': self.collection_time,
+            'documents': self.documents,
+            'postings': self.postings
+        }
+        
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        저장된 역색인을 읽습니다.
+        
+        Args:
+            path (str): 색인 파일 경로
+            
+        Returns:
+            KeywordIndex: 역색인 (없거나 형식이 다르면 None)
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"키워드 색인 로드 중 오류 발생: {e}")
+            return None
+        
+        if data.get('version') != cls.FORMAT_VERSION:
+            return None
+        
+        return cls(data.get('documents', []), data.get('postings', {}), data.get('collection_time'))
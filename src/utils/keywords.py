@@ -0,0 +1,362 @@
+import re
+from collections import Counter
+
+from .morphology import MorphTokenizer, HAS_KONLPY
+from .token_cache import document_key
+from .sketch import SpaceSaving
+
+# 기본 불용어 목록
+DEFAULT_STOPWORDS = frozenset([
+    '있다', '하다', '이다', '되다', '않다', '그', '및', '등', '를', '을', '이', '가', '의', '에', '로', '으로'
+])
+
+# 특수문자와 숫자를 한 번에 제거하는 패턴
+CLEAN_PATTERN = re.compile(r'[^\w\s]|\d')
+
+
+class WhitespaceTokenizer:
+    """특수문자와 숫자를 지우고 공백 기준으로 단어를 나누는 기본 토크나이저 클래스"""
+    
+    name = 'whitespace'
+    
+    # 문서를 모아 둘 필요가 없으므로 하나씩 처리
+    batch_size = 1
+    
+    def tokenize(self, text):
+        """
+        텍스트를 단어로 분리합니다.
+        
+        Args:
+            text (str): 분리할 텍스트
+            
+        Returns:
+            list: 단어 목록
+        """
+        return CLEAN_PATTERN.sub('', text).split()
+    
+    def tokenize_many(self, texts):
+        """
+        여러 텍스트를 단어로 분리합니다.
+        
+        Args:
+            texts (list): 텍스트 목록
+            
+        Returns:
+            list: 텍스트별 단어 목록
+        """
+        return [CLEAN_PATTERN.sub('', text).split() for text in texts]
+    
+    def close(self):
+        """정리할 자원이 없습니다."""
+
+
+def get_tokenizer(name=None, **options):
+    """
+    키워드 추출에 사용할 토크나이저를 생성합니다.
+    
+    Args:
+        name (str): 'whitespace' 또는 'morph' (기본값: 'whitespace')
+        **options: MorphTokenizer에 전달할 옵션 (analyzer, max_workers, batch_size)
+        
+    Returns:
+        WhitespaceTokenizer | MorphTokenizer: 토크나이저 (형태소 분석기를 시작하지 못하면 공백 기준으로 대체)
+    """
+    if name is None or name == 'whitespace':
+        return WhitespaceTokenizer()
+    
+    if name != 'morph':
+        raise ValueError(f"지원하지 않는 토크나이저입니다: {name} (가능한 값: ['whitespace', 'morph'])")
+    
+    if not HAS_KONLPY:
+        print("konlpy를 사용할 수 없어 공백 기준 토크나이저를 사용합니다.")
+        return WhitespaceTokenizer()
+    
+    return MorphTokenizer(fallback=WhitespaceTokenizer(), **options)
+
+
+class KeywordEngine:
+    """크롤러와 트렌드 서비스가 공유하는 키워드 추출 엔진 클래스"""
+    
+    def __init__(self, stopwords=None, min_length=2, tokenizer=None, token_cache=None):
+        """
+        키워드 추출 엔진 초기화
+        
+        Args:
+            stopwords (iterable): 불용어 목록 (기본값: DEFAULT_STOPWORDS)
+            min_length (int): 키워드로 인정할 최소 단어 길이
+            tokenizer (WhitespaceTokenizer | MorphTokenizer): 단어 분리기 (기본값: 공백 기준 토크나이저)
+            token_cache (TokenCache): 문서별 단어 빈도 캐시 (기본값: 캐시 사용 안 함)
+        """
+        self.stopwords = frozenset(stopwords) if stopwords is not None else DEFAULT_STOPWORDS
+        self.min_length = min_length
+        self.tokenizer = tokenizer if tokenizer is not None else WhitespaceTokenizer()
+        self.token_cache = token_cache
+    
+    def _filter(self, words):
+        stopwords = self.stopwords
+        min_length = self.min_length
+        
+        return [word for word in words if len(word) >= min_length and word not in stopwords]
+    
+    def tokenize(self, text):
+        """
+        텍스트를 키워드 후보 단어로 분리합니다.
+        
+        Args:
+            text (str): 분리할 텍스트
+            
+        Returns:
+            list: 불용어와 짧은 단어를 제외한 단어 목록
+        """
+        return self._filter(self.tokenizer.tokenize(text))
+    
+    def tokenize_many(self, texts):
+        """
+        여러 텍스트를 한 번에 키워드 후보 단어로 분리합니다. (형태소 토크나이저는 병렬 처리)
+        
+        Args:
+            texts (list): 텍스트 목록
+            
+        Returns:
+            list: 텍스트별 단어 목록
+        """
+        return [self._filter(words) for words in self.tokenizer.tokenize_many(texts)]
+    
+    def document_tokens(self, text):
+        """
+        문서 하나의 단어를 반환합니다. 토큰 캐시가 있으면 이전에 집계한 빈도를 재사용합니다.
+        
+        Args:
+            text (str): 문서 텍스트 (제목 + 요약)
+            
+        Returns:
+            list | dict: 단어 목록 또는 {단어: 빈도} (둘 다 Counter.update에 그대로 사용 가능)
+        """
+        if self.token_cache is None:
+            return self.tokenize(text)
+        
+        name = self.tokenizer.name
+        counts = self.token_cache.get(document_key(text, name))
+        if counts is None:
+            # 토큰화 도중 대체 토크나이저로 바뀌었으면 바뀐 이름의 키로 저장
+            words = self.tokenize(text)
+            counts = self.token_cache.put(document_key(text, self.tokenizer.name), words)
+        return counts
+    
+    def document_tokens_many(self, texts):
+        """
+        여러 문서의 단어를 반환합니다. 캐시에 없는 문서만 묶어서 분리합니다.
+        
+        Args:
+            texts (list): 문서 텍스트 목록
+            
+        Returns:
+            list: 문서별 단어 목록 또는 {단어: 빈도}
+        """
+        if self.token_cache is None:
+            return self.tokenize_many(texts)
+        
+        name = self.tokenizer.name
+        keys = [document_key(text, name) for text in texts]
+        results = [self.token_cache.get(key) for key in keys]
+        
+        missing = [index for index, counts in enumerate(results) if counts is None]
+        if missing:
+            word_lists = self.tokenize_many([texts[index] for index in missing])
+            if self.tokenizer.name != name:
+                # 토큰화 도중 대체 토크나이저로 바뀌었으면 바뀐 이름의 키로 저장
+                keys = [document_key(text, self.tokenizer.name) for text in texts]
+            for index, words in zip(missing, word_lists):
+                results[index] = self.token_cache.put(keys[index], words)
+        
+        return results
+    
+    def count(self, text):
+        """
+        텍스트의 단어 빈도를 계산합니다.
+        
+        Args:
+            text (str): 텍스트
+            
+        Returns:
+            Counter: 단어별 빈도
+        """
+        return Counter(self.tokenize(text))
+    
+    def top(self, word_freq, top_n):
+        """
+        단어 빈도에서 상위 키워드를 반환합니다.
+        
+        전체를 정렬하지 않고 상위 top_n개만 고르며, 빈도가 같은 단어는 먼저 등장한 순서를 유지합니다.
+        
+        Args:
+            word_freq (Counter): 단어별 빈도
+            top_n (int): 반환할 키워드 수
+            
+        Returns:
+            list: 키워드 목록
+        """
+        return [word for word, freq in word_freq.most_common(top_n)]
+    
+    def extract(self, text, top_n=10):
+        """
+        텍스트에서 키워드를 추출합니다.
+        
+        Args:
+            text (str): 키워드를 추출할 텍스트
+            top_n (int): 추출할 키워드 수
+            
+        Returns:
+            list: 키워드 목록
+        """
+        return self.top(self.count(text), top_n)
+    
+    def counter(self, groups=()):
+        """
+        전체 및 그룹별 단어 빈도를 한 번에 누적하는 카운터를 생성합니다.
+        
+        Args:
+            groups (iterable): 미리 만들어 둘 그룹 목록 (결과의 그룹 순서가 됨)
+            
+        Returns:
+            KeywordCounter: 빈도 누적기
+        """
+        return KeywordCounter(self, groups)
+    
+    def count_by_group(self, documents, groups=()):
+        """
+        (그룹, 텍스트) 목록을 한 번만 훑어 전체 및 그룹별 단어 빈도를 계산합니다.
+        
+        Args:
+            documents (iterable): (그룹, 텍스트) 튜플
+            groups (iterable): 결과에 항상 포함할 그룹 목록
+            
+        Returns:
+            KeywordCounter: 빈도 누적기
+        """
+        counter = self.counter(groups)
+        for group, text in documents:
+            counter.add(text, group)
+        return counter
+
+
+class KeywordCounter:
+    """문서를 하나씩 받아 전체 및 그룹별 단어 빈도를 누적하는 클래스"""
+    
+    def __init__(self, engine, groups=()):
+        """
+        빈도 누적기 초기화
+        
+        Args:
+            engine (KeywordEngine): 토큰화에 사용할 엔진
+            groups (iterable): 미리 만들어 둘 그룹 목록
+        """
+        self.engine = engine
+        self.overall = Counter()
+        self.by_group = {group: Counter() for group in groups}
+        
+        # 토크나이저가 묶음 처리를 하면 문서를 batch_size만큼 모아서 분리
+        self.batch_size = getattr(engine.tokenizer, 'batch_size', 1)
+        self.pending = []
+    
+    def add(self, text, group=None):
+        """
+        문서 하나의 단어 빈도를 누적합니다.
+        
+        Args:
+            text (str): 문서 텍스트
+            group (str): 문서가 속한 그룹 (None이면 전체 빈도에만 반영)
+        """
+        if self.batch_size <= 1:
+            self._update(self.engine.document_tokens(text), group)
+            return
+        
+        self.pending.append((text, group))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """모아 둔 문서를 한 번에 분리하여 빈도에 반영합니다."""
+        if not self.pending:
+            return
+        
+        pending, self.pending = self.pending, []
+        word_lists = self.engine.document_tokens_many([text for text, group in pending])
+        for (text, group), words in zip(pending, word_lists):
+            self._update(words, group)
+    
+    def _update(self, words, group):
+        self.overall.update(words)
+        
+        if group is not None:
+            if group not in self.by_group:
+                self.by_group[group] = Counter()
+            self.by_group[group].update(words)
+    
+    def top(self, top_n):
+        """
+        전체 상위 키워드를 반환합니다.
+        
+        Args:
+            top_n (int): 반환할 키워드 수
+            
+        Returns:
+            list: 키워드 목록
+        """
+        self.flush()
+        return self.engine.top(self.overall, top_n)
+    
+    def top_by_group(self, top_n):
+        """
+        그룹별 상위 키워드를 반환합니다.
+        
+        Args:
+            top_n (int): 그룹별로 반환할 키워드 수
+            
+        Returns:
+            dict: {그룹: 키워드 목록}
+        """
+        self.flush()
+        return {group: self.engine.top(word_freq, top_n) for group, word_freq in self.by_group.items()}
+    
+    def sketch(self, capacity=200):
+        """
+        전체 단어 빈도의 상위 키워드 스케치를 만듭니다.
+        
+        Args:
+            capacity (int): 스케치에 유지할 최대 키워드 수
+            
+        Returns:
+            SpaceSaving: 전체 빈도 스케치
+        """
+        self.flush()
+        return SpaceSaving.from_counts(self.overall, capacity)
+    
+    def sketch_by_group(self, capacity=200):
+        """
+        그룹별 단어 빈도의 상위 키워드 스케치를 만듭니다.
+        
+        Args:
+            capacity (int): 스케치에 유지할 최대 키워드 수
+            
+        Returns:
+            dict: {그룹: SpaceSaving}
+        """
+        self.flush()
+        return {group: SpaceSaving.from_counts(word_freq, capacity) for group, word_freq in self.by_group.items()}
+
+
+_default_engine = None
+
+
+def get_keyword_engine():
+    """
+    모든 크롤러가 공유하는 기본 키워드 추출 엔진을 반환합니다.
+    
+    Returns:
+        KeywordEngine: 기본 엔진
+    """
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = KeywordEngine()
+    return _default_engine
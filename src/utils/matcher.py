@@ -0,0 +1,229 @@
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    여러 단어를 한 번의 선형 탐색으로 찾는 Aho-Corasick 자동자 클래스
+    
+    단어를 모두 추가한 뒤 build()로 실패 링크를 만들면, 텍스트 길이에 비례하는 시간에
+    등록된 모든 단어의 부분 문자열 일치를 찾습니다.
+    """
+    
+    def __init__(self, terms=()):
+        """
+        자동자 초기화
+        
+        Args:
+            terms (iterable): 찾을 단어 목록 (빈 문자열은 무시)
+        """
+        self.goto = [{}]
+        self.fail = [0]
+        self.own = [()]
+        self.output = [()]
+        self.terms = []
+        self.built = False
+        
+        for term in terms:
+            self.add(term)
+        self.build()
+    
+    def add(self, term):
+        """
+        찾을 단어를 추가합니다. 추가 후에는 build()를 다시 호출해야 합니다.
+        
+        Args:
+            term (str): 단어
+        """
+        if not term:
+            return
+        
+        node = 0
+        for char in term:
+            next_node = self.goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto[node][char] = next_node
+                self.goto.append({})
+                self.fail.append(0)
+                self.own.append(())
+            node = next_node
+        
+        if not self.own[node]:
+            self.own[node] = (term,)
+            self.terms.append(term)
+        self.built = False
+    
+    def build(self):
+        """너비 우선으로 실패 링크를 만들고 접미사 단어를 출력에 합칩니다."""
+        self.output = list(self.own)
+        
+        queue = deque()
+        for node in self.goto[0].values():
+            self.fail[node] = 0
+            queue.append(node)
+        
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self.goto[node].items():
+                queue.append(next_node)
+                
+                fail = self.fail[node]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_node] = self.goto[fail].get(char, 0)
+                
+                # 실패 링크가 가리키는 노드(더 짧은 접미사)의 단어도 함께 일치
+                self.output[next_node] = self.output[next_node] + self.output[self.fail[next_node]]
+        
+        self.built = True
+    
+    def iter_matches(self, text):
+        """
+        텍스트에서 일치하는 단어를 등장 순서대로 반환합니다.
+        
+        Args:
+            text (str): 탐색할 텍스트
+            
+        Yields:
+            tuple: (끝 위치, 단어)
+        """
+        if not self.built:
+            self.build()
+        
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        node = 0
+        
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            
+            for term in output[node]:
+                yield index, term
+    
+    def find(self, text):
+        """
+        텍스트에 포함된 단어를 중복 없이 처음 등장한 순서대로 반환합니다.
+        
+        Args:
+            text (str): 탐색할 텍스트
+            
+        Returns:
+            list: 일치한 단어 목록
+        """
+        if not self.built:
+            self.build()
+        
+        # iter_matches와 같은 탐색을 제너레이터 없이 수행 (제목마다 호출되는 경로)
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        node = 0
+        found = {}
+        
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            
+            if output[node]:
+                for term in output[node]:
+                    found[term] = None
+        
+        return list(found)
+    
+    def contains_any(self, text):
+        """
+        텍스트에 등록된 단어가 하나라도 포함되어 있는지 확인합니다. (첫 일치에서 중단)
+        
+        Args:
+            text (str): 탐색할 텍스트
+            
+        Returns:
+            bool: 포함 여부
+        """
+        if not self.built:
+            self.build()
+        
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        node = 0
+        
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            
+            if output[node]:
+                return True
+        
+        return False
+
+
+class TopicMatcher:
+    """주제별 어휘 사전을 하나의 자동자로 묶어 한 번의 탐색으로 주제를 분류하는 클래스"""
+    
+    def __init__(self, lexicons):
+        """
+        주제 분류기 초기화
+        
+        Args:
+            lexicons (dict): {주제: 단어 목록}
+        """
+        self.topics = {}
+        for topic, terms in lexicons.items():
+            for term in terms:
+                if term:
+                    self.topics.setdefault(term, [])
+                    if topic not in self.topics[term]:
+                        self.topics[term].append(topic)
+        
+        self.automaton = AhoCorasick(self.topics.keys())
+    
+    def match(self, text):
+        """
+        텍스트가 속한 주제와 주제별로 일치한 단어를 반환합니다.
+        
+        Args:
+            text (str): 분류할 텍스트
+            
+        Returns:
+            dict: {주제: 일치한 단어 목록}
+        """
+        matched = {}
+        for term in self.automaton.find(text):
+            for topic in self.topics[term]:
+                matched.setdefault(topic, []).append(term)
+        return matched
+    
+    def find(self, text, topic):
+        """
+        텍스트에서 특정 주제의 단어를 찾습니다.
+        
+        Args:
+            text (str): 탐색할 텍스트
+            topic (str): 주제
+            
+        Returns:
+            list: 일치한 단어 목록
+        """
+        return [term for term in self.automaton.find(text) if topic in self.topics[term]]
+    
+    def matches(self, text, topic):
+        """
+        텍스트가 특정 주제에 속하는지 확인합니다. (첫 일치에서 중단)
+        
+        Args:
+            text (str): 확인할 텍스트
+            topic (str): 주제
+            
+        Returns:
+            bool: 주제 단어 포함 여부
+        """
+        for _, term in self.automaton.iter_matches(text):
+            if topic in self.topics[term]:
+                return True
+        return False
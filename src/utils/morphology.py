@@ -0,0 +1,203 @@
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# konlpy는 선택 의존성 (없으면 공백 기준 토크나이저 사용)
+try:
+    import konlpy.tag
+    HAS_KONLPY = True
+except ImportError:
+    HAS_KONLPY = False
+
+# 형태소 분석 전에 특수문자와 숫자를 공백으로 바꾸는 패턴 (단어가 붙지 않도록 공백으로 치환)
+MORPH_CLEAN_PATTERN = re.compile(r'[^\w\s]|\d')
+
+# 작업자 프로세스마다 한 번만 생성하는 형태소 분석기
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_name):
+    """
+    작업자 프로세스 초기화 함수입니다. 형태소 분석기(JVM)를 생성하고 미리 한 번 실행해 둡니다.
+    
+    Args:
+        analyzer_name (str): konlpy.tag의 분석기 클래스 이름
+    """
+    global _worker_analyzer
+    _worker_analyzer = getattr(konlpy.tag, analyzer_name)()
+    _worker_analyzer.nouns('형태소 분석기 초기화')
+
+
+def _analyze_batch(texts):
+    """
+    작업자 프로세스에서 문서 묶음의 명사를 추출합니다.
+    
+    Args:
+        texts (list): 문서 텍스트 목록
+        
+    Returns:
+        list: 문서별 명사 목록
+    """
+    return [_worker_analyzer.nouns(MORPH_CLEAN_PATTERN.sub(' ', text)) for text in texts]
+
+
+def _ready():
+    """작업자 프로세스가 초기화를 마쳤는지 확인하는 빈 작업입니다."""
+    return os.getpid()
+
+
+class MorphTokenizer:
+    """
+    konlpy 형태소 분석기를 프로세스 풀에서 실행하는 명사 토크나이저 클래스
+    
+    문서 하나만 분석할 때는 프로세스 풀을 띄우지 않고 현재 프로세스의 분석기를 사용합니다.
+    분석기(JVM)를 시작하지 못하면 경고를 출력하고 이후로는 대체 토크나이저를 사용합니다.
+    """
+    
+    name = 'morph'
+    
+    def __init__(self, analyzer='Okt', max_workers=None, batch_size=512, fallback=None):
+        """
+        형태소 토크나이저 초기화
+        
+        Args:
+            analyzer (str): konlpy.tag의 분석기 클래스 이름 ('Okt', 'Komoran', 'Hannanum', 'Kkma', 'Mecab')
+            max_workers (int): 작업자 프로세스 수 (기본값: CPU 코어 수)
+            batch_size (int): 키워드 집계 시 한 번에 분석할 문서 수
+            fallback (WhitespaceTokenizer): 분석기를 시작하지 못했을 때 사용할 토크나이저 (기본값: 없음, 오류 발생)
+        """
+        if not HAS_KONLPY:
+            raise ImportError("형태소 분석에는 konlpy가 필요합니다.")
+        
+        if not hasattr(konlpy.tag, analyzer):
+            raise ValueError(f"지원하지 않는 형태소 분석기입니다: {analyzer}")
+        
+        self.analyzer = analyzer
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.fallback = fallback
+        self.failed = False
+        self.executor = None
+        self._local_analyzer = None
+        self.lock = threading.Lock()
+    
+    def start(self):
+        """
+        프로세스 풀을 시작하고 모든 작업자의 분석기를 미리 초기화합니다.
+        
+        Returns:
+            ProcessPoolExecutor: 작업자 프로세스 풀
+        """
+        with self.lock:
+            if self.executor is None:
+                # JVM은 fork 이후 안전하지 않으므로 spawn으로 작업자 생성
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.analyzer,)
+                )
+                # 작업자 수만큼 빈 작업을 보내 JVM 기동 비용을 첫 분석 전에 치름
+                # (작업자의 분석기 초기화가 실패하면 풀이 깨지므로 여기서 오류가 발생)
+                try:
+                    for future in [self.executor.submit(_ready) for _ in range(self.max_workers)]:
+                        future.result()
+                except BaseException:
+                    self.executor.shutdown(wait=False, cancel_futures=True)
+                    self.executor = None
+                    raise
+            return self.executor
+    
+    def _use_fallback(self, error):
+        """
+        형태소 분석기를 사용할 수 없을 때 대체 토크나이저로 전환합니다.
+        
+        토큰 캐시가 두 방식의 결과를 섞지 않도록 이름도 대체 토크나이저의 이름으로 바꿉니다.
+        
+        Args:
+            error (Exception): 분석기를 시작하거나 실행하다 발생한 오류
+        """
+        with self.lock:
+            if self.failed:
+                return
+            print(f"형태소 분석기를 사용할 수 없어 {self.fallback.name} 토크나이저를 사용합니다: {error}")
+            self.failed = True
+            self.name = self.fallback.name
+            executor, self.executor = self.executor, None
+        
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def tokenize(self, text):
+        """
+        문서 하나의 명사를 추출합니다.
+        
+        프로세스 풀이 이미 떠 있으면 풀에서, 아니면 현재 프로세스의 분석기로 분석합니다.
+        
+        Args:
+            text (str): 문서 텍스트
+            
+        Returns:
+            list: 명사 목록
+        """
+        if self.failed:
+            return self.fallback.tokenize(text)
+        
+        if self.executor is not None:
+            return self.tokenize_many([text])[0]
+        
+        try:
+            with self.lock:
+                if self._local_analyzer is None:
+                    self._local_analyzer = getattr(konlpy.tag, self.analyzer)()
+                return self._local_analyzer.nouns(MORPH_CLEAN_PATTERN.sub(' ', text))
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            self._use_fallback(e)
+            return self.fallback.tokenize(text)
+    
+    def tokenize_many(self, texts):
+        """
+        문서 목록을 작업자 수에 맞게 나누어 병렬로 명사를 추출합니다.
+        
+        Args:
+            texts (list): 문서 텍스트 목록
+            
+        Returns:
+            list: 입력 순서와 같은 순서의 문서별 명사 목록
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        
+        if self.failed:
+            return self.fallback.tokenize_many(texts)
+        
+        # 문서 하나 때문에 프로세스 풀을 띄우지 않음
+        if len(texts) == 1 and self.executor is None:
+            return [self.tokenize(texts[0])]
+        
+        try:
+            executor = self.start()
+            chunk_size = -(-len(texts) // self.max_workers)
+            chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+            
+            results = []
+            for chunk_result in executor.map(_analyze_batch, chunks):
+                results.extend(chunk_result)
+            return results
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            self._use_fallback(e)
+            return self.fallback.tokenize_many(texts)
+    
+    def close(self):
+        """프로세스 풀을 종료합니다."""
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
@@ -0,0 +1,380 @@
+import os
+import re
+import struct
+import threading
+import zlib
+from array import array
+from datetime import date
+from pathlib import Path
+
+from .seen_index import url_fingerprint
+
+# 공백, 특수문자, 밑줄을 지워 표기 차이를 무시하기 위한 패턴
+NORMALIZE_PATTERN = re.compile(r'[\W_]+')
+
+
+def minhash_signature(text, num_bins=32, shingle_size=3):
+    """
+    텍스트의 MinHash 서명을 계산합니다.
+    
+    글자 단위 n-gram을 한 번씩만 해시하는 단일 순열 MinHash(one permutation hashing)를 사용하고,
+    비어 있는 칸은 오른쪽의 가장 가까운 칸 값으로 채웁니다(회전 채우기).
+    
+    Args:
+        text (str): 제목과 요약
+        num_bins (int): 서명 길이 (2의 거듭제곱)
+        shingle_size (int): n-gram 글자 수
+        
+    Returns:
+        tuple: 정수 서명 (비교할 글자가 없으면 None)
+    """
+    normalized = NORMALIZE_PATTERN.sub('', text).lower()
+    if not normalized:
+        return None
+    
+    if len(normalized) <= shingle_size:
+        shingles = {normalized}
+    else:
+        shingles = {normalized[i:i + shingle_size] for i in range(len(normalized) - shingle_size + 1)}
+    
+    shift = num_bins.bit_length() - 1
+    mask = num_bins - 1
+    bins = [None] * num_bins
+    
+    for value in map(zlib.crc32, (shingle.encode('utf-8') for shingle in shingles)):
+        index = value & mask
+        value >>= shift
+        current = bins[index]
+        if current is None or value < current:
+            bins[index] = value
+    
+    # 빈 칸 채우기: 오른쪽으로 가장 가까운 칸의 값에 거리만큼 오프셋을 더함
+    # (오프셋이 값의 범위보다 커서 원래 최솟값과 겹치지 않고, 결과는 32비트 안에 들어감)
+    offset = 1 << (32 - shift)
+    signature = list(bins)
+    for index in range(num_bins):
+        if bins[index] is None:
+            distance = 1
+            while bins[(index + distance) % num_bins] is None:
+                distance += 1
+            signature[index] = bins[(index + distance) % num_bins] + distance * offset
+    
+    return tuple(signature)
+
+
+def similarity(left, right):
+    """
+    두 MinHash 서명의 추정 자카드 유사도를 계산합니다.
+    
+    Args:
+        left (tuple): 서명
+        right (tuple): 서명
+        
+    Returns:
+        float: 0~1 사이의 유사도
+    """
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+class NearDuplicateIndex:
+    """
+    기사 MinHash 서명을 LSH 버킷에 저장하여 유사 중복 기사를 찾는 영속 인덱스 클래스
+    
+    서명을 bands개의 구간으로 나누어 구간 값이 같은 기사만 후보로 비교하므로,
+    인덱스가 커져도 기사당 조회 비용은 후보 수에만 비례합니다.
+    각 항목은 URL 지문, 묶음 대표 기사의 URL 지문, 마지막으로 본 날짜(서수), 서명을 저장하며
+    보존 기간이 지난 항목은 저장 시 제거됩니다.
+    """
+    
+    MAGIC = b'NDUP1'
+    
+    def __init__(self, path=None, num_bins=32, bands=8, threshold=0.7, shingle_size=3, retention_days=7):
+        """
+        NearDuplicateIndex 초기화
+        
+        Args:
+            path (str): 인덱스 파일 경로 (None이면 메모리에만 유지)
+            num_bins (int): 서명 길이 (2의 거듭제곱, bands로 나누어떨어져야 함)
+            bands (int): LSH 구간 수 (많을수록 재현율이 높고 후보가 늘어남)
+            threshold (float): 중복으로 판단할 최소 추정 유사도
+            shingle_size (int): n-gram 글자 수
+            retention_days (int): 항목을 유지할 기간 (일)
+        """
+        if num_bins & (num_bins - 1) or num_bins % bands:
+            raise ValueError("num_bins는 2의 거듭제곱이고 bands로 나누어떨어져야 합니다.")
+        
+        self.path = Path(path) if path is not None else None
+        self.num_bins = num_bins
+        self.bands = bands
+        self.rows = num_bins // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.retention_days = retention_days
+        self.lock = threading.Lock()
+        
+        # {URL 지문: (대표 기사 URL 지문, 날짜 서수, 서명)}
+        self.entries = {}
+        # {(구간 번호, 구간 값): [URL 지문]}
+        self.buckets = {}
+        self._load()
+    
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        
+        try:
+            with open(self.path, 'rb') as f:
+                if f.read(len(self.MAGIC)) != self.MAGIC:
+                    print(f"중복 기사 인덱스 형식이 올바르지 않아 새로 시작합니다: {self.path}")
+                    return
+                count, num_bins = struct.unpack('<QI', f.read(12))
+                if num_bins != self.num_bins:
+                    print("중복 기사 인덱스의 서명 길이가 달라 새로 시작합니다.")
+                    return
+                keys = array('Q')
+                canonicals = array('Q')
+                days = array('I')
+                signatures = array('I')
+                keys.fromfile(f, count)
+                canonicals.fromfile(f, count)
+                days.fromfile(f, count)
+                signatures.fromfile(f, count * num_bins)
+        except (OSError, EOFError, struct.error) as e:
+            print(f"중복 기사 인덱스 로드 중 오류 발생: {e}")
+            return
+        
+        for index, key in enumerate(keys):
+            signature = tuple(signatures[index * num_bins:(index + 1) * num_bins])
+            self._insert(key, canonicals[index], days[index], signature)
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+    
+    def _insert(self, key, canonical, day, signature):
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (canonical, day, signature)
+        for band_key in self._band_keys(signature):
+            self.buckets.setdefault(band_key, []).append(key)
+    
+    def _remove(self, key):
+        canonical, day, signature = self.entries.pop(key)
+        for band_key in self._band_keys(signature):
+            bucket = self.buckets.get(band_key)
+            if bucket is not None:
+                try:
+                    bucket.remove(key)
+                except ValueError:
+                    pass
+                if not bucket:
+                    del self.buckets[band_key]
+    
+    def signature(self, text):
+        """
+        텍스트의 MinHash 서명을 계산합니다.
+        
+        Args:
+            text (str): 제목과 요약
+            
+        Returns:
+            tuple: 서명 (비교할 글자가 없으면 None)
+        """
+        return minhash_signature(text, self.num_bins, self.shingle_size)
+    
+    def find(self, signature, exclude=None, prefer_day=None):
+        """
+        서명과 가장 비슷한 기존 기사를 찾습니다.
+        
+        Args:
+            signature (tuple): 서명
+            exclude (int): 후보에서 제외할 URL 지문 (자기 자신)
+            prefer_day (int): 이 날짜 서수 이후에 본 기사를 유사도와 관계없이 먼저 고름 (기본값: 유사도만 비교)
+            
+        Returns:
+            tuple: (대표 기사 URL 지문, 날짜 서수, 유사도), 임계값 이상인 기사가 없으면 None
+        """
+        if signature is None:
+            return None
+        
+        best = None
+        best_rank = None
+        with self.lock:
+            checked = set()
+            for band_key in self._band_keys(signature):
+                for key in self.buckets.get(band_key, ()):
+                    if key == exclude or key in checked:
+                        continue
+                    checked.add(key)
+                    
+                    canonical, day, other = self.entries[key]
+                    score = similarity(signature, other)
+                    if score < self.threshold:
+                        continue
+                    
+                    rank = (prefer_day is not None and day >= prefer_day, score)
+                    if best is None or rank > best_rank:
+                        best = (canonical, day, score)
+                        best_rank = rank
+        
+        return best
+    
+    def add(self, key, signature, canonical=None, day=None):
+        """
+        기사를 인덱스에 추가합니다.
+        
+        Args:
+            key (int): 기사 URL 지문
+            signature (tuple): 서명 (None이면 추가하지 않음)
+            canonical (int): 묶음 대표 기사의 URL 지문 (기본값: 자기 자신)
+            day (int): 날짜 서수 (기본값: 오늘)
+        """
+        if signature is None:
+            return
+        
+        if canonical is None:
+            canonical = key
+        if day is None:
+            day = date.today().toordinal()
+        
+        with self.lock:
+            self._insert(key, canonical, day, signature)
+    
+    def save(self):
+        """보존 기간이 지난 항목을 제거하고 인덱스를 파일에 원자적으로 저장합니다."""
+        if self.path is None:
+            return
+        
+        cutoff = date.today().toordinal() - self.retention_days
+        
+        with self.lock:
+            for key in [key for key, (_, day, _) in self.entries.items() if day < cutoff]:
+                self._remove(key)
+            
+            keys = array('Q', self.entries.keys())
+            canonicals = array('Q')
+            days = array('I')
+            signatures = array('I')
+            for canonical, day, signature in self.entries.values():
+                canonicals.append(canonical)
+                days.append(day)
+                signatures.extend(signature)
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack('<QI', len(keys), self.num_bins))
+            keys.tofile(f)
+            canonicals.tofile(f)
+            days.tofile(f)
+            signatures.tofile(f)
+        os.replace(tmp_path, self.path)
+
+
+class DuplicateFilter:
+    """
+    한 번의 수집에서 들어오는 기사를 순서대로 받아 유사 중복 묶음을 만드는 클래스
+    
+    묶음마다 처음 들어온 기사(또는 오늘 이미 저장된 기사)를 대표로 남기고,
+    이후의 중복 기사는 대표 기사의 'duplicates' 목록에 링크로만 기록합니다.
+    중복 제거는 같은 날짜 안에서만 하며, 이전 날짜에 본 묶음의 기사는 오늘의 대표 기사로 남겨
+    오늘의 기사 수와 키워드 집계에 포함합니다.
+    """
+    
+    def __init__(self, index, known_records=()):
+        """
+        DuplicateFilter 초기화
+        
+        Args:
+            index (NearDuplicateIndex): 소스와 날짜에 걸쳐 공유하는 중복 인덱스
+            known_records (iterable): 오늘 이미 저장된 기사 (대표 기사가 될 수 있음)
+        """
+        self.index = index
+        self.today = date.today().toordinal()
+        self.lock = threading.Lock()
+        self.records = {url_fingerprint(record['url']): record for record in known_records if record.get('url')}
+        self.known = set(self.records)
+        # 이번 수집에서 중복 기사 링크가 추가된 오늘 저장된 대표 기사 {URL 지문: 기사}
+        self.linked = {}
+        
+        self.duplicates = 0
+        self.previous_day_matches = 0
+    
+    def check(self, news):
+        """
+        기사가 이미 본 기사의 유사 중복인지 확인하고 인덱스를 갱신합니다.
+        
+        Args:
+            news (dict): 뉴스 기사 (title, summary, url)
+            
+        Returns:
+            bool: 오늘 데이터에 대표 기사가 있는 중복이면 True (이 기사는 저장하거나 키워드를 다시 집계하지 않음)
+        """
+        url = news.get('url')
+        if not url:
+            return False
+        
+        key = url_fingerprint(url)
+        signature = self.index.signature(news.get('title', '') + " " + news.get('summary', ''))
+        # 같은 날짜의 묶음을 이전 날짜의 묶음보다 먼저 고름
+        match = self.index.find(signature, exclude=key, prefer_day=self.today)
+        
+        with self.lock:
+            if match is not None:
+                canonical, day, _ = match
+                record = self.records.get(canonical)
+                
+                if canonical != key and record is not None:
+                    # 오늘 데이터에 있는 대표 기사에 링크로 기록 (증분 수집에서 다시 본 링크는 추가하지 않음)
+                    links = record.setdefault('duplicates', [])
+                    if all(link['url'] != url for link in links):
+                        links.append({
+                            'url': url,
+                            'title': news.get('title', ''),
+                            'press': news.get('press', ''),
+                            'category': news.get('category', '')
+                        })
+                        if canonical in self.known:
+                            self.linked[canonical] = record
+                    self.index.add(key, signature, canonical, self.today)
+                    self.duplicates += 1
+                    return True
+                
+                if canonical != key and day < self.today:
+                    # 이전 날짜에 본 묶음: 오늘 집계에서 빠지지 않도록 이 기사를 오늘의 대표 기사로 남김
+                    self.previous_day_matches += 1
+            
+            # 오늘 저장된 대표 기사를 다시 가져왔으면 기존 링크를 이어받음 (같은 목록을 공유)
+            record = self.records.get(key)
+            if record is not None and record is not news and 'duplicates' in record:
+                news.setdefault('duplicates', record['duplicates'])
+            
+            # 새 묶음의 대표 기사 (오늘 데이터에 대표 기사가 없는 경우 포함)
+            self.records.setdefault(key, news)
+            self.index.add(key, signature, key, self.today)
+            return False
+    
+    def linked_records(self):
+        """
+        이번 수집에서 중복 기사 링크가 추가된 오늘 저장된 대표 기사를 반환합니다.
+        
+        증분 수집이 아니면 이 기사들이 이번 수집 결과에 없을 수 있으므로 저장할 때 함께 합칩니다.
+        
+        Returns:
+            list: 대표 기사 목록
+        """
+        with self.lock:
+            return list(self.linked.values())
+    
+    def stats(self):
+        """
+        중복 제거 통계를 반환합니다.
+        
+        Returns:
+            dict: 오늘 데이터 안에서 제외한 중복 수, 이전 날짜 기사와 비슷하지만 오늘 집계에 남긴 기사 수
+        """
+        return {'duplicates': self.duplicates, 'previous_day_matches': self.previous_day_matches}
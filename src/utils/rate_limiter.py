@@ -0,0 +1,120 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """토큰 버킷 방식의 요청 속도 제한기 클래스"""
+    
+    def __init__(self, rate, capacity=1):
+        """
+        TokenBucket 초기화
+        
+        Args:
+            rate (float): 초당 충전되는 토큰 수 (초당 허용 요청 수)
+            capacity (int): 버킷 최대 용량 (순간적으로 허용되는 연속 요청 수)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        
+        self.rate = float(rate)
+        self.capacity = max(1, int(capacity))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self, now):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+    
+    def acquire(self):
+        """
+        토큰 하나를 획득할 때까지 대기합니다.
+        
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait_time = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷을 관리하는 요청 속도 제한기 클래스"""
+    
+    # 호스트별 기본 요청 제한 (초당 요청 수, 버스트 크기)
+    DEFAULT_LIMITS = {
+        'news.naver.com': (2.0, 2),
+        'news.daum.net': (2.0, 2),
+        'search.naver.com': (1.0, 1),
+        'search.daum.net': (1.0, 1)
+    }
+    
+    def __init__(self, limits=None, default_rate=1.0, default_capacity=1):
+        """
+        HostRateLimiter 초기화
+        
+        Args:
+            limits (dict): 호스트별 제한 {호스트: (초당 요청 수, 버스트 크기)} (기본값: DEFAULT_LIMITS)
+            default_rate (float): 설정되지 않은 호스트의 초당 요청 수
+            default_capacity (int): 설정되지 않은 호스트의 버스트 크기
+        """
+        self.limits = dict(self.DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        
+        self.default_rate = default_rate
+        self.default_capacity = default_capacity
+        self.buckets = {}
+        
+        # 오프라인 재생 등 실제 요청을 보내지 않을 때는 제한을 끌 수 있음
+        self.enabled = True
+        self.lock = threading.Lock()
+    
+    def set_limit(self, host, rate, capacity=1):
+        """
+        특정 호스트의 요청 제한을 변경합니다.
+        
+        Args:
+            host (str): 호스트 이름
+            rate (float): 초당 요청 수
+            capacity (int): 버스트 크기
+        """
+        with self.lock:
+            self.limits[host] = (rate, capacity)
+            self.buckets.pop(host, None)
+    
+    def _get_bucket(self, host):
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                rate, capacity = self.limits.get(host, (self.default_rate, self.default_capacity))
+                bucket = TokenBucket(rate, capacity)
+                self.buckets[host] = bucket
+            return bucket
+    
+    def acquire(self, url):
+        """
+        URL의 호스트에 요청을 보낼 수 있을 때까지 대기합니다.
+        
+        Args:
+            url (str): 요청할 URL
+            
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        if not self.enabled:
+            return 0.0
+        
+        host = urlparse(url).hostname or ''
+        return self._get_bucket(host).acquire()
@@ -0,0 +1,137 @@
+import hashlib
+import os
+import struct
+import threading
+from array import array
+from datetime import date
+from pathlib import Path
+
+
+def url_fingerprint(url):
+    """
+    URL의 64비트 지문을 계산합니다.
+    
+    Args:
+        url (str): URL
+        
+    Returns:
+        int: 64비트 정수 지문
+    """
+    digest = hashlib.blake2b(url.strip().encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class SeenUrlIndex:
+    """
+    이미 수집한 기사/블로그 URL을 기록하는 영속 인덱스 클래스
+    
+    URL 대신 64비트 지문과 마지막으로 본 날짜(서수)만 저장하므로 항목당 12바이트를 사용합니다.
+    보존 기간이 지난 항목은 저장 시 제거됩니다.
+    """
+    
+    MAGIC = b'SEEN1'
+    
+    def __init__(self, path, retention_days=7):
+        """
+        SeenUrlIndex 초기화
+        
+        Args:
+            path (str): 인덱스 파일 경로
+            retention_days (int): 항목을 유지할 기간 (일)
+        """
+        self.path = Path(path)
+        self.retention_days = retention_days
+        self.lock = threading.Lock()
+        self.entries = {}
+        self._load()
+    
+    def _load(self):
+        if not self.path.exists():
+            return
+        
+        try:
+            with open(self.path, 'rb') as f:
+                if f.read(len(self.MAGIC)) != self.MAGIC:
+                    print(f"URL 인덱스 형식이 올바르지 않아 새로 시작합니다: {self.path}")
+                    return
+                count = struct.unpack('<Q', f.read(8))[0]
+                hashes = array('Q')
+                days = array('I')
+                hashes.fromfile(f, count)
+                days.fromfile(f, count)
+        except (OSError, EOFError, struct.error) as e:
+            print(f"URL 인덱스 로드 중 오류 발생: {e}")
+            return
+        
+        self.entries = dict(zip(hashes, days))
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __contains__(self, url):
+        return self.contains(url)
+    
+    def contains(self, url):
+        """
+        URL이 인덱스에 있는지 확인합니다.
+        
+        Args:
+            url (str): 확인할 URL
+            
+        Returns:
+            bool: 이미 수집한 URL인지 여부
+        """
+        return url_fingerprint(url) in self.entries
+    
+    def add(self, url):
+        """
+        URL을 인덱스에 추가합니다.
+        
+        Args:
+            url (str): 추가할 URL
+            
+        Returns:
+            bool: 새로 추가되었는지 여부
+        """
+        fingerprint = url_fingerprint(url)
+        today = date.today().toordinal()
+        with self.lock:
+            is_new = fingerprint not in self.entries
+            self.entries[fingerprint] = today
+        return is_new
+    
+    def add_all(self, items, key='url'):
+        """
+        항목 목록의 URL을 모두 인덱스에 추가합니다.
+        
+        Args:
+            items (list): 기사 또는 블로그 사전 목록
+            key (str): URL이 저장된 필드 이름
+            
+        Returns:
+            int: 새로 추가된 URL 수
+        """
+        added = 0
+        for item in items:
+            url = item.get(key)
+            if url and self.add(url):
+                added += 1
+        return added
+    
+    def save(self):
+        """보존 기간이 지난 항목을 제거하고 인덱스를 파일에 원자적으로 저장합니다."""
+        cutoff = date.today().toordinal() - self.retention_days
+        
+        with self.lock:
+            self.entries = {fingerprint: day for fingerprint, day in self.entries.items() if day >= cutoff}
+            hashes = array('Q', self.entries.keys())
+            days = array('I', self.entries.values())
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack('<Q', len(hashes)))
+            hashes.tofile(f)
+            days.tofile(f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,185 @@
+from collections import Counter
+
+
+class SpaceSaving:
+    """
+    상위 키워드 빈도를 제한된 크기로 요약하는 병합 가능한 Space-Saving 스케치 클래스
+    
+    최대 capacity개의 키워드만 (추정 빈도, 최대 과대 추정치)로 유지합니다.
+    추정 빈도는 실제 빈도보다 작지 않고, 추정 빈도에서 과대 추정치를 뺀 값은 실제 빈도보다 크지 않습니다.
+    스케치에 없는 키워드의 실제 빈도는 floor 이하이므로, 소스/카테고리/날짜별 스케치를
+    기사를 다시 읽지 않고 합쳐도 상위 키워드의 오차 범위가 유지됩니다.
+    """
+    
+    def __init__(self, capacity=200):
+        """
+        스케치 초기화
+        
+        Args:
+            capacity (int): 유지할 최대 키워드 수
+        """
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        # 스케치에 없는 키워드가 가질 수 있는 최대 빈도
+        self.floor = 0
+    
+    def __len__(self):
+        return len(self.counts)
+    
+    def __contains__(self, item):
+        return item in self.counts
+    
+    @classmethod
+    def from_counts(cls, counts, capacity=200):
+        """
+        정확한 빈도에서 스케치를 만듭니다.
+        
+        Args:
+            counts (dict): {키워드: 빈도}
+            capacity (int): 유지할 최대 키워드 수
+            
+        Returns:
+            SpaceSaving: 빈도 상위 capacity개를 담은 스케치 (과대 추정치는 0)
+        """
+        sketch = cls(capacity)
+        ranked = Counter(counts).most_common()
+        
+        for item, count in ranked[:capacity]:
+            sketch.counts[item] = count
+            sketch.errors[item] = 0
+        if len(ranked) > capacity:
+            sketch.floor = ranked[capacity][1]
+        
+        return sketch
+    
+    def add(self, item, count=1):
+        """
+        키워드 빈도를 하나씩 반영합니다. (스케치가 가득 차면 가장 작은 항목을 교체)
+        
+        Args:
+            item (str): 키워드
+            count (int): 더할 빈도
+        """
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count + self.floor
+            self.errors[item] = self.floor
+            return
+        
+        # 가장 작은 항목을 내보내고 그 빈도를 새 키워드의 과대 추정치로 물려받음
+        victim = min(self.counts, key=self.counts.get)
+        minimum = self.counts.pop(victim)
+        del self.errors[victim]
+        self.counts[item] = minimum + count
+        self.errors[item] = minimum
+        self.floor = max(self.floor, minimum)
+    
+    def merge(self, other):
+        """
+        다른 스케치와 합친 새 스케치를 반환합니다.
+        
+        한쪽에만 있는 키워드는 다른 쪽의 floor를 빈도와 과대 추정치에 더해 상한을 유지합니다.
+        
+        Args:
+            other (SpaceSaving): 합칠 스케치
+            
+        Returns:
+            SpaceSaving: 두 스케치 중 큰 capacity를 가진 합쳐진 스케치
+        """
+        merged = SpaceSaving(max(self.capacity, other.capacity))
+        
+        combined = []
+        for item in list(self.counts) + [item for item in other.counts if item not in self.counts]:
+            count = self.counts.get(item, self.floor) + other.counts.get(item, other.floor)
+            error = self.errors.get(item, self.floor) + other.errors.get(item, other.floor)
+            combined.append((item, count, error))
+        
+        # 빈도 내림차순 (같은 빈도는 먼저 등장한 순서 유지)
+        combined.sort(key=lambda entry: -entry[1])
+        
+        for item, count, error in combined[:merged.capacity]:
+            merged.counts[item] = count
+            merged.errors[item] = error
+        
+        merged.floor = self.floor + other.floor
+        if len(combined) > merged.capacity:
+            merged.floor = max(merged.floor, combined[merged.capacity][1])
+        
+        return merged
+    
+    @classmethod
+    def merge_all(cls, sketches, capacity=200):
+        """
+        여러 스케치를 차례로 합칩니다.
+        
+        Args:
+            sketches (iterable): SpaceSaving 목록
+            capacity (int): 합칠 스케치가 없을 때 만들 빈 스케치의 크기
+            
+        Returns:
+            SpaceSaving: 합쳐진 스케치
+        """
+        merged = None
+        for sketch in sketches:
+            merged = sketch if merged is None else merged.merge(sketch)
+        return merged if merged is not None else cls(capacity)
+    
+    def top(self, top_n):
+        """
+        추정 빈도 상위 키워드를 반환합니다.
+        
+        Args:
+            top_n (int): 반환할 키워드 수
+            
+        Returns:
+            list: 키워드 목록
+        """
+        return [item for item, _, _ in self.top_items(top_n)]
+    
+    def top_items(self, top_n):
+        """
+        추정 빈도 상위 키워드와 오차 범위를 반환합니다.
+        
+        Args:
+            top_n (int): 반환할 키워드 수
+            
+        Returns:
+            list: [(키워드, 추정 빈도, 최대 과대 추정치)]
+        """
+        ranked = sorted(self.counts.items(), key=lambda item: -item[1])
+        return [(item, count, self.errors[item]) for item, count in ranked[:top_n]]
+    
+    def to_dict(self):
+        """
+        JSON으로 저장할 수 있는 사전으로 변환합니다.
+        
+        Returns:
+            dict: capacity, floor, 빈도 내림차순의 [키워드, 추정 빈도, 과대 추정치] 목록
+        """
+        return {
+            'capacity': self.capacity,
+            'floor': self.floor,
+            'items': [list(entry) for entry in self.top_items(len(self.counts))]
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        to_dict로 저장한 사전에서 스케치를 복원합니다.
+        
+        Args:
+            data (dict): 저장된 스케치
+            
+        Returns:
+            SpaceSaving: 복원된 스케치
+        """
+        sketch = cls(data.get('capacity', 200))
+        sketch.floor = data.get('floor', 0)
+        for item, count, error in data.get('items', []):
+            sketch.counts[item] = count
+            sketch.errors[item] = error
+        return sketch
@@ -0,0 +1,201 @@
+from array import array
+from collections import Counter
+
+# numpy/scipy는 선택 의존성 (없으면 TrendService가 사전 기반 집계를 사용)
+try:
+    import numpy as np
+    from scipy import sparse
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+class TermMatrix:
+    """
+    문서 x 단어 빈도를 CSR 희소 행렬로 저장하여 그룹별 키워드 집계를 행렬 연산으로 수행하는 클래스
+    
+    행은 문서, 열은 어휘 사전의 단어이며 같은 어휘 사전을 여러 행렬이 공유할 수 있습니다.
+    카테고리/소스/날짜 같은 문서 레이블로 묶은 빈도는 지시 행렬과의 곱 한 번으로 계산합니다.
+    빈도가 같은 단어는 선택한 문서에서 먼저 등장한 순서를 유지하므로 Counter.most_common과 결과가 같습니다.
+    """
+    
+    def __init__(self, matrix, indptr, indices, terms, labels=None):
+        """
+        TermMatrix 초기화 (보통은 build()로 생성)
+        
+        Args:
+            matrix (scipy.sparse.csr_matrix): 문서 x 단어 빈도 행렬
+            indptr (numpy.ndarray): 행별 항목 시작 위치 (행렬과 같은 값, 등장 순서 계산용)
+            indices (numpy.ndarray): 항목별 열 번호 (문서 안에서 처음 등장한 순서)
+            terms (list): 열 번호 순서의 단어 목록 (공유 어휘 사전)
+            labels (dict): {레이블 이름: 문서별 레이블 값 목록}
+        """
+        self.matrix = matrix
+        self.indptr = indptr
+        self.indices = indices
+        self.terms = terms
+        self.labels = labels or {}
+        
+        # 항목별 행 번호 (레이블별로 항목을 모으는 데 사용)
+        self.entry_rows = np.repeat(np.arange(matrix.shape[0]), np.diff(indptr))
+    
+    def __len__(self):
+        return self.matrix.shape[0]
+    
+    @classmethod
+    def build(cls, engine, texts, labels=None, vocabulary=None):
+        """
+        문서 목록에서 단어 빈도 행렬을 만듭니다.
+        
+        Args:
+            engine (KeywordEngine): 단어 분리에 사용할 키워드 엔진 (토큰 캐시 재사용)
+            texts (list): 문서 텍스트 목록
+            labels (dict): {레이블 이름: 문서별 레이블 값 목록}
+            vocabulary (dict): 공유 어휘 사전 {단어: 열 번호} (새 단어는 뒤에 추가)
+            
+        Returns:
+            TermMatrix: 단어 빈도 행렬
+        """
+        if not HAS_SCIPY:
+            raise ImportError("단어 빈도 행렬에는 numpy와 scipy가 필요합니다.")
+        
+        if vocabulary is None:
+            vocabulary = {}
+        
+        indptr = array('q', [0])
+        indices = array('q')
+        data = array('q')
+        
+        for words in engine.document_tokens_many(list(texts)):
+            counts = words if isinstance(words, dict) else Counter(words)
+            for word, count in counts.items():
+                column = vocabulary.get(word)
+                if column is None:
+                    column = vocabulary[word] = len(vocabulary)
+                indices.append(column)
+                data.append(count)
+            indptr.append(len(indices))
+        
+        # 사전의 삽입 순서가 열 번호 순서
+        terms = list(vocabulary)
+        indptr = np.frombuffer(indptr, dtype=np.int64)
+        indices = np.frombuffer(indices, dtype=np.int64)
+        data = np.frombuffer(data, dtype=np.int64)
+        
+        matrix = sparse.csr_matrix((data, indices.copy(), indptr.copy()), shape=(len(indptr) - 1, len(terms)))
+        return cls(matrix, indptr, indices, terms, labels)
+    
+    def _select(self, rows):
+        # 선택한 문서의 열별 빈도와, 주어진 문서 순서로 이어 붙인 항목별 열 번호
+        if rows is None:
+            return np.asarray(self.matrix.sum(axis=0)).ravel(), self.indices
+        
+        rows = np.asarray(rows, dtype=np.int64)
+        mask = np.zeros(self.matrix.shape[0], dtype=np.int64)
+        mask[rows] = 1
+        counts = np.asarray(mask @ self.matrix).ravel()
+        
+        lengths = self.indptr[rows + 1] - self.indptr[rows]
+        offsets = np.repeat(self.indptr[rows] - (np.cumsum(lengths) - lengths), lengths)
+        positions = offsets + np.arange(int(lengths.sum()), dtype=np.int64)
+        return counts, self.indices[positions]
+    
+    def _first_positions(self, columns, candidates):
+        # 후보 열이 항목 순서에서 처음 등장한 위치 (후보만 찾으므로 전체 항목을 정렬하지 않음)
+        is_candidate = np.zeros(self.matrix.shape[1], dtype=bool)
+        is_candidate[candidates] = True
+        positions = np.flatnonzero(is_candidate[columns])
+        
+        first = np.empty(self.matrix.shape[1], dtype=np.int64)
+        unique_columns, index = np.unique(columns[positions], return_index=True)
+        first[unique_columns] = positions[index]
+        return first[candidates]
+    
+    def _top(self, counts, columns, top_n):
+        candidates = np.flatnonzero(counts)
+        if len(candidates) > top_n:
+            # 상위 top_n번째 빈도 이상인 단어만 남긴 뒤 정렬 (같은 빈도의 단어는 모두 후보에 포함)
+            kth = len(candidates) - top_n
+            threshold = np.partition(counts[candidates], kth)[kth]
+            candidates = candidates[counts[candidates] >= threshold]
+        
+        order = np.lexsort((self._first_positions(columns, candidates), -counts[candidates]))[:top_n]
+        return [self.terms[column] for column in candidates[order]]
+    
+    def _ordered_counts(self, counts, columns):
+        candidates = np.flatnonzero(counts)
+        candidates = candidates[np.argsort(self._first_positions(columns, candidates), kind='stable')]
+        return {self.terms[column]: int(counts[column]) for column in candidates}
+    
+    def top(self, top_n, rows=None):
+        """
+        선택한 문서의 상위 키워드를 반환합니다.
+        
+        Args:
+            top_n (int): 반환할 키워드 수
+            rows (iterable): 문서 행 번호 목록 (기본값: 모든 문서, 같은 빈도는 이 순서로 먼저 등장한 단어가 앞)
+            
+        Returns:
+            list: 키워드 목록
+        """
+        counts, columns = self._select(rows)
+        return self._top(counts, columns, top_n)
+    
+    def counts(self, rows=None):
+        """
+        선택한 문서의 단어 빈도를 반환합니다.
+        
+        Args:
+            rows (iterable): 문서 행 번호 목록 (기본값: 모든 문서)
+            
+        Returns:
+            dict: {단어: 빈도} (처음 등장한 순서)
+        """
+        counts, columns = self._select(rows)
+        return self._ordered_counts(counts, columns)
+    
+    def _grouped(self, label):
+        # 레이블 값을 처음 등장한 순서로 번호를 매기고 (그룹 x 문서) 지시 행렬과 곱함
+        values = self.labels[label]
+        groups = {}
+        codes = np.fromiter((groups.setdefault(value, len(groups)) for value in values), dtype=np.int64, count=len(values))
+        
+        indicator = sparse.csr_matrix(
+            (np.ones(len(codes), dtype=np.int64), (codes, np.arange(len(codes)))),
+            shape=(len(groups), len(codes))
+        )
+        group_counts = (indicator @ self.matrix).tocsr()
+        
+        # 그룹별 항목을 등장 순서를 유지한 채 모아 둠
+        entry_groups = codes[self.entry_rows]
+        order = np.argsort(entry_groups, kind='stable')
+        bounds = np.searchsorted(entry_groups[order], np.arange(len(groups) + 1))
+        
+        for code, group in enumerate(groups):
+            counts = group_counts.getrow(code).toarray().ravel()
+            yield group, counts, self.indices[order[bounds[code]:bounds[code + 1]]]
+    
+    def top_by(self, label, top_n):
+        """
+        레이블 값별 상위 키워드를 반환합니다. (예: 카테고리 x 키워드, 소스 x 키워드, 날짜 x 키워드)
+        
+        Args:
+            label (str): 레이블 이름
+            top_n (int): 그룹별로 반환할 키워드 수
+            
+        Returns:
+            dict: {레이블 값: 키워드 목록} (레이블 값이 처음 등장한 순서)
+        """
+        return {group: self._top(counts, columns, top_n) for group, counts, columns in self._grouped(label)}
+    
+    def counts_by(self, label):
+        """
+        레이블 값별 단어 빈도를 반환합니다.
+        
+        Args:
+            label (str): 레이블 이름
+            
+        Returns:
+            dict: {레이블 값: {단어: 빈도}}
+        """
+        return {group: self._ordered_counts(counts, columns) for group, counts, columns in self._grouped(label)}
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+def document_key(text, tokenizer_name='whitespace'):
+    """
+    문서 텍스트의 토큰 캐시 키를 계산합니다.
+    
+    Args:
+        text (str): 문서 텍스트 (제목 + 요약)
+        tokenizer_name (str): 토크나이저 이름 (토크나이저가 다르면 다른 키)
+        
+    Returns:
+        str: 128비트 해시의 16진수 문자열
+    """
+    data = f"{tokenizer_name}\x00{text}".encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class TokenCache:
+    """
+    문서별 단어 빈도를 내용 해시로 저장하는 크기 제한 LRU 캐시 클래스
+    
+    같은 기사를 다시 집계할 때 정규식 정리와 단어 분리를 건너뛰고 저장된 빈도를 재사용합니다.
+    파일에는 마지막 저장 이후 조회하거나 추가한 항목만 그날의 파일에 합쳐 기록합니다.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, max_entries=20000):
+        """
+        TokenCache 초기화
+        
+        Args:
+            max_entries (int): 유지할 최대 문서 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        # 마지막 저장 이후 조회하거나 추가한 항목 {키: 빈도} (LRU에서 밀려나도 저장할 때까지 유지)
+        self.touched = {}
+        self.lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get(self, key):
+        """
+        문서의 단어 빈도를 조회합니다.
+        
+        Args:
+            key (str): 문서 키 (document_key)
+            
+        Returns:
+            dict: {단어: 빈도} (처음 등장한 순서), 없으면 None
+        """
+        with self.lock:
+            counts = self.entries.get(key)
+            if counts is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.touched[key] = counts
+            self.hits += 1
+            return counts
+    
+    def put(self, key, words):
+        """
+        문서의 단어 목록을 빈도로 바꾸어 저장합니다.
+        
+        Args:
+            key (str): 문서 키 (document_key)
+            words (list): 문서의 단어 목록
+            
+        Returns:
+            dict: 저장된 {단어: 빈도}
+        """
+        counts = {}
+        for word in words:
+            counts[word] = counts.get(word, 0) + 1
+        
+        with self.lock:
+            self.entries[key] = counts
+            self.entries.move_to_end(key)
+            self.touched[key] = counts
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        
+        return counts
+    
+    def load(self, path):
+        """
+        저장된 캐시 파일을 읽어 현재 캐시에 합칩니다.
+        
+        Args:
+            path (str): 캐시 파일 경로
+            
+        Returns:
+            int: 읽어 온 항목 수
+        """
+        entries = self._read(path)
+        if not entries:
+            return 0
+        
+        with self.lock:
+            # 파일에 저장된 순서가 오래된 것부터이므로 현재 항목보다 앞에 둠
+            merged = OrderedDict(entries)
+            merged.update(self.entries)
+            self.entries = merged
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        
+        return len(entries)
+    
+    def _read(self, path):
+        """
+        캐시 파일의 항목을 읽습니다.
+        
+        Args:
+            path (str): 캐시 파일 경로
+            
+        Returns:
+            dict: {키: 빈도} (파일이 없거나 형식이 다르면 빈 사전)
+        """
+        path = Path(path)
+        if not path.exists():
+            return {}
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"토큰 캐시 로드 중 오류 발생: {e}")
+            return {}
+        
+        if data.get('version') != self.FORMAT_VERSION:
+            return {}
+        
+        return data.get('entries', {})
+    
+    def save(self, path):
+        """
+        마지막 저장 이후 조회하거나 추가한 항목을 파일에 합쳐 저장합니다.
+        
+        LRU 전체를 쓰지 않으므로 날짜별 파일에는 그날 사용한 문서만 남습니다.
+        
+        Args:
+            path (str): 캐시 파일 경로 (보통 오늘 날짜의 파일)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with self.lock:
+            touched = dict(self.touched)
+        if not touched:
+            return
+        
+        # 기존 항목 뒤에 이번에 사용한 항목을 두어 읽을 때 최근 항목이 LRU의 뒤쪽에 오도록 함
+        entries = self._read(path)
+        for key in touched:
+            entries.pop(key, None)
+        entries.update(touched)
+        data = {'version': self.FORMAT_VERSION, 'entries': entries}
+        
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        
+        # 저장하는 동안 다시 사용된 항목은 다음 저장 때 기록
+        with self.lock:
+            for key, counts in touched.items():
+                if self.touched.get(key) is counts:
+                    del self.touched[key]
+    
+    def stats(self):
+        """
+        캐시 통계를 반환합니다.
+        
+        Returns:
+            dict: 항목 수, 적중/미스 횟수
+        """
+        return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 저장소 루트에서 src/benchmarks 패키지를 가져올 수 있도록 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,76 @@
+import contextlib
+import sys
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from benchmarks.synthetic import VOCABULARY, build_archive
+from src.services.storage import STORAGE_BACKENDS
+from src.services.trend_service import TrendService
+
+PAGES = 2
+KEYWORDS = VOCABULARY[:3]
+
+
+@pytest.fixture(scope='module')
+def fixture_path(tmp_path_factory):
+    work_dir = tmp_path_factory.mktemp('fixtures')
+    # 카테고리 목록을 얻기 위한 임시 서비스
+    probe = TrendService(data_dir=str(work_dir / 'probe'), use_http_cache=False)
+    path = work_dir / 'fixtures.jsonl.gz'
+    build_archive(
+        str(path),
+        probe.naver_news_crawler.categories,
+        probe.daum_news_crawler.categories,
+        PAGES,
+        KEYWORDS,
+        news_items=10
+    )
+    return str(path)
+
+
+def _collect(service, **kwargs):
+    # 수집 진행 메시지는 표준 오류로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        return service.collect_trends(keywords=KEYWORDS, **kwargs)
+
+
+@pytest.mark.parametrize('backend', STORAGE_BACKENDS)
+@pytest.mark.parametrize('incremental', [False, True])
+def test_collect_twice(tmp_path, fixture_path, backend, incremental):
+    service = TrendService(
+        data_dir=str(tmp_path / 'data'),
+        use_http_cache=False,
+        pages_per_category=PAGES,
+        fixture_path=fixture_path,
+        fixture_mode='replay',
+        storage_backend=backend
+    )
+    
+    first = _collect(service)
+    first_news = first['news_trends']['news_data']
+    first_blogs = first['blog_trends']['all_blogs']
+    assert service.replay_adapter.misses == 0
+    assert first_news and first_blogs
+    assert set(Counter(news['source'] for news in first_news)) == {'naver', 'daum'}
+    assert set(Counter(blog['source'] for blog in first_blogs)) == {'naver', 'daum'}
+    assert first['top_keywords']
+    
+    _collect(service, incremental=incremental)
+    assert service.replay_adapter.misses == 0
+    
+    # 같은 기사를 다시 수집해도 오늘 저장된 기사/블로그는 URL당 하나
+    today = datetime.now().strftime('%Y-%m-%d')
+    stored = service.storage.load(today)
+    stored_news = stored['news_trends']['news_data']
+    stored_blogs = stored['blog_trends']['all_blogs']
+    assert sorted(news['url'] for news in stored_news) == sorted(news['url'] for news in first_news)
+    assert sorted(blog['url'] for blog in stored_blogs) == sorted(blog['url'] for blog in first_blogs)
+    
+    # 저장된 상위 키워드는 첫 수집과 같은 기사에서 집계됨
+    assert stored['top_keywords'] == first['top_keywords']
+    
+    # 새 서비스로 다시 열어도 같은 데이터를 읽음
+    reopened = TrendService(data_dir=str(tmp_path / 'data'), use_http_cache=False, storage_backend=backend)
+    assert len(reopened.get_trends(today)['news_trends']['news_data']) == len(stored_news)
@@ -0,0 +1,58 @@
+from datetime import date
+
+from src.utils import NearDuplicateIndex
+from src.utils.seen_index import url_fingerprint
+
+TEXTS = [
+    '정부 기준금리 동결 결정 물가 상승 우려 속 시장 전망 엇갈려',
+    '반도체 수출 회복세 삼성전자 실적 개선 기대감 확대',
+    '서울 아파트 가격 하락 전환 부동산 시장 위축 지속',
+]
+
+
+def _build(path):
+    index = NearDuplicateIndex(path)
+    today = date.today().toordinal()
+    for number, text in enumerate(TEXTS):
+        key = url_fingerprint(f"https://news.example.com/{number}")
+        index.add(key, index.signature(text), day=today)
+    # 첫 기사와 거의 같은 기사를 첫 기사 묶음으로 추가
+    index.add(url_fingerprint("https://news.example.com/copy"), index.signature(TEXTS[0] + ' 종합'),
+              canonical=url_fingerprint("https://news.example.com/0"), day=today)
+    return index
+
+
+def test_save_load_round_trip(tmp_path):
+    path = tmp_path / 'near_duplicates.bin'
+    index = _build(path)
+    index.save()
+    
+    loaded = NearDuplicateIndex(path)
+    assert loaded.entries == index.entries
+    assert loaded.buckets.keys() == index.buckets.keys()
+    
+    signature = loaded.signature(TEXTS[0] + ' 속보')
+    found = loaded.find(signature)
+    assert found is not None
+    assert found[0] == url_fingerprint("https://news.example.com/0")
+    assert found == index.find(signature)
+
+
+def test_save_drops_expired_entries(tmp_path):
+    path = tmp_path / 'near_duplicates.bin'
+    index = _build(path)
+    old_key = url_fingerprint("https://news.example.com/old")
+    index.add(old_key, index.signature('오래된 기사 제목 환율 급등 외환 시장 불안'),
+              day=date.today().toordinal() - index.retention_days - 1)
+    index.save()
+    
+    loaded = NearDuplicateIndex(path)
+    assert old_key not in loaded.entries
+    assert len(loaded) == len(TEXTS) + 1
+
+
+def test_load_with_different_signature_length_starts_empty(tmp_path):
+    path = tmp_path / 'near_duplicates.bin'
+    _build(path).save()
+    
+    assert len(NearDuplicateIndex(path, num_bins=64)) == 0
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from src.services.pagination import PageDepthPlanner
+
+TARGETS = [('naver', category) for category in ('정치', '경제', '사회', '세계')] + \
+          [('daum', category) for category in ('society', 'economic', 'digital')]
+
+
+def _planner(tmp_path, **kwargs):
+    planner = PageDepthPlanner(tmp_path / 'page_yields.json', **kwargs)
+    rng = random.Random(7)
+    for source in ('naver', 'daum'):
+        for _ in range(3):
+            planner.record(source, {
+                category: [rng.randint(0, 20) for _ in range(rng.randint(1, 5))]
+                for s, category in TARGETS if s == source
+            })
+    return planner
+
+
+@pytest.mark.parametrize('budget', [0, 1, 3, 7, 10, 20, 35, 100])
+def test_plan_stays_within_budget(tmp_path, budget):
+    planner = _planner(tmp_path)
+    plan = planner.plan(TARGETS, budget)
+    
+    depths = [plan[source][category] for source, category in TARGETS]
+    assert sum(depths) <= budget
+    assert all(0 <= depth <= planner.max_pages for depth in depths)
+    
+    # 예산이 충분하면 모든 카테고리가 최소 페이지를 받음
+    if budget >= planner.min_pages * len(TARGETS):
+        assert all(depth >= planner.min_pages for depth in depths)
+
+
+def test_plan_without_history_uses_prior(tmp_path):
+    planner = PageDepthPlanner(tmp_path / 'page_yields.json', min_pages=1, max_pages=3)
+    plan = planner.plan(TARGETS, 100)
+    
+    assert all(plan[source][category] == 3 for source, category in TARGETS)
+
+
+def test_plan_prefers_higher_yield(tmp_path):
+    planner = PageDepthPlanner(tmp_path / 'page_yields.json', min_pages=1, max_pages=5)
+    planner.record('naver', {'경제': [20, 18, 15], '정치': [20, 0, 0]})
+    plan = planner.plan([('naver', '경제'), ('naver', '정치')], 4)
+    
+    assert plan['naver'] == {'경제': 3, '정치': 1}
+
+
+def test_record_save_round_trip(tmp_path):
+    planner = _planner(tmp_path, history_size=2)
+    planner.save()
+    
+    loaded = PageDepthPlanner(tmp_path / 'page_yields.json', history_size=2)
+    assert loaded.history == planner.history
+    assert all(len(runs) <= 2 for categories in loaded.history.values() for runs in categories.values())
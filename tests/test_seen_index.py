@@ -0,0 +1,51 @@
+from datetime import date
+
+from src.utils import SeenUrlIndex
+from src.utils.seen_index import url_fingerprint
+
+
+def test_save_load_round_trip(tmp_path):
+    path = tmp_path / 'seen_urls.bin'
+    index = SeenUrlIndex(path)
+    assert index.add_all([{'url': 'https://a.example.com/1'}, {'url': 'https://a.example.com/2'}, {'title': 'URL 없음'}]) == 2
+    assert not index.add('https://a.example.com/1')
+    index.save()
+    
+    loaded = SeenUrlIndex(path)
+    assert len(loaded) == 2
+    assert 'https://a.example.com/1' in loaded
+    assert 'https://a.example.com/3' not in loaded
+
+
+def test_retention(tmp_path):
+    path = tmp_path / 'seen_urls.bin'
+    index = SeenUrlIndex(path, retention_days=7)
+    today = date.today().toordinal()
+    index.add('https://a.example.com/today')
+    index.entries[url_fingerprint('https://a.example.com/edge')] = today - 7
+    index.entries[url_fingerprint('https://a.example.com/expired')] = today - 8
+    index.save()
+    
+    # 보존 기간 경계의 항목은 남고 지난 항목은 저장 시 제거됨
+    assert 'https://a.example.com/expired' not in index
+    loaded = SeenUrlIndex(path, retention_days=7)
+    assert 'https://a.example.com/today' in loaded
+    assert 'https://a.example.com/edge' in loaded
+    assert 'https://a.example.com/expired' not in loaded
+
+
+def test_add_refreshes_day(tmp_path):
+    index = SeenUrlIndex(tmp_path / 'seen_urls.bin', retention_days=7)
+    index.entries[url_fingerprint('https://a.example.com/1')] = date.today().toordinal() - 30
+    
+    # 다시 본 URL은 오늘 날짜로 갱신되어 보존 기간이 연장됨
+    assert not index.add('https://a.example.com/1')
+    index.save()
+    assert 'https://a.example.com/1' in SeenUrlIndex(tmp_path / 'seen_urls.bin')
+
+
+def test_invalid_file_starts_empty(tmp_path):
+    path = tmp_path / 'seen_urls.bin'
+    path.write_bytes(b'not an index')
+    
+    assert len(SeenUrlIndex(path)) == 0
@@ -0,0 +1,73 @@
+import random
+from collections import Counter
+
+from src.utils import SpaceSaving
+
+
+def _stream(seed, size, vocabulary=300):
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(vocabulary)]
+    return rng.choices([f"w{rank}" for rank in range(vocabulary)], weights=weights, k=size)
+
+
+def _sketch(items, capacity):
+    sketch = SpaceSaving(capacity)
+    for item in items:
+        sketch.add(item)
+    return sketch
+
+
+def _assert_bounds(sketch, counts):
+    # 추정 빈도는 실제 빈도 이상, 추정 빈도 - 과대 추정치는 실제 빈도 이하
+    for item, count in sketch.counts.items():
+        assert count >= counts[item]
+        assert count - sketch.errors[item] <= counts[item]
+    # 스케치에 없는 키워드의 실제 빈도는 floor 이하
+    for item, count in counts.items():
+        if item not in sketch:
+            assert count <= sketch.floor
+
+
+def test_add_keeps_bounds():
+    items = _stream(1, 5000)
+    sketch = _sketch(items, 50)
+    assert len(sketch) == 50
+    _assert_bounds(sketch, Counter(items))
+
+
+def test_merge_keeps_bounds():
+    first = _stream(1, 5000)
+    second = _stream(2, 3000)
+    merged = _sketch(first, 50).merge(_sketch(second, 30))
+    
+    assert merged.capacity == 50
+    assert len(merged) <= merged.capacity
+    _assert_bounds(merged, Counter(first) + Counter(second))
+
+
+def test_merge_all_keeps_bounds():
+    streams = [_stream(seed, 2000) for seed in range(5)]
+    merged = SpaceSaving.merge_all(_sketch(items, 40) for items in streams)
+    
+    total = Counter()
+    for items in streams:
+        total.update(items)
+    _assert_bounds(merged, total)
+
+
+def test_merge_exact_counts():
+    first = Counter({'정부': 5, '경제': 3})
+    second = Counter({'정부': 2, '금리': 4})
+    merged = SpaceSaving.from_counts(first).merge(SpaceSaving.from_counts(second))
+    
+    assert merged.top_items(3) == [('정부', 7, 0), ('금리', 4, 0), ('경제', 3, 0)]
+    assert merged.floor == 0
+
+
+def test_to_dict_round_trip():
+    sketch = _sketch(_stream(3, 1000), 20)
+    restored = SpaceSaving.from_dict(sketch.to_dict())
+    
+    assert restored.counts == sketch.counts
+    assert restored.errors == sketch.errors
+    assert restored.floor == sketch.floor
@@ -0,0 +1,39 @@
+from src.services.storage import merge_items, merge_trend_data
+
+
+def _trend_data(news, blogs, top_keywords):
+    return {
+        'date': '2024-01-05',
+        'top_keywords': top_keywords,
+        'news_trends': {'overall': top_keywords, 'news_data': news},
+        'blog_trends': {'all_blogs': blogs}
+    }
+
+
+def test_merge_items_keeps_order_and_replaces_by_url():
+    saved = [{'url': 'a', 'title': '1'}, {'url': 'b', 'title': '2'}]
+    new = [{'url': 'b', 'title': '2-수정'}, {'url': 'c', 'title': '3'}]
+    
+    assert merge_items(saved, new) == [{'url': 'a', 'title': '1'}, {'url': 'b', 'title': '2-수정'}, {'url': 'c', 'title': '3'}]
+
+
+def test_merge_trend_data_without_saved_data():
+    trend_data = _trend_data([{'url': 'a'}], [], ['정부'])
+    
+    assert merge_trend_data(None, trend_data) is trend_data
+
+
+def test_merge_trend_data():
+    saved = _trend_data([{'url': 'a', 'title': '이전'}, {'url': 'b'}], [{'url': 'x'}], ['경제'])
+    new = _trend_data([{'url': 'a', 'title': '새 수집'}, {'url': 'c'}], [{'url': 'y'}], ['정부'])
+    merged = merge_trend_data(saved, new)
+    
+    assert [news['url'] for news in merged['news_trends']['news_data']] == ['a', 'b', 'c']
+    assert merged['news_trends']['news_data'][0]['title'] == '새 수집'
+    assert [blog['url'] for blog in merged['blog_trends']['all_blogs']] == ['x', 'y']
+    # 집계 결과는 새 수집 결과를 사용
+    assert merged['top_keywords'] == ['정부']
+    assert merged['news_trends']['overall'] == ['정부']
+    # 입력은 변경하지 않음
+    assert [news['url'] for news in new['news_trends']['news_data']] == ['a', 'c']
+    assert [news['url'] for news in saved['news_trends']['news_data']] == ['a', 'b']